@@ -8,3 +8,4 @@ class NewsRoomConfig(AppConfig):
 
     def ready(self):
         import news_room.signals 
+        import news_room.metrics  # counts queries on every new connection
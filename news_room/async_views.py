@@ -0,0 +1,209 @@
+"""
+Async variants of the read-heavy API and feed endpoints for ASGI servers.
+
+Mounted under ``async/`` next to the synchronous views they mirror, with
+the same response bodies, cache entries and conditional GET handling.
+Authentication follows the API's ``TokenAuthentication``.
+
+Cached responses are read and stored with the cache's async methods
+(``aget``/``aset``), so the views never make a blocking cache call on
+the event loop. Misses read through the async ORM interface. The views also
+work under WSGI, but only an ASGI server (see ``newsroom/asgi.py``) lets
+one worker interleave many of them.
+"""
+
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse, JsonResponse
+from django.views.decorators.http import require_safe
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.utils.urls import replace_query_param
+
+from .cache import aresponse_cache_key, conditional, make_etag
+from .feeds import CONTENT_TYPES, FORMATS, aget_feed, feed_key
+from .models import Article, Newsletter
+from .pagination import InvalidCursor, apaginate_keyset, clamp_page_size
+from .routers import primary_reads
+from .serializers import (
+    ArticleListSerializer, ArticleSerializer, NewsletterListSerializer, NewsletterSerializer,
+    requested_fields,
+)
+
+
+# ---------- Helpers ----------
+
+async def _token_user(request):
+    """
+    Authenticate a request the way DRF's ``TokenAuthentication`` does.
+
+    Parameters:
+        request (HttpRequest): Request with an ``Authorization: Token <key>`` header.
+
+    Returns:
+        CustomUser | None: The active token owner, or None.
+    """
+    keyword, _, key = request.headers.get('Authorization', '').partition(' ')
+    if keyword != 'Token' or not key.strip():
+        return None
+    token = await Token.objects.select_related('user').filter(key=key.strip()).afirst()
+    if token is None or not token.user.is_active:
+        return None
+    return token.user
+
+
+def _error(detail, status):
+    response = JsonResponse({'detail': detail}, status=status)
+    if status == 401:
+        response['WWW-Authenticate'] = 'Token'
+    return response
+
+
+def _is_compact(request):
+    return request.GET.get('compact', '').lower() in ('1', 'true', 'yes')
+
+
+async def _cached_list(request, queryset, serializer_class, compact_serializer_class,
+                       namespaces, per_subscriber=False, last_modified_field='created_at', sources=None):
+    """
+    Serve one keyset page like ``CachedListMixin`` does for the sync views.
+
+    Parameters:
+        request (HttpRequest): Current request.
+        queryset (Callable): Returns the unordered queryset for a user.
+        serializer_class (Serializer): Full serializer.
+        compact_serializer_class (Serializer): Serializer for ``?compact=true``.
+        namespaces (list[str]): Content namespaces the page depends on.
+        per_subscriber (bool): Whether results depend on the user's subscriptions.
+        last_modified_field (str): Field used for the ``Last-Modified`` header.
+        sources (Callable): Returns the followed sources and the field
+            naming them for a user, like ``get_keyset_sources()``.
+
+    Returns:
+        HttpResponse: JSON page, 304 Not Modified, or an error.
+    """
+    user = await _token_user(request)
+    if user is None:
+        return _error("Authentication credentials were not provided.", 401)
+    request.user = user
+    if per_subscriber:
+        namespaces = [*namespaces, f'subscriptions:{user.pk}']
+    key = await aresponse_cache_key(request, namespaces, per_user=per_subscriber)
+    entry = await cache.aget(key)
+    if entry is None:
+        with primary_reads():
+            api_request = Request(request)
+            compact = _is_compact(request)
+            fields = requested_fields(api_request)
+            rows = queryset(user).select_related('publisher', 'author')
+            if compact or (fields is not None and 'content' not in fields):
+                rows = rows.defer('content')
+            try:
+                page, next_cursor = await apaginate_keyset(
+                    rows, request.GET.get('cursor'), clamp_page_size(request.GET.get('page_size')),
+                    sources=sources(user) if sources else None,
+                )
+            except InvalidCursor:
+                return _error("Invalid cursor", 404)
+            serializer = (compact_serializer_class if compact else serializer_class)(
+                page, many=True, context={'request': api_request}
+            )
+            next_link = None
+            if next_cursor is not None:
+                next_link = replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+            data = {'next': next_link, 'results': serializer.data}
+            latest = max((getattr(item, last_modified_field) for item in page), default=None)
+            entry = {
+                'data': data,
+                'etag': make_etag(json.dumps(data, cls=DjangoJSONEncoder).encode()),
+                'last_modified': int(latest.timestamp()) if latest else None,
+            }
+        await cache.aset(key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+    response = HttpResponse(json.dumps(entry['data'], cls=DjangoJSONEncoder),
+                            content_type='application/json')
+    return conditional(request, response, entry['etag'], entry['last_modified'])
+
+
+# ---------- API Views ----------
+
+@require_safe
+async def publisher_articles_api(request):
+    """
+    Async ``PublisherArticlesAPIView``: approved articles of followed publishers.
+    """
+    return await _cached_list(
+        request,
+        lambda user: Article.objects.filter(approved=True, publisher__in=user.subscribed_publishers.all()),
+        ArticleSerializer, ArticleListSerializer, ['articles'],
+        per_subscriber=True, last_modified_field='updated_at',
+        sources=lambda user: [(user.subscribed_publishers.all(), 'publisher')],
+    )
+
+
+@require_safe
+async def journalist_articles_api(request):
+    """
+    Async ``JournalistArticlesAPIView``: approved articles of followed journalists.
+    """
+    return await _cached_list(
+        request,
+        lambda user: Article.objects.filter(approved=True, author__in=user.subscribed_journalists.all()),
+        ArticleSerializer, ArticleListSerializer, ['articles'],
+        per_subscriber=True, last_modified_field='updated_at',
+        sources=lambda user: [(user.subscribed_journalists.all(), 'author')],
+    )
+
+
+@require_safe
+async def newsletter_api(request):
+    """
+    Async ``NewsletterListAPIView``: every newsletter, newest first.
+    """
+    return await _cached_list(
+        request, lambda user: Newsletter.objects.all(),
+        NewsletterSerializer, NewsletterListSerializer, ['newsletters'],
+    )
+
+
+@require_safe
+async def article_detail_api(request, article_id):
+    """
+    Async ``ArticleDetailAPIView``: one approved article.
+
+    Parameters:
+        article_id (int): ID of the article.
+
+    Returns:
+        JsonResponse: Serialized article, or an error.
+    """
+    if await _token_user(request) is None:
+        return _error("Authentication credentials were not provided.", 401)
+    article = await Article.objects.filter(approved=True, id=article_id).select_related(
+        'publisher', 'author'
+    ).afirst()
+    if article is None:
+        return _error("No Article matches the given query.", 404)
+    return JsonResponse(ArticleSerializer(article, context={'request': Request(request)}).data)
+
+
+# ---------- Syndication Feeds ----------
+
+@require_safe
+async def feed_view(request, fmt, publisher_id=None, journalist_id=None):
+    """
+    Async ``feed_view``: the global, publisher or journalist feed.
+
+    Returns:
+        HttpResponse: Feed document or 304 Not Modified.
+    """
+    if fmt not in FORMATS:
+        raise Http404("Unknown feed format.")
+    entry = await aget_feed(feed_key(publisher_id, journalist_id), fmt)
+    if entry is None:
+        raise Http404("No such feed.")
+    response = HttpResponse(entry['content'], content_type=CONTENT_TYPES[fmt])
+    return conditional(request, response, entry['etag'], entry['last_modified'],
+                       max_age=settings.FEED_MAX_AGE)
@@ -0,0 +1,307 @@
+"""
+Helpers shared by the ``bench_*`` management commands and their tests.
+
+Provides local stand-ins for external services so throughput can be
+measured without network access or third-party accounts, query plan
+inspection so hot queries can be checked for full table scans, and an
+HTTP load generator for comparing server deployments.
+"""
+
+import asyncio
+import json
+import re
+import socketserver
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from django.db import connections
+
+
+# ---------- Timing ----------
+
+@contextmanager
+def timed():
+    """
+    Measure wall-clock time of a block.
+
+    Yields:
+        dict: Populated with ``seconds`` when the block exits.
+    """
+    result = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result['seconds'] = time.perf_counter() - start
+
+
+def percentile(values, fraction):
+    """
+    Parameters:
+        values (list[float]): Sorted samples.
+        fraction (float): E.g. ``0.99`` for the 99th percentile.
+
+    Returns:
+        float: Nearest-rank percentile, or 0 without samples.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+# ---------- Query plans ----------
+
+def _mysql_tables(plan):
+    """
+    Yield every table node of a MySQL ``EXPLAIN FORMAT=JSON`` plan.
+    """
+    if isinstance(plan, dict):
+        if isinstance(plan.get('table'), dict):
+            yield plan['table']
+        for value in plan.values():
+            yield from _mysql_tables(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _mysql_tables(value)
+
+
+def full_table_scans(queryset):
+    """
+    List the tables a query reads with a full table scan.
+
+    Ordered scans of an index (SQLite ``SCAN t USING INDEX``) are not
+    counted, since paginated queries stop after the first rows.
+
+    Parameters:
+        queryset (QuerySet): Query to explain on its own database.
+
+    Returns:
+        list[str]: Table names or aliases scanned in full, in plan order.
+    """
+    vendor = connections[queryset.db].vendor
+    if vendor == 'mysql':
+        plan = json.loads(queryset.explain(format='json'))
+        return [table['table_name'] for table in _mysql_tables(plan)
+                if table.get('access_type') == 'ALL']
+    plan = queryset.explain()
+    if vendor == 'postgresql':
+        return re.findall(r'Seq Scan on (\w+)', plan)
+    return [match.group(1) for match in re.finditer(r'\bSCAN (\w+)(.*)', plan)
+            if 'USING' not in match.group(2)]
+
+
+# ---------- Local SMTP stand-in ----------
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """
+    Speaks just enough SMTP for Django's backend and discards message data.
+    """
+
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.sessions += 1
+        self._reply('220 localhost SMTP sink')
+        accepted = []
+        in_data = False
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            if in_data:
+                if line.rstrip(b'\r\n') == b'.':
+                    in_data = False
+                    with server.lock:
+                        server.messages += 1
+                        server.recipients.extend(accepted)
+                    accepted = []
+                    self._reply('250 OK')
+                continue
+
+            command = line.strip().decode(errors='replace')
+            verb = command[:4].upper()
+            if verb == 'EHLO':
+                self._reply('250-localhost')
+                self._reply('250 SIZE 33554432')
+            elif verb == 'HELO':
+                self._reply('250 localhost')
+            elif verb == 'MAIL':
+                accepted = []
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                address = command.partition(':')[2].strip().strip('<>')
+                if address in server.reject:
+                    self._reply('550 Mailbox unavailable')
+                else:
+                    accepted.append(address)
+                    self._reply('250 OK')
+            elif verb == 'DATA':
+                in_data = True
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                break
+            else:  # RSET, NOOP and anything else
+                accepted = [] if verb == 'RSET' else accepted
+                self._reply('250 OK')
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    In-process SMTP server that counts sessions, messages and recipients.
+
+    Attributes:
+        sessions (int): Number of SMTP connections opened by clients.
+        messages (int): Number of messages accepted.
+        recipients (list[str]): Every accepted recipient, in order.
+        reject (set[str]): Addresses answered with a permanent 550 error.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, reject=()):
+        super().__init__(('127.0.0.1', 0), _SMTPSinkHandler)
+        self.lock = threading.Lock()
+        self.sessions = 0
+        self.messages = 0
+        self.recipients = []
+        self.reject = set(reject)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+        return False
+
+    def connection(self):
+        """
+        Build a Django SMTP backend pointed at this server.
+
+        Returns:
+            EmailBackend: A closed SMTP backend without TLS or auth.
+        """
+        from django.core.mail import get_connection
+        return get_connection(
+            'django.core.mail.backends.smtp.EmailBackend',
+            host='127.0.0.1', port=self.port, username='', password='',
+            use_tls=False, use_ssl=False, fail_silently=False,
+        )
+
+
+# ---------- HTTP load ----------
+
+async def _exchange(reader, writer, request):
+    """
+    Send one HTTP/1.1 request and read the whole response.
+
+    Returns:
+        tuple[int, bool]: Status code and whether the server closes the connection.
+    """
+    writer.write(request)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed by server")
+    status = int(status_line.split()[1])
+    length, chunked, close = None, False, False
+    while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        name, value = name.strip().lower(), value.strip().lower()
+        if name == 'content-length':
+            length = int(value)
+        elif name == 'transfer-encoding':
+            chunked = 'chunked' in value
+        elif name == 'connection':
+            close = value == 'close'
+    if chunked:
+        while size := int((await reader.readline()).split(b';')[0], 16):
+            await reader.readexactly(size + 2)
+        await reader.readline()
+    elif length is not None:
+        await reader.readexactly(length)
+    elif status not in (204, 304):
+        await reader.read()
+        close = True
+    return status, close
+
+
+async def _load(url, clients, requests, headers, timeout):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    lines = [f'GET {path} HTTP/1.1', f'Host: {parts.netloc}', 'Accept: */*']
+    lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+    request = ('\r\n'.join(lines) + '\r\n\r\n').encode()
+    remaining = [requests]
+    latencies, errors = [], []
+
+    async def client():
+        reader = writer = None
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            start = time.perf_counter()
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(host, port)
+                status, close = await asyncio.wait_for(_exchange(reader, writer, request), timeout)
+            except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                errors.append(type(e).__name__)
+                close, status = True, None
+            else:
+                if status < 400:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors.append(f'HTTP {status}')
+            if close and writer is not None:
+                writer.close()
+                writer = None
+        if writer is not None:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def run_load(url, clients, requests, headers=None, timeout=30):
+    """
+    Issue GET requests from many concurrent keep-alive clients.
+
+    Each client holds one connection (reopened if the server closes it)
+    and sends its next request as soon as the previous response arrives,
+    until ``requests`` responses have been received in total.
+
+    Parameters:
+        url (str): ``http://`` URL to request.
+        clients (int): Concurrent connections.
+        requests (int): Total requests across all clients.
+        headers (dict): Extra request headers, e.g. ``Authorization``.
+        timeout (float): Seconds before a request counts as failed.
+
+    Returns:
+        dict: ``ok`` and ``errors`` counts, wall-clock ``seconds``, ``rps``
+        (successful responses per second) and sorted ``latencies`` in seconds.
+    """
+    latencies, errors, seconds = asyncio.run(_load(url, clients, requests, headers, timeout))
+    latencies.sort()
+    return {
+        'ok': len(latencies),
+        'errors': len(errors),
+        'seconds': seconds,
+        'rps': len(latencies) / seconds if seconds else 0.0,
+        'latencies': latencies,
+    }
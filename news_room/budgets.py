@@ -0,0 +1,223 @@
+"""
+Performance budgets for every route of the app.
+
+``measure_endpoints`` requests each route in ``news_room.urls`` through
+the test client against the current database and records its query
+count, wall time and peak Python memory. ``check_budgets`` compares the
+results with the limits committed in ``perf_budgets.json`` for a dataset
+size (see ``news_room.seeding.SIZES``), so a page that gets slower or
+starts issuing more queries fails ``manage.py bench_endpoints`` and the
+test suite instead of surfacing in production.
+
+Every request runs with an empty cache inside a transaction that is
+rolled back, so results reflect a cold page and routes that write on
+GET leave the dataset unchanged.
+"""
+
+import json
+import math
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.urls import URLPattern, reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from rest_framework.authtoken.models import Token
+
+from . import urls
+from .models import Article, CustomUser, Newsletter, Publisher
+from .review import review_queue
+
+
+BUDGETS_FILE = Path(__file__).with_name('perf_budgets.json')
+
+# Who requests each route; unlisted routes are requested by the reader.
+ROUTE_ROLES = {
+    'register': None, 'login': None, 'metrics': None, 'password_reset': None,
+    'password_reset_done': None, 'password_reset_confirm': None, 'password_reset_complete': None,
+    'feed': None, 'publisher_feed': None, 'journalist_feed': None,
+    'async_feed': None, 'async_publisher_feed': None, 'async_journalist_feed': None,
+    'create_article': 'journalist', 'edit_article': 'journalist', 'journalist_feedback': 'journalist',
+    'create_newsletter': 'journalist', 'my_newsletters': 'journalist', 'article_import_api': 'journalist',
+    'review_articles': 'editor', 'claim_articles': 'editor', 'moderate_articles': 'editor',
+    'approve_article': 'editor', 'request_revision': 'editor', 'create_publisher': 'editor',
+    'article_moderation_api': 'editor',
+}
+
+# Fixture values used for a route's URL arguments instead of the defaults.
+ROUTE_ARGUMENTS = {
+    'edit_article': {'article_id': 'revision_article_id'},
+    'approve_article': {'article_id': 'pending_article_id'},
+    'request_revision': {'article_id': 'pending_article_id'},
+}
+
+# Query strings sent to routes, as fixture keys per parameter.
+ROUTE_QUERIES = {
+    'search': {'q': 'search_term'},
+}
+
+# Limits written by ``budgets_from``: measured value times the factor plus the slack.
+HEADROOM = {'queries': (1, 0), 'ms': (5, 50), 'peak_kb': (1.5, 64)}
+
+
+def budget_fixture():
+    """
+    Pick the heaviest users and objects of the current dataset.
+
+    The busiest journalist, most followed publisher and reader with the
+    most subscriptions sit at the head of the seeded power law, so their
+    pages are the most expensive ones to render.
+
+    Returns:
+        dict: Users per role and the values filled into URL arguments.
+    """
+    journalist = CustomUser.objects.filter(role='journalist').order_by('-article_count', 'id').first()
+    reader = CustomUser.objects.filter(role='reader').annotate(
+        follows=Count('subscribed_publishers', distinct=True) + Count('subscribed_journalists', distinct=True)
+    ).order_by('-follows', 'id').first()
+    editor = CustomUser.objects.filter(role='editor', editor_publishers__isnull=False).order_by('id').first()
+    own = Article.objects.filter(author=journalist).order_by('-id')
+    article = own.filter(approved=True).first()
+    return {
+        'users': {'reader': reader, 'journalist': journalist, 'editor': editor},
+        'article_id': article.id,
+        'revision_article_id': (own.filter(needs_revision=True).first() or article).id,
+        'pending_article_id': (review_queue(editor).order_by('-id').first() or article).id,
+        'publisher_id': Publisher.objects.order_by('-subscriber_count', 'id').values_list('id', flat=True)[0],
+        'journalist_id': journalist.id,
+        'newsletter_id': Newsletter.objects.order_by('-id').values_list('id', flat=True)[0],
+        'fmt': 'rss',
+        'uidb64': urlsafe_base64_encode(force_bytes(reader.pk)),
+        'token': default_token_generator.make_token(reader),
+        'search_term': article.title.split()[0],
+    }
+
+
+def routes(fixture):
+    """
+    Build a request for every named route in ``news_room.urls``.
+
+    Returns:
+        list[tuple[str, str | None, str, dict]]: Route name, role, URL and
+        query parameters.
+    """
+    requests = []
+    for pattern in urls.urlpatterns:
+        if not isinstance(pattern, URLPattern) or not pattern.name:
+            continue
+        sources = ROUTE_ARGUMENTS.get(pattern.name, {})
+        kwargs = {name: fixture[sources.get(name, name)] for name in pattern.pattern.converters}
+        query = {param: fixture[key] for param, key in ROUTE_QUERIES.get(pattern.name, {}).items()}
+        requests.append((pattern.name, ROUTE_ROLES.get(pattern.name, 'reader'),
+                         reverse(pattern.name, kwargs=kwargs), query))
+    return requests
+
+
+def _request(fixture, role, url, query):
+    """
+    Issue one GET with an empty cache and roll back its writes.
+
+    Returns:
+        tuple[HttpResponse, int, float]: The response, the queries it ran
+        and its duration in seconds.
+    """
+    cache.clear()
+    client = Client(raise_request_exception=False)
+    headers = {}
+    user = fixture['users'].get(role)
+    with transaction.atomic():
+        if user is not None:
+            client.force_login(user)
+            headers['HTTP_AUTHORIZATION'] = f'Token {Token.objects.get_or_create(user=user)[0].key}'
+        queries = []
+        with connection.execute_wrapper(lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+            start = time.perf_counter()
+            response = client.get(url, query, **headers)
+            seconds = time.perf_counter() - start
+        transaction.set_rollback(True)
+    return response, len(queries), seconds
+
+
+def measure_endpoints(fixture=None, repeat=3):
+    """
+    Measure every route of the app against the current database.
+
+    Wall time is the fastest of ``repeat`` requests; peak memory is taken
+    from a separate request under ``tracemalloc``, which slows execution.
+
+    Parameters:
+        fixture (dict): Result of ``budget_fixture()``, computed if omitted.
+        repeat (int): Timed requests per route.
+
+    Returns:
+        dict[str, dict]: Per route name, the response ``status``, ``queries``,
+        ``ms`` and ``peak_kb``.
+    """
+    fixture = fixture or budget_fixture()
+    results = {}
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+        for name, role, url, query in routes(fixture):
+            response, count, _ = _request(fixture, role, url, query)
+            seconds = min(_request(fixture, role, url, query)[2] for _ in range(repeat))
+            tracemalloc.start()
+            try:
+                _request(fixture, role, url, query)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            results[name] = {'status': response.status_code, 'queries': count,
+                             'ms': round(seconds * 1000, 1), 'peak_kb': round(peak / 1024)}
+    return results
+
+
+def load_budgets(path=BUDGETS_FILE):
+    """
+    Returns:
+        dict[str, dict]: Limits per dataset size and route, or {} without a file.
+    """
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def budgets_from(results):
+    """
+    Turn measurements into limits with ``HEADROOM`` applied.
+
+    Returns:
+        dict[str, dict]: ``queries``, ``ms`` and ``peak_kb`` limits per route.
+    """
+    return {
+        name: {metric: math.ceil(result[metric] * factor + slack)
+               for metric, (factor, slack) in HEADROOM.items()}
+        for name, result in sorted(results.items())
+    }
+
+
+def check_budgets(results, budgets):
+    """
+    Compare measurements with limits.
+
+    Parameters:
+        results (dict): Result of ``measure_endpoints()``.
+        budgets (dict): Limits per route for one dataset size.
+
+    Returns:
+        list[str]: One message per exceeded limit or route without a budget.
+    """
+    violations = []
+    for name, result in results.items():
+        limits = budgets.get(name)
+        if limits is None:
+            violations.append(f"{name}: no budget")
+            continue
+        for metric, limit in limits.items():
+            if result[metric] > limit:
+                violations.append(f"{name}: {metric} {result[metric]} exceeds budget {limit}")
+    return violations
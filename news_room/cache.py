@@ -0,0 +1,208 @@
+"""
+Namespaced cache versions for rendered pages and API responses.
+
+Cached entries embed the current version of their namespace in the key.
+Signals bump the version when underlying data changes, which orphans every
+stale entry at once without tracking individual keys. Cached responses
+carry ``ETag`` and ``Last-Modified`` validators so repeat requests can be
+answered with 304 Not Modified. Misses are rendered from the primary
+database (see ``news_room.routers.primary_reads``) so a lagging replica
+cannot store old rows under a new version.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .routers import primary_reads
+
+
+def _version_key(namespace):
+    return f'version:{namespace}'
+
+
+def get_version(namespace):
+    """
+    Return the current version of a namespace, initialising it if needed.
+
+    New versions start from the current time in milliseconds so a version
+    lost to eviction can never be reissued for old cached entries.
+
+    Parameters:
+        namespace (str): Cache namespace, e.g. ``'directory'``.
+
+    Returns:
+        int: Current version number.
+    """
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(namespace):
+    """
+    Async version of ``get_version``.
+    """
+    key = _version_key(namespace)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, int(time.time() * 1000), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_version(namespace):
+    """
+    Invalidate everything cached under a namespace.
+
+    Parameters:
+        namespace (str): Cache namespace to invalidate.
+    """
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        get_version(namespace)
+
+
+def invalidate(*namespaces):
+    """
+    Bump namespaces now and again once the current transaction commits.
+
+    The second bump discards entries that a concurrent request cached from
+    data read before the commit became visible.
+
+    Parameters:
+        *namespaces (str): Cache namespaces to invalidate.
+    """
+    for namespace in namespaces:
+        bump_version(namespace)
+    transaction.on_commit(lambda: [bump_version(namespace) for namespace in namespaces])
+
+
+def versioned_key(namespace, *parts):
+    """
+    Build a cache key tied to the current version of a namespace.
+
+    Parameters:
+        namespace (str): Cache namespace.
+        *parts: Additional key components, e.g. a page number.
+
+    Returns:
+        str: Cache key.
+    """
+    suffix = ':'.join(str(part) for part in parts)
+    return f'{namespace}:{get_version(namespace)}:{suffix}'
+
+
+# ---------- Conditional Responses ----------
+
+def _response_key(request, versions, per_user):
+    versions = '.'.join(str(version) for version in versions)
+    user_part = ''
+    if per_user:
+        csrf = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+        user_part = f'{request.user.pk}:{hashlib.md5(csrf.encode()).hexdigest()}'
+    return f'response:{versions}:{user_part}:{request.get_full_path()}'
+
+
+def response_cache_key(request, namespaces, per_user=True):
+    """
+    Build a cache key for a response to the current request.
+
+    The key combines the versions of every namespace the response depends
+    on with the full path. Per-user keys also include the user id and a
+    digest of the CSRF cookie, because rendered forms embed a CSRF token
+    tied to that cookie.
+
+    Parameters:
+        request (HttpRequest): Current request.
+        namespaces (Iterable[str]): Namespaces the response depends on.
+        per_user (bool): Whether the response differs between users.
+
+    Returns:
+        str: Cache key.
+    """
+    return _response_key(request, [get_version(namespace) for namespace in namespaces], per_user)
+
+
+async def aresponse_cache_key(request, namespaces, per_user=True):
+    """
+    Async version of ``response_cache_key``.
+    """
+    return _response_key(request, [await aget_version(namespace) for namespace in namespaces], per_user)
+
+
+def make_etag(content):
+    """
+    Returns:
+        str: Quoted strong ETag for a bytes payload.
+    """
+    return f'"{hashlib.md5(content).hexdigest()}"'
+
+
+def conditional(request, response, etag, last_modified, max_age=None):
+    """
+    Attach validators to a response and short-circuit to 304 when possible.
+
+    Parameters:
+        request (HttpRequest): Current request with conditional headers.
+        response (HttpResponseBase): Full response to send otherwise.
+        etag (str): Quoted ETag of the response body.
+        last_modified (int | None): Unix timestamp of the newest content.
+        max_age (int | None): Mark the response public and fresh for this
+            many seconds; by default it is private and always revalidated.
+
+    Returns:
+        HttpResponseBase: ``response`` or a 304 Not Modified response.
+    """
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    if max_age is None:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(response, public=True, max_age=max_age)
+    return get_conditional_response(
+        request, etag=etag, last_modified=last_modified, response=response
+    )
+
+
+def cached_page(request, namespaces, build, timeout=None):
+    """
+    Serve a rendered page from the cache, rendering it on a miss.
+
+    Parameters:
+        request (HttpRequest): Current request.
+        namespaces (Iterable[str]): Namespaces the page depends on.
+        build (Callable): Returns ``(HttpResponse, last_modified)`` where
+            ``last_modified`` is a datetime or None.
+        timeout (int): Cache timeout, defaults to ``RESPONSE_CACHE_TIMEOUT``.
+
+    Returns:
+        HttpResponseBase: Cached page, fresh page, or 304 Not Modified.
+    """
+    key = response_cache_key(request, namespaces)
+    entry = cache.get(key)
+    if entry is None:
+        with primary_reads():
+            response, last_modified = build()
+        if response.status_code != 200:
+            return response
+        entry = {
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'etag': make_etag(response.content),
+            'last_modified': int(last_modified.timestamp()) if last_modified else None,
+        }
+        cache.set(key, entry, timeout or settings.RESPONSE_CACHE_TIMEOUT)
+    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    return conditional(request, response, entry['etag'], entry['last_modified'])
@@ -0,0 +1,164 @@
+"""
+Denormalized relation counters.
+
+``Publisher.subscriber_count`` and ``journalist_count`` and
+``CustomUser.subscriber_count`` and ``article_count`` mirror ``COUNT(*)``
+over many-to-many through tables, so listings read a column instead of
+counting per row.
+
+Receivers in ``news_room.signals`` keep the counters current with
+``F()`` updates, which stay correct under concurrent writers. Code that
+writes through rows without the related managers calls ``adjust``
+itself. ``manage.py recount`` repairs drift, e.g. after raw SQL or a
+race between two identical subscriptions.
+"""
+
+from collections import defaultdict, namedtuple
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import CustomUser, Publisher
+
+
+Counter = namedtuple('Counter', ['field', 'side', 'name'])
+Counter.__doc__ = """
+A counter column tracking one many-to-many relation.
+
+Attributes:
+    field (ManyToManyField): The counted relation.
+    side (str): ``'source'`` if the counter lives on the model declaring
+        the field, ``'target'`` if it lives on the related model.
+    name (str): Counter column name.
+"""
+
+COUNTERS = [
+    Counter(CustomUser._meta.get_field('subscribed_publishers'), 'target', 'subscriber_count'),
+    Counter(CustomUser._meta.get_field('subscribed_journalists'), 'target', 'subscriber_count'),
+    Counter(CustomUser._meta.get_field('published_articles'), 'source', 'article_count'),
+    Counter(Publisher._meta.get_field('journalists'), 'source', 'journalist_count'),
+]
+
+
+def _model(counter, side):
+    return counter.field.model if side == 'source' else counter.field.related_model
+
+
+def _column(counter, side):
+    """
+    Returns:
+        str: Through-table field pointing at the given side.
+    """
+    return counter.field.m2m_field_name() if side == 'source' else counter.field.m2m_reverse_field_name()
+
+
+def counters_for(through):
+    """
+    Returns:
+        list[Counter]: Counters maintained for a through model.
+    """
+    return [counter for counter in COUNTERS if counter.field.remote_field.through is through]
+
+
+def adjust(model, name, deltas):
+    """
+    Add to counters with one ``F()`` UPDATE per distinct delta.
+
+    Parameters:
+        model (Model): Model holding the counter.
+        name (str): Counter column.
+        deltas (dict[int, int]): Change per primary key.
+    """
+    by_delta = defaultdict(list)
+    for pk, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(pk)
+    for delta, pks in by_delta.items():
+        model.objects.filter(pk__in=pks).update(**{name: F(name) + delta})
+
+
+def track(counter, instance, action, reverse, pk_set):
+    """
+    Apply an ``m2m_changed`` event to a counter.
+
+    Removals are checked against the through table first, because the
+    related manager reports every id passed to ``remove()``, linked or not.
+
+    Parameters:
+        counter (Counter): Counter of the changed relation.
+        instance (Model): Object whose relation changed.
+        action (str): ``m2m_changed`` action.
+        reverse (bool): True if ``instance`` is on the target side.
+        pk_set (set[int] | None): Ids added or removed.
+    """
+    instance_side, other_side = ('target', 'source') if reverse else ('source', 'target')
+    through = counter.field.remote_field.through
+    stash = f'_linked_before_{counter.field.name}'
+    if action in ('pre_remove', 'pre_clear'):
+        linked = through.objects.filter(**{_column(counter, instance_side): instance.pk})
+        if action == 'pre_remove':
+            linked = linked.filter(**{f'{_column(counter, other_side)}__in': pk_set})
+        setattr(instance, stash, set(linked.values_list(_column(counter, other_side), flat=True)))
+        return
+    if action == 'post_add':
+        ids, delta = pk_set, 1
+    elif action in ('post_remove', 'post_clear'):
+        ids, delta = instance.__dict__.pop(stash, set()), -1
+    else:
+        return
+    if not ids:
+        return
+    model = _model(counter, counter.side)
+    if counter.side == instance_side:
+        adjust(model, counter.name, {instance.pk: delta * len(ids)})
+    else:
+        adjust(model, counter.name, dict.fromkeys(ids, delta))
+
+
+def forget(instance):
+    """
+    Decrement counters of objects linked to an instance about to be deleted.
+
+    Deletion cascades through-table rows without ``m2m_changed``.
+
+    Parameters:
+        instance (Model): Object being deleted.
+    """
+    for counter in COUNTERS:
+        for side, other_side in (('source', 'target'), ('target', 'source')):
+            if counter.side != other_side or not isinstance(instance, _model(counter, side)):
+                continue
+            through = counter.field.remote_field.through
+            ids = through.objects.filter(**{_column(counter, side): instance.pk}).values_list(
+                _column(counter, other_side), flat=True
+            )
+            adjust(_model(counter, other_side), counter.name, dict.fromkeys(ids, -1))
+
+
+def _actual(counter):
+    """
+    Returns:
+        Coalesce: Correlated ``COUNT(*)`` of a counter's through rows.
+    """
+    column = _column(counter, counter.side)
+    counts = counter.field.remote_field.through.objects.filter(**{column: OuterRef('pk')}).values(
+        column
+    ).annotate(n=Count('*')).values('n')
+    return Coalesce(Subquery(counts), 0)
+
+
+def recount():
+    """
+    Recompute every counter from the through tables.
+
+    Returns:
+        dict[str, int]: Rows corrected per ``Model.counter``.
+    """
+    corrected = {}
+    for counter in COUNTERS:
+        model = _model(counter, counter.side)
+        drifted = model.objects.annotate(actual=_actual(counter)).exclude(**{counter.name: F('actual')})
+        corrected[f'{model.__name__}.{counter.name}'] = drifted.count()
+        if corrected[f'{model.__name__}.{counter.name}']:
+            model.objects.update(**{counter.name: _actual(counter)})
+    return corrected
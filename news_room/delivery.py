@@ -0,0 +1,122 @@
+"""
+Email delivery engine for subscriber notifications.
+
+Sends one message per recipient (or per small BCC chunk) over a single
+reused backend connection, paced by an optional rate limit, and reports
+an outcome for every recipient so callers can record and retry them.
+"""
+
+import smtplib
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+
+DeliveryResult = namedtuple('DeliveryResult', ['email', 'status', 'error'])
+
+
+def chunked(iterable, size):
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    Parameters:
+        iterable (Iterable): Items to split.
+        size (int): Maximum chunk length.
+
+    Yields:
+        list: Consecutive chunks of the input.
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _classify(error):
+    """
+    Decide whether a send error is permanent for the recipients involved.
+
+    Returns:
+        str: 'rejected' for 5xx refusals, 'failed' for anything retryable.
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        if codes and all(500 <= code < 600 for code in codes):
+            return 'rejected'
+    return 'failed'
+
+
+def send_bulk(subject, body, recipients, from_email=None, connection=None,
+              chunk_size=None, rate_limit=None):
+    """
+    Send the same message to many recipients over one connection.
+
+    With a chunk size of 1 each recipient gets an individual message so
+    addresses are never exposed to each other; larger chunks put the
+    recipients in BCC. A rejected chunk does not stop the remaining ones;
+    if the server cannot be reconnected, the remaining recipients are
+    reported as failed.
+
+    Parameters:
+        subject (str): Message subject.
+        body (str): Plain-text message body.
+        recipients (Iterable[str]): Email addresses, consumed lazily.
+        from_email (str): Sender address, defaults to DEFAULT_FROM_EMAIL.
+        connection: Open or closed email backend to reuse.
+        chunk_size (int): Recipients per message, defaults to EMAIL_CHUNK_SIZE.
+        rate_limit (float): Maximum messages per second, 0 for unlimited.
+
+    Yields:
+        DeliveryResult: One result per recipient, in send order.
+    """
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+    chunk_size = chunk_size or settings.EMAIL_CHUNK_SIZE
+    rate_limit = settings.EMAIL_RATE_LIMIT if rate_limit is None else rate_limit
+    interval = 1.0 / rate_limit if rate_limit else 0
+    connection = connection or get_connection(fail_silently=False)
+
+    next_send = time.monotonic()
+    chunks = chunked(recipients, chunk_size)
+    with connection:
+        for chunk in chunks:
+            if interval:
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_send = max(next_send, time.monotonic()) + interval
+
+            if len(chunk) == 1:
+                message = EmailMessage(subject, body, from_email, to=chunk, connection=connection)
+            else:
+                message = EmailMessage(subject, body, from_email, bcc=chunk, connection=connection)
+
+            try:
+                connection.send_messages([message])
+            except (smtplib.SMTPException, OSError) as e:
+                status = _classify(e)
+                for email in chunk:
+                    yield DeliveryResult(email, status, f"{type(e).__name__}: {e}")
+                # SMTPException subclasses OSError; only a dropped session or
+                # a socket error needs a reconnect, refusals keep the session.
+                if (isinstance(e, smtplib.SMTPServerDisconnected)
+                        or not isinstance(e, smtplib.SMTPException)):
+                    try:
+                        connection.close()
+                        connection.open()
+                    except (smtplib.SMTPException, OSError) as e:
+                        # The server stays unreachable: fail the rest so
+                        # the caller records them and retries later.
+                        error = f"{type(e).__name__}: {e}"
+                        for rest in chunks:
+                            for email in rest:
+                                yield DeliveryResult(email, 'failed', error)
+                        return
+            else:
+                for email in chunk:
+                    yield DeliveryResult(email, 'sent', '')
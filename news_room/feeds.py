@@ -0,0 +1,259 @@
+"""
+Pre-rendered RSS and Atom feeds of approved articles.
+
+There is a global feed and one feed per publisher and per journalist.
+Documents are rendered by the ``feed_render`` outbox handler when an
+article gains or loses approval and stored in ``RenderedFeed``, so
+serving a poll never queries articles unless the feed was never stored;
+polls render such feeds in memory and never write. The stored document, its ETag and
+render time are cached, and the feed views answer repeat polls with
+304 Not Modified.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+
+from .cache import make_etag
+from .models import Article, CustomUser, Publisher, RenderedFeed
+
+
+FORMATS = {
+    'rss': Rss201rev2Feed,
+    'atom': Atom1Feed,
+}
+
+CONTENT_TYPES = {
+    'rss': 'application/rss+xml; charset=utf-8',
+    'atom': 'application/atom+xml; charset=utf-8',
+}
+
+GLOBAL_FEED = 'all'
+
+
+def feed_key(publisher_id=None, journalist_id=None):
+    """
+    Name the feed of a publisher, a journalist, or the whole site.
+
+    Returns:
+        str: ``'all'``, ``'publisher:<id>'`` or ``'journalist:<id>'``.
+    """
+    if publisher_id is not None:
+        return f'publisher:{publisher_id}'
+    if journalist_id is not None:
+        return f'journalist:{journalist_id}'
+    return GLOBAL_FEED
+
+
+def feed_keys(pairs):
+    """
+    List the feeds that show articles by the given sources.
+
+    Parameters:
+        pairs (Iterable[tuple[int, int]]): (publisher id, author id) per article.
+
+    Returns:
+        list[str]: Affected feed keys, the global feed first.
+    """
+    keys = {GLOBAL_FEED}
+    for publisher_id, author_id in pairs:
+        keys.add(feed_key(publisher_id=publisher_id))
+        keys.add(feed_key(journalist_id=author_id))
+    return sorted(keys, key=lambda key: (key != GLOBAL_FEED, key))
+
+
+def _source(key):
+    """
+    Resolve a feed key to its title, page path and article filter.
+
+    Returns:
+        tuple[str, str, dict] | None: None if the publisher or journalist
+        does not exist.
+    """
+    if key == GLOBAL_FEED:
+        return "NewsRoom", reverse('article_list'), {}
+    kind, _, pk = key.partition(':')
+    if kind == 'publisher':
+        publisher = Publisher.objects.filter(pk=pk).only('name').first()
+        if publisher is not None:
+            return f"NewsRoom: {publisher.name}", reverse('directory'), {'publisher_id': publisher.pk}
+    elif kind == 'journalist':
+        journalist = CustomUser.objects.filter(pk=pk, role='journalist').only('username').first()
+        if journalist is not None:
+            return f"NewsRoom: {journalist.username}", reverse('directory'), {'author_id': journalist.pk}
+    return None
+
+
+def _feed_url(key, fmt):
+    if key == GLOBAL_FEED:
+        return reverse('feed', args=[fmt])
+    kind, _, pk = key.partition(':')
+    return reverse(f'{kind}_feed', args=[pk, fmt])
+
+
+def render_feed(key, fmt, source=None):
+    """
+    Render one feed document from the newest approved articles.
+
+    Parameters:
+        key (str): Feed key, see ``feed_key``.
+        fmt (str): ``'rss'`` or ``'atom'``.
+        source (tuple): The key's ``_source``, if already resolved.
+
+    Returns:
+        str | None: The XML document, or None if the source no longer exists.
+    """
+    source = source or _source(key)
+    if source is None:
+        return None
+    title, path, filters = source
+    articles = Article.objects.filter(approved=True, **filters).select_related(
+        'author', 'publisher'
+    ).only(
+        'id', 'title', 'description', 'created_at', 'updated_at', 'author__username', 'publisher__name'
+    ).order_by('-created_at', '-id')[:settings.FEED_ITEMS]
+
+    feed = FORMATS[fmt](
+        title=title,
+        link=settings.SITE_URL + path,
+        description=f"Latest approved articles from {title}.",
+        language=settings.LANGUAGE_CODE,
+        feed_url=settings.SITE_URL + _feed_url(key, fmt),
+    )
+    for article in articles:
+        link = settings.SITE_URL + reverse('view_article', args=[article.id])
+        feed.add_item(
+            title=article.title,
+            link=link,
+            description=article.description,
+            unique_id=link,
+            pubdate=article.created_at,
+            updateddate=article.updated_at,
+            author_name=article.author.username,
+            categories=[article.publisher.name],
+        )
+    return feed.writeString('utf-8')
+
+
+def _cache_key(key, fmt):
+    return f'feed:{key}:{fmt}'
+
+
+def _entry(feed):
+    """
+    Returns:
+        dict: Cached form of a stored feed.
+    """
+    return {
+        'content': feed.content.encode('utf-8'),
+        'etag': feed.etag,
+        'last_modified': int(feed.rendered_at.timestamp()),
+    }
+
+
+def refresh(keys):
+    """
+    Render and store every format of the given feeds.
+
+    Feeds whose source was deleted are discarded. The cache is updated
+    once the current transaction commits.
+
+    Parameters:
+        keys (Iterable[str]): Feed keys to render.
+    """
+    for key in keys:
+        source = _source(key)
+        if source is None:
+            discard(key)
+            continue
+        for fmt in FORMATS:
+            content = render_feed(key, fmt, source)
+            feed, _ = RenderedFeed.objects.update_or_create(key=key, format=fmt, defaults={
+                'content': content,
+                'etag': make_etag(content.encode('utf-8')),
+                'rendered_at': timezone.now(),
+            })
+            entry = _entry(feed)
+            transaction.on_commit(
+                lambda key=key, fmt=fmt, entry=entry: cache.set(
+                    _cache_key(key, fmt), entry, settings.FEED_CACHE_TIMEOUT
+                )
+            )
+
+
+def discard(key):
+    """
+    Drop the stored documents of a feed whose source was deleted.
+
+    Parameters:
+        key (str): Feed key.
+    """
+    RenderedFeed.objects.filter(key=key).delete()
+    cache.delete_many([_cache_key(key, fmt) for fmt in FORMATS])
+
+
+def get_feed(key, fmt):
+    """
+    Load a feed document, rendering it in memory if it was never stored.
+
+    Polls never write: storing documents is left to the ``feed_render``
+    outbox handler, so polling made-up ids or feeds nobody has published
+    to cannot turn into a database write per request.
+
+    Parameters:
+        key (str): Feed key.
+        fmt (str): ``'rss'`` or ``'atom'``.
+
+    Returns:
+        dict | None: ``content`` bytes, ``etag`` and ``last_modified``
+        timestamp, or None if the source does not exist.
+    """
+    entry = cache.get(_cache_key(key, fmt))
+    if entry is not None:
+        return entry
+    feed = RenderedFeed.objects.filter(key=key, format=fmt).first()
+    if feed is not None:
+        entry = _entry(feed)
+    else:
+        content = render_feed(key, fmt)
+        if content is None:
+            return None
+        content = content.encode('utf-8')
+        entry = {
+            'content': content,
+            'etag': make_etag(content),
+            'last_modified': int(timezone.now().timestamp()),
+        }
+    # add() so an entry the outbox handler stored meanwhile is not
+    # replaced by one read before its commit.
+    cache.add(_cache_key(key, fmt), entry, settings.FEED_CACHE_TIMEOUT)
+    return entry
+
+
+async def aget_feed(key, fmt):
+    """
+    Async version of ``get_feed``.
+
+    Cache hits are read with ``cache.aget``; only a miss, which loads or
+    renders the stored document, runs ``get_feed`` in a worker thread.
+    """
+    entry = await cache.aget(_cache_key(key, fmt))
+    if entry is not None:
+        return entry
+    return await sync_to_async(get_feed)(key, fmt)
+
+
+def all_feed_keys():
+    """
+    Returns:
+        Iterator[str]: The global feed and every publisher and journalist feed.
+    """
+    yield GLOBAL_FEED
+    for pk in Publisher.objects.order_by('pk').values_list('pk', flat=True):
+        yield feed_key(publisher_id=pk)
+    for pk in CustomUser.objects.filter(role='journalist').order_by('pk').values_list('pk', flat=True):
+        yield feed_key(journalist_id=pk)
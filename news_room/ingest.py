@@ -0,0 +1,251 @@
+"""
+Bulk article ingest from newline-delimited JSON (NDJSON).
+
+Each input line is one article object::
+
+    {"title": "...", "description": "...", "content": "...",
+     "publisher": "Daily Planet", "author": "clark"}
+
+``publisher`` may be a name or ``publisher_id`` an id; ``author`` is a
+journalist's username or ``author_id`` an id. Lines are validated in
+batches, publishers and authors are resolved with one query per batch,
+and articles plus their ``published_articles`` rows are inserted with
+``bulk_create``; authors' ``article_count`` is bumped once per batch.
+Imported articles await editor review like articles submitted through
+``create_article_view``.
+"""
+
+import json
+import time
+import uuid
+from collections import Counter, namedtuple
+
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import Q
+
+from .cache import invalidate
+from .counters import adjust
+from .models import Article, CustomUser, Publisher
+
+
+ImportSummary = namedtuple('ImportSummary', ['created', 'rejected', 'rejected_count', 'seconds'])
+ImportSummary.__doc__ = """
+Outcome of an import.
+
+Attributes:
+    created (int): Articles inserted.
+    rejected (list[dict]): ``{'line': n, 'error': message}`` for the first
+        skipped lines, at most ``max_rejections`` of them.
+    rejected_count (int): All skipped lines.
+    seconds (float): Wall-clock duration.
+"""
+
+ArticleThrough = CustomUser.published_articles.through
+
+
+def iter_ndjson(lines):
+    """
+    Parse NDJSON lines, skipping blank ones.
+
+    Parameters:
+        lines (Iterable[bytes | str]): Raw input lines.
+
+    Yields:
+        tuple[int, dict | None, str | None]: 1-based line number, the
+        decoded object, and an error message when it could not be decoded.
+    """
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "Expected a JSON object."
+            continue
+        yield number, record, None
+
+
+def _reference(record, id_field, name_field):
+    """
+    Returns:
+        int | str | None: The record's id or name for a related object.
+    """
+    if isinstance(record.get(id_field), int):
+        return record[id_field]
+    if isinstance(record.get(name_field), str):
+        return record[name_field]
+    return None
+
+
+def _lookups(records):
+    """
+    Resolve every publisher and author referenced by a batch in two queries.
+
+    Returns:
+        tuple[dict, dict]: Publishers and journalists keyed by both id and
+        name/username.
+    """
+    publisher_refs = {_reference(r, 'publisher_id', 'publisher') for r in records}
+    author_refs = {_reference(r, 'author_id', 'author') for r in records}
+
+    def split(refs):
+        return ({ref for ref in refs if isinstance(ref, int)},
+                {ref for ref in refs if isinstance(ref, str)})
+
+    publishers = {}
+    ids, names = split(publisher_refs)
+    if ids or names:
+        # Newest first so a duplicated name resolves to the oldest publisher.
+        for publisher in Publisher.objects.filter(
+            Q(id__in=ids) | Q(name__in=names)
+        ).order_by('-id'):
+            publishers[publisher.id] = publishers[publisher.name] = publisher
+    authors = {}
+    ids, usernames = split(author_refs)
+    if ids or usernames:
+        for journalist in CustomUser.objects.filter(role='journalist').filter(
+            Q(id__in=ids) | Q(username__in=usernames)
+        ).only('id', 'username'):
+            authors[journalist.id] = authors[journalist.username] = journalist
+    return publishers, authors
+
+
+def _validate(record, publishers, authors, author=None):
+    """
+    Build an unsaved article from one record.
+
+    Returns:
+        tuple[Article | None, str | None]: The article, or an error message.
+    """
+    title = record.get('title')
+    description = record.get('description', '')
+    content = record.get('content')
+    if not isinstance(title, str) or not title.strip() or len(title) > 255:
+        return None, "title is required and must be at most 255 characters."
+    if not isinstance(description, str) or len(description) > 300:
+        return None, "description must be at most 300 characters."
+    if not isinstance(content, str) or not content.strip():
+        return None, "content is required."
+
+    publisher = publishers.get(_reference(record, 'publisher_id', 'publisher'))
+    if publisher is None:
+        return None, "Unknown publisher."
+    named = _reference(record, 'author_id', 'author')
+    if author is not None:
+        if named is not None and named not in (author.id, author.username):
+            return None, "Articles can only be imported for yourself."
+    else:
+        author = authors.get(named)
+        if author is None:
+            return None, "Unknown journalist."
+    return Article(title=title, description=description, content=content,
+                   author_id=author.id, publisher=publisher), None
+
+
+def _fill_ids(articles, using):
+    """
+    Look up the ids of a batch inserted on a backend that cannot return them.
+
+    Every article of the batch carries the same fresh ``import_batch``
+    token, so the new rows are selected by the token alone. Auto-increment
+    ids grow in VALUES order within an INSERT, and ``bulk_create`` issues
+    its statements in list order, so sorted ids line up with the batch.
+
+    Raises:
+        DatabaseError: If the token does not match exactly one row per
+            article.
+    """
+    ids = list(Article.objects.using(using).filter(import_batch=articles[0].import_batch)
+               .order_by('id').values_list('id', flat=True))
+    if len(ids) != len(articles):
+        raise DatabaseError(
+            f"Import batch {articles[0].import_batch} matched {len(ids)} rows "
+            f"for {len(articles)} inserted articles."
+        )
+    for article, pk in zip(articles, ids):
+        article.id = pk
+
+
+def _insert(articles):
+    """
+    Insert a batch of articles and link them to their authors.
+    """
+    connection = connections[router.db_for_write(Article)]
+    returns_ids = connection.features.can_return_rows_from_bulk_insert
+    if not returns_ids:
+        # MySQL cannot report generated ids for a multi-row INSERT.
+        token = uuid.uuid4()
+        for article in articles:
+            article.import_batch = token
+    with transaction.atomic(using=connection.alias):
+        Article.objects.using(connection.alias).bulk_create(articles)
+        if not returns_ids:
+            _fill_ids(articles, connection.alias)
+        ArticleThrough.objects.using(connection.alias).bulk_create([
+            ArticleThrough(customuser_id=article.author_id, article_id=article.id)
+            for article in articles
+        ], ignore_conflicts=True)
+        adjust(CustomUser, 'article_count', Counter(article.author_id for article in articles))
+
+
+def import_articles(lines, batch_size=1000, author=None, max_rejections=100):
+    """
+    Import articles from NDJSON lines.
+
+    Valid lines are inserted even when others in the same batch are
+    rejected. Model signals do not fire for bulk inserts, so the
+    directory cache is invalidated once at the end instead.
+
+    Parameters:
+        lines (Iterable[bytes | str]): NDJSON input.
+        batch_size (int): Lines validated and inserted together.
+        author (CustomUser): If given, every article is attributed to this
+            journalist and lines naming anyone else are rejected.
+        max_rejections (int): Rejected lines reported individually; the
+            rest are only counted, so a bad upload cannot grow the summary.
+
+    Returns:
+        ImportSummary: Counts, rejections and duration.
+    """
+    start = time.perf_counter()
+    created, rejected, rejected_count = 0, [], 0
+
+    def reject(number, error):
+        nonlocal rejected_count
+        rejected_count += 1
+        if len(rejected) < max_rejections:
+            rejected.append({'line': number, 'error': error})
+
+    def flush(batch):
+        publishers, authors = _lookups([record for _, record in batch])
+        articles = []
+        for number, record in batch:
+            article, error = _validate(record, publishers, authors, author)
+            if error:
+                reject(number, error)
+            else:
+                articles.append(article)
+        if articles:
+            _insert(articles)
+        return len(articles)
+
+    batch = []
+    for number, record, error in iter_ndjson(lines):
+        if error:
+            reject(number, error)
+            continue
+        batch.append((number, record))
+        if len(batch) >= batch_size:
+            created += flush(batch)
+            batch = []
+    if batch:
+        created += flush(batch)
+
+    if created:
+        invalidate('directory')
+    return ImportSummary(created, rejected, rejected_count, time.perf_counter() - start)
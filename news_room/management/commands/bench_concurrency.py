@@ -0,0 +1,80 @@
+"""
+Management command that compares the WSGI and ASGI read paths under load.
+
+Point it at two running deployments of the same database, e.g.
+``gunicorn newsroom.wsgi`` or ``runserver`` for WSGI and
+``uvicorn newsroom.asgi:application`` for ASGI. Each concurrency level
+requests the synchronous view from the WSGI server and its ``async/``
+variant from the ASGI server, and reports throughput and tail latency.
+"""
+
+import resource
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news_room.benchmarking import percentile, run_load
+
+
+class Command(BaseCommand):
+    """
+    Report requests per second and latency percentiles per server and concurrency.
+    """
+    help = "Benchmark the sync read path on WSGI against the async path on ASGI."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--wsgi', required=True, help="Base URL of the WSGI server.")
+        parser.add_argument('--asgi', required=True, help="Base URL of the ASGI server.")
+        parser.add_argument(
+            '--path', default='/feeds/rss/',
+            help="Synchronous endpoint to request (default: /feeds/rss/).",
+        )
+        parser.add_argument(
+            '--async-path',
+            help="Async endpoint to request (default: /async prefixed to --path).",
+        )
+        parser.add_argument(
+            '--clients', type=int, nargs='+', default=[100, 1000],
+            help="Concurrency levels (default: 100 1000).",
+        )
+        parser.add_argument(
+            '--requests-per-client', type=int, default=20,
+            help="Requests per client at each level (default: 20).",
+        )
+        parser.add_argument('--token', help="API token sent as 'Authorization: Token <key>'.")
+        parser.add_argument('--timeout', type=float, default=30, help="Seconds per request (default: 30).")
+
+    def _raise_open_file_limit(self, clients):
+        # Every client holds a socket; the default soft limit is often 1024.
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        wanted = clients + 256
+        if soft != resource.RLIM_INFINITY and soft < wanted:
+            limit = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+
+    def _report(self, label, clients, result):
+        ms = [s * 1000 for s in result['latencies']]
+        self.stdout.write(
+            f"{label:<5} {clients:>5} clients  {result['rps']:9.1f} req/s  "
+            f"p50 {percentile(ms, 0.50):8.1f} ms  p95 {percentile(ms, 0.95):8.1f} ms  "
+            f"p99 {percentile(ms, 0.99):8.1f} ms  max {percentile(ms, 1.0):8.1f} ms  "
+            f"errors {result['errors']}"
+        )
+
+    def handle(self, *args, **options):
+        headers = {'Authorization': f"Token {options['token']}"} if options['token'] else None
+        targets = [
+            ('wsgi', options['wsgi'].rstrip('/') + options['path']),
+            ('asgi', options['asgi'].rstrip('/') + (options['async_path'] or '/async' + options['path'])),
+        ]
+        for label, url in targets:
+            # Warm caches so every level measures steady-state polling.
+            warm = run_load(url, 1, 1, headers, options['timeout'])
+            if warm['errors']:
+                raise CommandError(f"{label}: {url} did not answer successfully.")
+
+        for clients in options['clients']:
+            self._raise_open_file_limit(clients)
+            for label, url in targets:
+                result = run_load(url, clients, clients * options['requests_per_client'],
+                                  headers, options['timeout'])
+                self._report(label, clients, result)
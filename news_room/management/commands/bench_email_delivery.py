@@ -0,0 +1,60 @@
+"""
+Management command that benchmarks subscriber email delivery.
+
+Sends a synthetic audience through a local SMTP stand-in and compares
+the old one-connection-per-message approach with the delivery engine.
+"""
+
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand
+
+from news_room.benchmarking import LocalSMTPServer, timed
+from news_room.delivery import send_bulk
+
+
+class Command(BaseCommand):
+    """
+    Report messages and recipients per second for each delivery strategy.
+    """
+    help = "Benchmark email delivery throughput against a local SMTP sink."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--recipients', type=int, default=2000,
+            help="Number of synthetic recipients (default: 2000).",
+        )
+        parser.add_argument(
+            '--chunk-sizes', default='1,50',
+            help="Comma-separated BCC chunk sizes to measure (default: 1,50).",
+        )
+
+    def _report(self, label, server, seconds, recipients):
+        self.stdout.write(
+            f"{label:<32} {seconds:8.2f}s  "
+            f"{server.messages / seconds:9.1f} msg/s  "
+            f"{recipients / seconds:9.1f} rcpt/s  "
+            f"{server.sessions:6d} SMTP sessions"
+        )
+
+    def handle(self, *args, **options):
+        count = options['recipients']
+        addresses = [f"reader{i}@example.com" for i in range(count)]
+        subject, body = "New Article: Benchmark", "Benchmark body\n"
+
+        with LocalSMTPServer() as server:
+            with timed() as t:
+                for address in addresses:
+                    server.connection().send_messages([
+                        EmailMessage(subject, body, 'news@example.com', [address])
+                    ])
+            self._report("connection per message", server, t['seconds'], count)
+
+        for size in [int(s) for s in options['chunk_sizes'].split(',')]:
+            with LocalSMTPServer() as server:
+                with timed() as t:
+                    results = list(send_bulk(
+                        subject, body, addresses, from_email='news@example.com',
+                        connection=server.connection(), chunk_size=size, rate_limit=0,
+                    ))
+                sent = sum(1 for r in results if r.status == 'sent')
+                self._report(f"reused connection, chunk={size}", server, t['seconds'], sent)
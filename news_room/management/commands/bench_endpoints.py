@@ -0,0 +1,60 @@
+"""
+Management command that measures every route against its performance budget.
+
+Run it against a database filled by ``seed_scale --size <size>``; the
+limits for that size are read from ``news_room/perf_budgets.json``. See
+``news_room.budgets``.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news_room.budgets import BUDGETS_FILE, budgets_from, check_budgets, load_budgets, measure_endpoints
+from news_room.seeding import SIZES
+
+
+class Command(BaseCommand):
+    """
+    Print query count, wall time and peak memory per route and fail on a blown budget.
+    """
+    help = "Measure every route and compare it with the committed performance budget."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--size', choices=list(SIZES), default='small',
+            help="Dataset size the database was seeded with; selects the budget (default: small).",
+        )
+        parser.add_argument('--repeat', type=int, default=3, help="Timed requests per route (default: 3).")
+        parser.add_argument(
+            '--write', action='store_true',
+            help="Record the measurements plus headroom as the new budget for --size.",
+        )
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError("--repeat must be at least 1.")
+        results = measure_endpoints(repeat=options['repeat'])
+
+        self.stdout.write(f"{'route':<32}{'status':>7}{'queries':>9}{'ms':>10}{'peak kB':>10}")
+        for name, result in results.items():
+            self.stdout.write(f"{name:<32}{result['status']:>7}{result['queries']:>9}"
+                              f"{result['ms']:>10}{result['peak_kb']:>10}")
+
+        errors = [name for name, result in results.items() if result['status'] >= 500]
+        if errors:
+            raise CommandError(f"Server errors from: {', '.join(errors)}")
+
+        budgets = load_budgets()
+        if options['write']:
+            budgets[options['size']] = budgets_from(results)
+            BUDGETS_FILE.write_text(json.dumps(dict(sorted(budgets.items())), indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Wrote the {options['size']} budget to {BUDGETS_FILE.name}."))
+            return
+
+        if options['size'] not in budgets:
+            raise CommandError(f"No {options['size']} budget in {BUDGETS_FILE.name}; run with --write.")
+        violations = check_budgets(results, budgets[options['size']])
+        if violations:
+            raise CommandError("Budget exceeded:\n  " + "\n  ".join(violations))
+        self.stdout.write(self.style.SUCCESS(f"All {len(results)} routes are within the {options['size']} budget."))
@@ -0,0 +1,107 @@
+"""
+Management command that benchmarks full-text search on a synthetic corpus.
+
+Loads generated documents into ``SearchDocument``, times ranked index
+queries against an ``icontains`` scan of the same rows, then deletes the
+generated documents again. Run it against a scratch database.
+"""
+
+import itertools
+import random
+import statistics
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from news_room.benchmarking import timed
+from news_room.models import SearchDocument
+from news_room.search import search
+
+
+BENCH_KIND = 'bench'
+
+
+class Command(BaseCommand):
+    """
+    Report indexing throughput and query latency percentiles.
+    """
+    help = "Benchmark full-text search against a synthetic corpus."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--documents', type=int, default=1_000_000,
+            help="Number of synthetic documents (default: 1000000).",
+        )
+        parser.add_argument(
+            '--queries', type=int, default=200,
+            help="Number of index queries to time (default: 200).",
+        )
+        parser.add_argument(
+            '--scan-queries', type=int, default=3,
+            help="Number of icontains scans to time for comparison (default: 3).",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=10_000,
+            help="Documents inserted per batch (default: 10000).",
+        )
+        parser.add_argument('--seed', type=int, default=0)
+
+    def _documents(self, rng, vocabulary, weights, count):
+        def words(k):
+            return ' '.join(rng.choices(vocabulary, cum_weights=weights, k=k))
+
+        for i in range(count):
+            yield SearchDocument(
+                kind=BENCH_KIND, object_id=i, title=words(6).capitalize(),
+                description=words(20), content=words(80), created_at=self.now,
+            )
+
+    def _report(self, label, seconds):
+        ms = sorted(s * 1000 for s in seconds)
+        p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+        self.stdout.write(
+            f"{label:<24} p50 {statistics.median(ms):9.2f} ms  p95 {p95:9.2f} ms  "
+            f"max {ms[-1]:9.2f} ms"
+        )
+
+    def handle(self, *args, **options):
+        self.now = timezone.now()
+        rng = random.Random(options['seed'])
+        # Zipf-distributed vocabulary so a few words are very common.
+        vocabulary = [''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(4, 9)))
+                      for _ in range(20_000)]
+        weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+        count = options['documents']
+        try:
+            with timed() as t:
+                documents = self._documents(rng, vocabulary, weights, count)
+                while batch := list(itertools.islice(documents, options['batch_size'])):
+                    SearchDocument.objects.bulk_create(batch)
+            self.stdout.write(f"indexed {count} documents in {t['seconds']:.1f}s "
+                              f"({count / t['seconds']:.0f} docs/s)")
+
+            # Mid-frequency terms: common enough to match many documents.
+            terms = vocabulary[50:2000]
+            queries = [' '.join(rng.sample(terms, rng.choice((1, 2))))
+                       for _ in range(options['queries'])]
+            latencies, matched = [], 0
+            for query in queries:
+                with timed() as t:
+                    results, _ = search(query, kind=BENCH_KIND)
+                latencies.append(t['seconds'])
+                matched += bool(results)
+            self._report("full-text index", latencies)
+            self.stdout.write(f"{matched}/{len(queries)} queries returned results")
+
+            scans = []
+            for query in queries[:options['scan_queries']]:
+                with timed() as t:
+                    list(SearchDocument.objects.filter(
+                        kind=BENCH_KIND, content__icontains=query.split()[0]
+                    ).order_by('-created_at', '-id')[:20])
+                scans.append(t['seconds'])
+            if scans:
+                self._report("icontains scan", scans)
+        finally:
+            SearchDocument.objects.filter(kind=BENCH_KIND).delete()
@@ -0,0 +1,56 @@
+"""
+Management command that exports the approved article archive as NDJSON.
+
+Uses the same streaming encoder as ``api/articles/export/``; see
+``news_room.export``.
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news_room.export import iter_export, parse_since
+
+
+class Command(BaseCommand):
+    """
+    Write approved articles, one JSON object per line, to a file or stdout.
+    """
+    help = "Export approved articles as NDJSON (optionally gzip-compressed)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', '-o', default='-',
+            help="File to write, or - for stdout (default).",
+        )
+        parser.add_argument(
+            '--since',
+            help="Only articles created at or after this ISO date or datetime.",
+        )
+        parser.add_argument(
+            '--publisher', type=int, action='append', dest='publishers',
+            help="Only articles of this publisher id; repeat for several.",
+        )
+        parser.add_argument('--gzip', action='store_true', help="Gzip the output.")
+        parser.add_argument(
+            '--chunk-size', type=int, default=2000,
+            help="Rows fetched per database round trip (default: 2000).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            since = parse_since(options['since']) if options['since'] else None
+        except ValueError as e:
+            raise CommandError(str(e))
+        blocks = iter_export(since, options['publishers'], options['gzip'], options['chunk_size'])
+        if options['output'] == '-':
+            for block in blocks:
+                sys.stdout.buffer.write(block)
+            sys.stdout.buffer.flush()
+            return
+        written = 0
+        with open(options['output'], 'wb') as out:
+            for block in blocks:
+                out.write(block)
+                written += len(block)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} bytes to {options['output']}."))
@@ -0,0 +1,55 @@
+"""
+Management command that bulk-imports articles from an NDJSON file.
+
+See ``news_room.ingest`` for the line format.
+"""
+
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from news_room.ingest import import_articles
+from news_room.models import CustomUser
+
+
+class Command(BaseCommand):
+    """
+    Import articles for editor review and report throughput.
+    """
+    help = "Bulk-import articles from newline-delimited JSON (use - for stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="NDJSON file to import, or - for stdin.")
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help="Lines validated and inserted per batch (default: 1000).",
+        )
+        parser.add_argument(
+            '--author',
+            help="Attribute every article to this journalist's username.",
+        )
+
+    def handle(self, *args, **options):
+        author = None
+        if options['author']:
+            author = CustomUser.objects.filter(role='journalist', username=options['author']).first()
+            if author is None:
+                raise CommandError(f"No journalist named {options['author']!r}.")
+
+        limit = settings.IMPORT_MAX_REJECTIONS
+        if options['path'] == '-':
+            summary = import_articles(sys.stdin.buffer, options['batch_size'], author, limit)
+        else:
+            with open(options['path'], 'rb') as lines:
+                summary = import_articles(lines, options['batch_size'], author, limit)
+
+        for rejection in summary.rejected:
+            self.stderr.write(f"line {rejection['line']}: {rejection['error']}")
+        if summary.rejected_count > len(summary.rejected):
+            self.stderr.write(f"... {summary.rejected_count - len(summary.rejected)} more rejected lines.")
+        rate = summary.created / summary.seconds if summary.seconds else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {summary.created} articles in {summary.seconds:.2f}s "
+            f"({rate:.0f} articles/s), {summary.rejected_count} rejected."
+        ))
@@ -0,0 +1,48 @@
+"""
+Management command that bulk-imports reader subscriptions.
+
+Reads CSV with a ``reader,publisher,journalist`` header or NDJSON objects
+with the same keys; see ``news_room.subscriptions.import_subscriptions``.
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand
+
+from news_room.subscriptions import import_subscriptions
+
+
+class Command(BaseCommand):
+    """
+    Import subscriptions, e.g. when migrating an existing reader base.
+    """
+    help = "Bulk-import reader subscriptions from CSV or NDJSON (use - for stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to import, or - for stdin.")
+        parser.add_argument(
+            '--format', choices=['csv', 'ndjson'],
+            help="Input format (default: from the file extension, else csv).",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help="Rows resolved and inserted per batch (default: 5000).",
+        )
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or (
+            'ndjson' if options['path'].endswith(('.ndjson', '.jsonl')) else 'csv'
+        )
+        if options['path'] == '-':
+            summary = import_subscriptions(sys.stdin.buffer, file_format, options['batch_size'])
+        else:
+            with open(options['path'], 'rb') as lines:
+                summary = import_subscriptions(lines, file_format, options['batch_size'])
+
+        for rejection in summary.rejected:
+            self.stderr.write(f"line {rejection['line']}: {rejection['error']}")
+        rate = summary.created / summary.seconds if summary.seconds else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {summary.created} subscriptions in {summary.seconds:.2f}s "
+            f"({rate:.0f} rows/s), {len(summary.rejected)} rejected."
+        ))
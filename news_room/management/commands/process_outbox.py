@@ -0,0 +1,60 @@
+"""
+Management command that drains the transactional outbox.
+
+Run ``python manage.py process_outbox`` alongside the web server to deliver
+approval emails and X posts queued by ``news_room.signals``.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from news_room.outbox import HANDLERS, drain
+
+
+class Command(BaseCommand):
+    """
+    Poll the outbox and process due entries with retries and backoff.
+    """
+    help = "Deliver queued notifications from the outbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help="Drain due entries once and exit instead of polling.",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=100,
+            help="Entries claimed per round trip (default: 100).",
+        )
+        parser.add_argument(
+            '--concurrency', type=int, default=4,
+            help="Entries processed in parallel threads (default: 4).",
+        )
+        parser.add_argument(
+            '--kind', action='append', dest='kinds', choices=list(HANDLERS),
+            help="Only process entries of this kind; repeat for several.",
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=2.0,
+            help="Seconds to sleep when the outbox is empty (default: 2).",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Drain the outbox once, or keep polling until interrupted.
+        """
+        try:
+            while True:
+                succeeded, failed = drain(
+                    batch_size=options['batch_size'],
+                    concurrency=options['concurrency'],
+                    kinds=options['kinds'],
+                )
+                if succeeded or failed:
+                    self.stdout.write(f"Processed {succeeded} entries, {failed} failed.")
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping outbox worker.")
@@ -0,0 +1,29 @@
+"""
+Management command that rebuilds the full-text search index.
+
+Run after restoring a database or bulk-loading content that bypassed
+model signals.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from news_room.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """
+    Repopulate ``SearchDocument`` from approved articles and newsletters.
+    """
+    help = "Rebuild the full-text search index over articles and newsletters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help="Rows read and inserted per batch (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            written = rebuild_search_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {written} documents."))
@@ -0,0 +1,28 @@
+"""
+Management command that rebuilds the materialized subscriber index.
+
+Run after enabling ``SUBSCRIBER_INDEX_ENABLED`` or to repair drift.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from news_room.recipients import rebuild_subscriber_index
+
+
+class Command(BaseCommand):
+    """
+    Repopulate ``SubscriberIndex`` from the subscription M2M tables.
+    """
+    help = "Rebuild the subscriber index used for notification fan-out."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help="Rows inserted per batch (default: 5000).",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            written = rebuild_subscriber_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {written} subscriptions."))
@@ -0,0 +1,26 @@
+"""
+Management command that repairs denormalized relation counters.
+
+Recomputes every counter in ``news_room.counters.COUNTERS`` from the
+through tables and reports how many rows had drifted.
+"""
+
+from django.core.management.base import BaseCommand
+
+from news_room.cache import invalidate
+from news_room.counters import recount
+
+
+class Command(BaseCommand):
+    """
+    Recompute subscriber, journalist and article counters.
+    """
+    help = "Recompute denormalized subscriber and article counters."
+
+    def handle(self, *args, **options):
+        corrected = recount()
+        for counter, rows in corrected.items():
+            self.stdout.write(f"{counter}: {rows} rows corrected")
+        if any(corrected.values()):
+            invalidate('directory')
+        self.stdout.write(self.style.SUCCESS(f"Recounted {len(corrected)} counters."))
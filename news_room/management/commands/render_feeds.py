@@ -0,0 +1,24 @@
+"""
+Management command that renders every syndication feed.
+
+Feeds are normally re-rendered by the outbox when articles are approved
+or withdrawn; run this after deploying feeds or changing ``FEED_ITEMS``.
+"""
+
+from django.core.management.base import BaseCommand
+
+from news_room.feeds import all_feed_keys, refresh
+
+
+class Command(BaseCommand):
+    """
+    Render and store the global, publisher and journalist feeds.
+    """
+    help = "Render and store every RSS and Atom feed."
+
+    def handle(self, *args, **options):
+        rendered = 0
+        for key in all_feed_keys():
+            refresh([key])
+            rendered += 1
+        self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} feeds."))
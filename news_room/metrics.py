@@ -0,0 +1,271 @@
+"""
+Per-request instrumentation exposed in the Prometheus text format.
+
+``MetricsMiddleware`` (see ``news_room.middleware``) collects, for every
+request, the number of SQL queries and the time spent in the database,
+in template rendering and overall, then files them under the view and
+URL name that served it. Queries are counted by a wrapper every database
+connection gets when it is opened; templates are timed by
+``InstrumentedTemplates``, the project's template backend.
+
+A request that runs the same SQL statement at least
+``METRICS_REPEATED_QUERY_THRESHOLD`` times, differing only in parameters,
+is counted as a suspected N+1 pattern and the statement is kept so it can
+be found from the metrics endpoint.
+
+Aggregates live in the memory of each process, so every server worker
+reports its own histograms.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.template.backends.django import DjangoTemplates, Template
+
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Statements kept per view as N+1 suspects, and their length in labels.
+SUSPECTS_PER_VIEW = 5
+STATEMENT_LABEL_LENGTH = 200
+
+# Stats of the request being served: None outside ``collecting()``.
+_current = ContextVar('request_metrics', default=None)
+
+_lock = threading.Lock()
+
+
+# ---------- Collection ----------
+
+@contextmanager
+def collecting():
+    """
+    Record queries and template renders made in the enclosed block.
+
+    Yields:
+        dict: ``queries``, ``db_seconds`` and ``template_seconds`` totals,
+        and a ``statements`` Counter of executions per SQL statement.
+    """
+    stats = {'queries': 0, 'db_seconds': 0.0, 'template_seconds': 0.0,
+             'statements': Counter(), 'rendering': 0}
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper that adds each query to the current request's stats.
+    """
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats['db_seconds'] += time.perf_counter() - start
+        stats['queries'] += 1
+        stats['statements'][sql] += 1
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs):
+    """
+    Count the queries of every new database connection.
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class InstrumentedTemplate(Template):
+    """
+    Django template whose top-level renders are timed.
+    """
+
+    def render(self, context=None, request=None):
+        stats = _current.get()
+        if stats is None or stats['rendering']:
+            # Nested renders are part of the outer render's time.
+            return super().render(context, request)
+        stats['rendering'] += 1
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            stats['template_seconds'] += time.perf_counter() - start
+            stats['rendering'] -= 1
+
+
+class InstrumentedTemplates(DjangoTemplates):
+    """
+    Django template backend that records render time per request.
+    """
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        return InstrumentedTemplate(super().get_template(template_name).template, self)
+
+
+# ---------- Aggregation ----------
+
+class Histogram:
+    """
+    Bucketed observations per label set.
+    """
+
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, labels, value):
+        """
+        Parameters:
+            labels (tuple): Label values, matching ``LABELS``.
+            value (float): Observed value.
+        """
+        with _lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = {'buckets': [0] * len(self.buckets), 'count': 0, 'sum': 0.0}
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series['buckets'][index] += 1
+            series['count'] += 1
+            series['sum'] += value
+
+    def render(self):
+        """
+        Returns:
+            list[str]: Exposition lines with cumulative buckets.
+        """
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with _lock:
+            series = sorted(((labels, dict(data, buckets=list(data['buckets'])))
+                             for labels, data in self.series.items()), key=lambda item: item[0])
+        for labels, data in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, data['buckets']):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{_labels(labels, le=float(bound))} {cumulative}')
+            lines.append(f'{self.name}_bucket{_labels(labels, le="+Inf")} {data["count"]}')
+            lines.append(f'{self.name}_sum{_labels(labels)} {data["sum"]}')
+            lines.append(f'{self.name}_count{_labels(labels)} {data["count"]}')
+        return lines
+
+
+LABELS = ('view', 'url_name')
+
+HISTOGRAMS = {
+    'seconds': Histogram('newsroom_request_duration_seconds',
+                         "Time to produce a response.", DURATION_BUCKETS),
+    'queries': Histogram('newsroom_db_queries_per_request',
+                         "SQL queries run per request.", QUERY_BUCKETS),
+    'db_seconds': Histogram('newsroom_db_duration_seconds',
+                            "Time per request spent executing SQL.", DURATION_BUCKETS),
+    'template_seconds': Histogram('newsroom_template_duration_seconds',
+                                  "Time per request spent rendering templates.", DURATION_BUCKETS),
+}
+
+_suspect_requests = {}
+_suspect_statements = {}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(values, **extra):
+    pairs = [*zip(LABELS, values), *extra.items()]
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def repeated_statements(stats):
+    """
+    Parameters:
+        stats (dict): Request stats yielded by ``collecting()``.
+
+    Returns:
+        dict[str, int]: Statements run at least
+        ``METRICS_REPEATED_QUERY_THRESHOLD`` times, with their counts.
+    """
+    threshold = settings.METRICS_REPEATED_QUERY_THRESHOLD
+    return {sql: count for sql, count in stats['statements'].items() if count >= threshold}
+
+
+def record(labels, seconds, stats):
+    """
+    File one request's measurements under its view and URL name.
+
+    Parameters:
+        labels (tuple): ``(view, url_name)`` of the request.
+        seconds (float): Total time to produce the response.
+        stats (dict): Stats yielded by ``collecting()``.
+    """
+    HISTOGRAMS['seconds'].observe(labels, seconds)
+    for key in ('queries', 'db_seconds', 'template_seconds'):
+        HISTOGRAMS[key].observe(labels, stats[key])
+
+    repeated = repeated_statements(stats)
+    if not repeated:
+        return
+    for sql, count in repeated.items():
+        logger.warning("Suspected N+1 in %s: %d executions of %s", labels[0], count, sql)
+    with _lock:
+        _suspect_requests[labels] = _suspect_requests.get(labels, 0) + 1
+        statements = _suspect_statements.setdefault(labels, {})
+        for sql, count in repeated.items():
+            sql = sql[:STATEMENT_LABEL_LENGTH]
+            statements[sql] = max(count, statements.get(sql, 0))
+        if len(statements) > SUSPECTS_PER_VIEW:
+            worst = sorted(statements.items(), key=lambda item: -item[1])[:SUSPECTS_PER_VIEW]
+            _suspect_statements[labels] = dict(worst)
+
+
+def render_metrics():
+    """
+    Returns:
+        str: Every metric in the Prometheus text exposition format.
+    """
+    lines = []
+    for histogram in HISTOGRAMS.values():
+        lines.extend(histogram.render())
+    with _lock:
+        requests = sorted(_suspect_requests.items())
+        statements = sorted((labels, sorted(by_sql.items())) for labels, by_sql in _suspect_statements.items())
+    lines += ['# HELP newsroom_suspected_n_plus_one_total Requests that repeated one SQL statement.',
+              '# TYPE newsroom_suspected_n_plus_one_total counter']
+    lines += [f'newsroom_suspected_n_plus_one_total{_labels(labels)} {count}' for labels, count in requests]
+    lines += ['# HELP newsroom_repeated_query_executions Most executions of a statement in one request.',
+              '# TYPE newsroom_repeated_query_executions gauge']
+    lines += [f'newsroom_repeated_query_executions{_labels(labels, statement=sql)} {count}'
+              for labels, by_sql in statements for sql, count in by_sql]
+    return '\n'.join(lines) + '\n'
+
+
+def reset():
+    """
+    Discard every recorded measurement.
+    """
+    with _lock:
+        for histogram in HISTOGRAMS.values():
+            histogram.series.clear()
+        _suspect_requests.clear()
+        _suspect_statements.clear()
@@ -0,0 +1,116 @@
+"""
+Request middleware for the NewsRoom project.
+
+``MetricsMiddleware`` measures every request's queries, database time,
+template time and latency per view (see ``news_room.metrics``).
+
+``ReplicaRoutingMiddleware`` serves safe requests from read replicas (see
+``news_room.routers``) and keeps a client on the primary for
+``REPLICA_STICKY_SECONDS`` after it writes, so users read their own
+changes despite replication lag.
+"""
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from . import metrics
+from .routers import replica_reads
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Route reads of safe requests to replicas unless the client wrote recently.
+
+    Unsafe requests, and safe ones that end up writing, set a cookie that
+    pins the client's following requests to the primary.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _use_replicas(self, request):
+        if request.method not in SAFE_METHODS:
+            return False
+        try:
+            pinned_until = float(request.COOKIES.get(settings.REPLICA_STICKY_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0
+        return pinned_until < time.time()
+
+    def _pin(self, response):
+        window = settings.REPLICA_STICKY_SECONDS
+        response.set_cookie(
+            settings.REPLICA_STICKY_COOKIE, str(int(time.time() + window)),
+            max_age=window, httponly=True, samesite='Lax',
+        )
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+        if not self._use_replicas(request):
+            response = self.get_response(request)
+            return self._pin(response) if request.method not in SAFE_METHODS else response
+        with replica_reads() as state:
+            response = self.get_response(request)
+        return self._pin(response) if state['wrote'] else response
+
+    async def __acall__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+        if not self._use_replicas(request):
+            response = await self.get_response(request)
+            return self._pin(response) if request.method not in SAFE_METHODS else response
+        with replica_reads() as state:
+            response = await self.get_response(request)
+        return self._pin(response) if state['wrote'] else response
+
+
+class MetricsMiddleware:
+    """
+    Record query count, database, template and total time per view.
+
+    Listed first in ``MIDDLEWARE`` so the total includes the other
+    middleware. Streamed bodies are timed until the response is returned,
+    not until the last chunk is sent.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _labels(self, request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return ('unresolved', '')
+        return (match._func_path, match.view_name or '')
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        with metrics.collecting() as stats:
+            response = self.get_response(request)
+        metrics.record(self._labels(request), time.perf_counter() - start, stats)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        with metrics.collecting() as stats:
+            response = await self.get_response(request)
+        metrics.record(self._labels(request), time.perf_counter() - start, stats)
+        return response
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0002_outboxentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254)),
+                ('status', models.CharField(choices=[('sent', 'Sent'), ('rejected', 'Rejected'), ('failed', 'Failed')], max_length=20)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('outbox_entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='news_room.outboxentry')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['outbox_entry', 'status'], name='delivery_entry_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0003_emaildelivery'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubscriberIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('journalist', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('publisher', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news_room.publisher')),
+                ('reader', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['publisher', 'email'], name='subindex_publisher_email_idx'), models.Index(fields=['journalist', 'email'], name='subindex_journalist_email_idx')],
+                'constraints': [models.UniqueConstraint(fields=('publisher', 'reader'), name='subindex_publisher_reader_uniq'), models.UniqueConstraint(fields=('journalist', 'reader'), name='subindex_journalist_reader_uniq')],
+            },
+        ),
+    ]
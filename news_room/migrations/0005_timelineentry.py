@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0004_subscriberindex'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxentry',
+            name='kind',
+            field=models.CharField(choices=[('article_email', 'Article email'), ('article_x_post', 'Article X post'), ('article_timeline', 'Article timeline fan-out')], max_length=30),
+        ),
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='news_room.article')),
+                ('reader', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['reader', '-created_at', '-article'], name='timeline_reader_recent_idx')],
+                'constraints': [models.UniqueConstraint(fields=('reader', 'article'), name='timeline_reader_article_uniq')],
+            },
+        ),
+    ]
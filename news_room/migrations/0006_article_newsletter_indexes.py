@@ -0,0 +1,37 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0005_timelineentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('approved', True)), fields=['-created_at', '-id'], name='article_approved_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['publisher', '-created_at', '-id'], name='article_publisher_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', '-created_at', '-id'], name='article_author_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('approved', False), ('needs_revision', True), _connector='OR'), fields=['created_at'], name='article_review_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsletter',
+            index=models.Index(fields=['-created_at', '-id'], name='newsletter_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsletter',
+            index=models.Index(fields=['author', '-created_at', '-id'], name='newsletter_author_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:20
+
+from django.db import migrations, models
+
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE news_room_searchdocument_fts USING fts5(
+        title, description, content, kind UNINDEXED,
+        content='news_room_searchdocument', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    # Weight title over description over body when ranking with bm25.
+    "INSERT INTO news_room_searchdocument_fts(news_room_searchdocument_fts, rank) "
+    "VALUES ('rank', 'bm25(10.0, 3.0, 1.0)')",
+    """
+    CREATE TRIGGER news_room_searchdocument_ai AFTER INSERT ON news_room_searchdocument BEGIN
+        INSERT INTO news_room_searchdocument_fts(rowid, title, description, content, kind)
+        VALUES (new.id, new.title, new.description, new.content, new.kind);
+    END
+    """,
+    """
+    CREATE TRIGGER news_room_searchdocument_ad AFTER DELETE ON news_room_searchdocument BEGIN
+        INSERT INTO news_room_searchdocument_fts(
+            news_room_searchdocument_fts, rowid, title, description, content, kind
+        ) VALUES ('delete', old.id, old.title, old.description, old.content, old.kind);
+    END
+    """,
+    """
+    CREATE TRIGGER news_room_searchdocument_au AFTER UPDATE ON news_room_searchdocument BEGIN
+        INSERT INTO news_room_searchdocument_fts(
+            news_room_searchdocument_fts, rowid, title, description, content, kind
+        ) VALUES ('delete', old.id, old.title, old.description, old.content, old.kind);
+        INSERT INTO news_room_searchdocument_fts(rowid, title, description, content, kind)
+        VALUES (new.id, new.title, new.description, new.content, new.kind);
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS news_room_searchdocument_au",
+    "DROP TRIGGER IF EXISTS news_room_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS news_room_searchdocument_ai",
+    "DROP TABLE IF EXISTS news_room_searchdocument_fts",
+]
+
+MYSQL_FORWARD = [
+    "ALTER TABLE news_room_searchdocument "
+    "ADD FULLTEXT INDEX searchdoc_fulltext_idx (title, description, content)",
+]
+
+MYSQL_BACKWARD = [
+    "ALTER TABLE news_room_searchdocument DROP INDEX searchdoc_fulltext_idx",
+]
+
+
+def _run(statements_by_vendor):
+    """
+    Build a RunPython function executing the statements for the current backend.
+    """
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0006_article_newsletter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('article', 'Article'), ('newsletter', 'Newsletter')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='searchdoc_kind_object_uniq')],
+            },
+        ),
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'mysql': MYSQL_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD, 'mysql': MYSQL_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0007_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxentry',
+            name='kind',
+            field=models.CharField(choices=[('article_email', 'Article email'), ('article_x_post', 'Article X post'), ('article_timeline', 'Article timeline fan-out'), ('article_digest', 'Article digest email')], max_length=30),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+ROLE_GROUPS = ('Reader', 'Journalist', 'Editor')
+
+
+def create_role_groups(apps, schema_editor):
+    Group = apps.get_model('auth', 'Group')
+    for name in ROLE_GROUPS:
+        Group.objects.get_or_create(name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('news_room', '0008_outbox_article_digest'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_role_groups, migrations.RunPython.noop),
+    ]
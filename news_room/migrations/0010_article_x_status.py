@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0009_role_groups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='x_post_id',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='x_posted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='x_status',
+            field=models.CharField(blank=True, choices=[('', 'Not posted'), ('queued', 'Queued'), ('posted', 'Posted'), ('failed', 'Failed')], max_length=10),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:50
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(model, field_name, column):
+    through = model._meta.get_field(field_name).remote_field.through
+    counts = through.objects.filter(**{column: OuterRef('pk')}).values(column).annotate(
+        n=Count('*')
+    ).values('n')
+    return Coalesce(Subquery(counts), 0)
+
+
+def populate_counters(apps, schema_editor):
+    CustomUser = apps.get_model('news_room', 'CustomUser')
+    Publisher = apps.get_model('news_room', 'Publisher')
+    CustomUser.objects.update(
+        subscriber_count=_count(CustomUser, 'subscribed_journalists', 'to_customuser'),
+        article_count=_count(CustomUser, 'published_articles', 'customuser'),
+    )
+    Publisher.objects.update(
+        subscriber_count=_count(CustomUser, 'subscribed_publishers', 'publisher'),
+        journalist_count=_count(Publisher, 'journalists', 'publisher'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0010_article_x_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='article_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='subscriber_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='publisher',
+            name='journalist_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='publisher',
+            name='subscriber_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
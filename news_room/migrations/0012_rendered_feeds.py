@@ -0,0 +1,32 @@
+# Generated by Django 5.2.3 on 2026-10-18 07:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0011_relation_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxentry',
+            name='kind',
+            field=models.CharField(choices=[('article_email', 'Article email'), ('article_x_post', 'Article X post'), ('article_timeline', 'Article timeline fan-out'), ('article_digest', 'Article digest email'), ('feed_render', 'Feed rendering')], max_length=30),
+        ),
+        migrations.CreateModel(
+            name='RenderedFeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=40)),
+                ('format', models.CharField(choices=[('rss', 'RSS 2.0'), ('atom', 'Atom 1.0')], max_length=4)),
+                ('content', models.TextField()),
+                ('etag', models.CharField(max_length=40)),
+                ('rendered_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('key', 'format'), name='feed_key_format_uniq')],
+            },
+        ),
+    ]
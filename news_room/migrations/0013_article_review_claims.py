@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0012_rendered_feeds'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='article_review_queue_idx',
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_articles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('approved', False), ('needs_revision', True), _connector='OR'), fields=['publisher', 'created_at', 'id'], name='article_publisher_review_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0013_article_review_claims'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='import_batch',
+            field=models.UUIDField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
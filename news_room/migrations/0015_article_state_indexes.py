@@ -0,0 +1,21 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0014_article_import_batch'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['approved', '-created_at', '-id'], name='article_approved_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['publisher', 'approved', 'needs_revision', 'created_at', 'id'], name='article_publisher_state_idx'),
+        ),
+    ]
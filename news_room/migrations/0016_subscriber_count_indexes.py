@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0015_article_state_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customuser',
+            name='subscriber_count',
+            field=models.IntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='publisher',
+            name='subscriber_count',
+            field=models.IntegerField(db_index=True, default=0, editable=False),
+        ),
+    ]
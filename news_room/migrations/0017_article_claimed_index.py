@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_room', '0016_subscriber_count_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['claimed_by', 'created_at', 'id'], name='article_claimed_idx'),
+        ),
+    ]
@@ -5,8 +5,10 @@ Includes custom user roles, relationship mappings, and core content models.
 """
 
 from django.contrib.auth.models import AbstractUser, Group
-from django.db import models
+from django.core.cache import cache
+from django.db import models, router, transaction
 from django.conf import settings
+from django.utils import timezone
 
 
 ROLE_CHOICES = (
@@ -15,8 +17,73 @@ ROLE_CHOICES = (
     ('editor', 'Editor'),
 )
 
+OUTBOX_KIND_CHOICES = (
+    ('article_email', 'Article email'),
+    ('article_x_post', 'Article X post'),
+    ('article_timeline', 'Article timeline fan-out'),
+    ('article_digest', 'Article digest email'),
+    ('feed_render', 'Feed rendering'),
+)
+
+OUTBOX_STATUS_CHOICES = (
+    ('pending', 'Pending'),
+    ('processing', 'Processing'),
+    ('done', 'Done'),
+    ('failed', 'Failed'),
+)
+
+DELIVERY_STATUS_CHOICES = (
+    ('sent', 'Sent'),
+    ('rejected', 'Rejected'),
+    ('failed', 'Failed'),
+)
+
+X_STATUS_CHOICES = (
+    ('', 'Not posted'),
+    ('queued', 'Queued'),
+    ('posted', 'Posted'),
+    ('failed', 'Failed'),
+)
+
+FEED_FORMAT_CHOICES = (
+    ('rss', 'RSS 2.0'),
+    ('atom', 'Atom 1.0'),
+)
+
+SEARCH_KIND_CHOICES = (
+    ('article', 'Article'),
+    ('newsletter', 'Newsletter'),
+)
+
+
+class MaintainedFieldsMixin:
+    """
+    Keep full saves from overwriting fields maintained by queryset updates.
+
+    Fields listed in ``maintained_fields`` are changed with ``update()``
+    (counters, posting state). A full save of an existing row writes every
+    other field, so an instance loaded earlier cannot reset them. The
+    fields are dropped from the UPDATE itself rather than naming the rest
+    in ``update_fields``, so Django still skips deferred fields instead of
+    fetching them, and still inserts a row deleted since it was loaded.
+    """
+    maintained_fields = ()
+    _full_save = False
+
+    def save(self, *args, **kwargs):
+        self._full_save = not self._state.adding and not args and kwargs.get('update_fields') is None
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            self._full_save = False
 
-class CustomUser(AbstractUser):
+    def _do_update(self, base_qs, using, pk_val, values, *args, **kwargs):
+        if self._full_save:
+            values = [value for value in values if value[0].name not in self.maintained_fields]
+        return super()._do_update(base_qs, using, pk_val, values, *args, **kwargs)
+
+
+class CustomUser(MaintainedFieldsMixin, AbstractUser):
     """
     Custom user model with extended role support.
 
@@ -26,10 +93,18 @@ class CustomUser(AbstractUser):
         subscribed_journalists (QuerySet): Journalists this reader subscribes to.
         published_articles (QuerySet): Articles submitted by this journalist.
         published_newsletters (QuerySet): Newsletters published by this journalist.
+        subscriber_count (int): Readers subscribed to this journalist.
+        article_count (int): Entries in ``published_articles``.
     """
 
     role = models.CharField(max_length=20, choices=ROLE_CHOICES)
 
+    # Maintained by news_room.counters; see ``manage.py recount``. Indexed for
+    # news_room.timeline.large_source_ids.
+    subscriber_count = models.IntegerField(default=0, editable=False, db_index=True)
+    article_count = models.IntegerField(default=0, editable=False)
+    maintained_fields = ('subscriber_count', 'article_count')
+
     subscribed_publishers = models.ManyToManyField(
         'Publisher', blank=True, related_name='subscribed_readers'
     )
@@ -44,19 +119,50 @@ class CustomUser(AbstractUser):
         'Newsletter', blank=True, related_name='journalist_newsletters'
     )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the stored role so saves can detect role changes.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'role' in field_names:
+            instance._role_in_db = instance.role
+        return instance
+
     def save(self, *args, **kwargs):
         """
-        Assigns user to group based on role and clears incompatible fields.
+        Save the user and reconcile groups and relations on role changes.
 
-        This method ensures that role-specific associations remain exclusive.
+        Group membership follows the role, and role-specific associations
+        stay exclusive. Both are only rewritten when the user is created
+        or the role actually changes, so routine saves cost one query.
         """
+        update_fields = kwargs.get('update_fields')
+        adding = self._state.adding
+        role_changed = adding or (
+            (update_fields is None or 'role' in update_fields)
+            and self.role != getattr(self, '_role_in_db', None)
+        )
         super().save(*args, **kwargs)
+        self._role_in_db = self.role
+        if role_changed:
+            self._apply_role(adding)
+
+    def _apply_role(self, adding):
+        """
+        Put the user in their role's group and drop incompatible relations.
 
-        if self.role:
-            group, _ = Group.objects.get_or_create(name=self.role.capitalize())
-            self.groups.clear()
-            self.groups.add(group)
+        Parameters:
+            adding (bool): Whether the user was just created, in which case
+                there are no existing rows to clear.
+        """
+        group_id = role_group_id(self.role) if self.role else None
+        if adding:
+            if group_id:
+                self.groups.add(group_id)
+            return
 
+        self.groups.set([group_id] if group_id else [])
         if self.role == 'reader':
             self.published_articles.clear()
             self.published_newsletters.clear()
@@ -66,7 +172,42 @@ class CustomUser(AbstractUser):
             self.subscribed_journalists.clear()
 
 
-class Publisher(models.Model):
+def _role_group_key(name):
+    return f'role_group:{name}'
+
+
+def role_group_id(role):
+    """
+    Resolve the id of a role's group through the cache.
+
+    The groups are created by migration ``0009_role_groups``; a missing
+    one is created when its id is not cached. Saving or deleting any
+    group drops the cached ids (see ``news_room.signals``), which reaches
+    every process sharing the cache backend; with a per-process cache a
+    group deleted elsewhere is noticed after ``ROLE_GROUP_CACHE_TIMEOUT``.
+
+    Parameters:
+        role (str): Role name, e.g. ``'reader'``.
+
+    Returns:
+        int: Primary key of the ``Group`` named after the role.
+    """
+    key = _role_group_key(role.capitalize())
+    group_id = cache.get(key)
+    if group_id is None:
+        group_id = Group.objects.get_or_create(name=role.capitalize())[0].pk
+        cache.set(key, group_id, settings.ROLE_GROUP_CACHE_TIMEOUT)
+    return group_id
+
+
+def clear_role_group_cache():
+    """
+    Forget cached role group ids.
+    """
+    cache.delete_many([_role_group_key(role.capitalize()) for role, _ in ROLE_CHOICES])
+
+
+class Publisher(MaintainedFieldsMixin, models.Model):
     """
     A media organization that manages articles and newsletters.
 
@@ -74,6 +215,8 @@ class Publisher(models.Model):
         name (str): Display name of the publisher.
         editors (QuerySet): Associated editor accounts.
         journalists (QuerySet): Associated journalist accounts.
+        subscriber_count (int): Readers subscribed to this publisher.
+        journalist_count (int): Entries in ``journalists``.
     """
 
     name = models.CharField(max_length=255)
@@ -84,6 +227,12 @@ class Publisher(models.Model):
         settings.AUTH_USER_MODEL, related_name='journalist_publishers', blank=True
     )
 
+    # Maintained by news_room.counters; see ``manage.py recount``. Indexed for
+    # news_room.timeline.large_source_ids.
+    subscriber_count = models.IntegerField(default=0, editable=False, db_index=True)
+    journalist_count = models.IntegerField(default=0, editable=False)
+    maintained_fields = ('subscriber_count', 'journalist_count')
+
     def __str__(self):
         """
         Returns:
@@ -92,7 +241,7 @@ class Publisher(models.Model):
         return self.name
 
 
-class Article(models.Model):
+class Article(MaintainedFieldsMixin, models.Model):
     """
     An article authored by a journalist and reviewed by editors.
 
@@ -107,6 +256,13 @@ class Article(models.Model):
         publisher (Publisher): Publishing organization.
         created_at (datetime): Timestamp of initial creation.
         updated_at (datetime): Timestamp of last modification.
+        x_status (str): Progress of the X post, see ``X_STATUS_CHOICES``.
+        x_post_id (str): Id X assigned to the post, once published.
+        x_posted_at (datetime): Timestamp the post was published.
+        claimed_by (CustomUser): Editor reviewing the article, see ``news_room.review``.
+        claimed_until (datetime): Expiry of the editor's claim.
+        import_batch (UUID): Ingest batch that inserted the article, set only
+            on backends that cannot return bulk-inserted ids.
     """
 
     title = models.CharField(max_length=255)
@@ -122,6 +278,72 @@ class Article(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Written by the outbox with queryset updates, not by article saves.
+    x_status = models.CharField(max_length=10, choices=X_STATUS_CHOICES, blank=True)
+    x_post_id = models.CharField(max_length=32, blank=True)
+    x_posted_at = models.DateTimeField(null=True, blank=True)
+
+    # Review claims, written by news_room.review with queryset updates.
+    claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='claimed_articles',
+    )
+    claimed_until = models.DateTimeField(null=True, blank=True)
+    maintained_fields = ('x_status', 'x_post_id', 'x_posted_at', 'claimed_by', 'claimed_until')
+
+    # Token news_room.ingest uses to find the ids of a bulk insert on MySQL.
+    import_batch = models.UUIDField(null=True, blank=True, editable=False, db_index=True)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the stored approval state so saves can detect transitions.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'approved' in field_names:
+            instance._approved_in_db = instance.approved
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Save the article and record the approval state now in the database.
+
+        The save runs in a transaction so the outbox rows its ``post_save``
+        handlers queue commit or roll back together with the article. Inside
+        a caller's transaction no savepoint is taken; a failure rolls back
+        the caller's transaction as well.
+        """
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+        self._approved_in_db = self.approved
+
+    class Meta:
+        # Partial indexes match the bare ``WHERE approved`` Django emits on
+        # SQLite and PostgreSQL. MySQL ignores index conditions but compares
+        # ``approved = 1``, so the approval-state composites serve it there.
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(approved=True),
+                         name='article_approved_recent_idx'),
+            models.Index(fields=['approved', '-created_at', '-id'], name='article_approved_created_idx'),
+            models.Index(fields=['publisher', '-created_at', '-id'], name='article_publisher_recent_idx'),
+            models.Index(fields=['author', '-created_at', '-id'], name='article_author_recent_idx'),
+            models.Index(fields=['publisher', 'created_at', 'id'],
+                         condition=models.Q(approved=False) | models.Q(needs_revision=True),
+                         name='article_publisher_review_idx'),
+            models.Index(fields=['publisher', 'approved', 'needs_revision', 'created_at', 'id'],
+                         name='article_publisher_state_idx'),
+            models.Index(fields=['claimed_by', 'created_at', 'id'], name='article_claimed_idx'),
+        ]
+
+    @property
+    def was_approved(self):
+        """
+        Returns:
+            bool: Whether the article was approved when last loaded or saved.
+        """
+        return getattr(self, '_approved_in_db', False)
+
     def __str__(self):
         """
         Returns:
@@ -148,9 +370,227 @@ class Newsletter(models.Model):
     publisher = models.ForeignKey(Publisher, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='newsletter_recent_idx'),
+            models.Index(fields=['author', '-created_at', '-id'], name='newsletter_author_recent_idx'),
+        ]
+
     def __str__(self):
         """
         Returns:
             str: Title of the newsletter.
         """
         return self.title
+
+
+class SubscriberIndex(models.Model):
+    """
+    Materialized (source, reader email) pairs for notification fan-out.
+
+    Each row links a reader to one publisher or one journalist they follow.
+    Kept in sync by ``m2m_changed`` receivers when ``SUBSCRIBER_INDEX_ENABLED``
+    is set, so resolving recipients reads one narrow table instead of
+    joining both subscription tables to the user table.
+
+    Attributes:
+        publisher (Publisher): Followed publisher, or None for journalist rows.
+        journalist (CustomUser): Followed journalist, or None for publisher rows.
+        reader (CustomUser): Subscribed reader.
+        email (str): Reader's email address at the time of indexing.
+    """
+
+    publisher = models.ForeignKey(
+        Publisher, null=True, blank=True, on_delete=models.CASCADE, related_name='+'
+    )
+    journalist = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True,
+        on_delete=models.CASCADE, related_name='+'
+    )
+    reader = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+'
+    )
+    email = models.EmailField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['publisher', 'reader'], name='subindex_publisher_reader_uniq'),
+            models.UniqueConstraint(fields=['journalist', 'reader'], name='subindex_journalist_reader_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['publisher', 'email'], name='subindex_publisher_email_idx'),
+            models.Index(fields=['journalist', 'email'], name='subindex_journalist_email_idx'),
+        ]
+
+
+class TimelineEntry(models.Model):
+    """
+    An approved article in a reader's precomputed feed.
+
+    Rows are written when an article is approved (fan-out-on-write) for
+    every reader of its publisher or journalist, except sources with more
+    than ``TIMELINE_FANOUT_LIMIT`` subscribers, which are merged in at read
+    time instead.
+
+    Attributes:
+        reader (CustomUser): Reader whose feed contains the article.
+        article (Article): The approved article.
+        created_at (datetime): Copy of the article's ``created_at`` for ordering.
+    """
+
+    reader = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='timeline_entries'
+    )
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name='timeline_entries'
+    )
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['reader', 'article'], name='timeline_reader_article_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['reader', '-created_at', '-article'], name='timeline_reader_recent_idx'),
+        ]
+
+
+class RenderedFeed(models.Model):
+    """
+    A stored RSS or Atom document, re-rendered when its articles change.
+
+    Attributes:
+        key (str): ``'all'``, ``'publisher:<id>'`` or ``'journalist:<id>'``.
+        format (str): Document format, see ``FEED_FORMAT_CHOICES``.
+        content (str): The rendered XML.
+        etag (str): Quoted ETag of the encoded document.
+        rendered_at (datetime): Timestamp served as ``Last-Modified``.
+    """
+
+    key = models.CharField(max_length=40)
+    format = models.CharField(max_length=4, choices=FEED_FORMAT_CHOICES)
+    content = models.TextField()
+    etag = models.CharField(max_length=40)
+    rendered_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['key', 'format'], name='feed_key_format_uniq'),
+        ]
+
+
+class OutboxEntry(models.Model):
+    """
+    A side effect recorded in the same transaction as the change that caused it.
+
+    Entries are drained by the ``process_outbox`` management command so that
+    slow work (SMTP, X) never runs inside the request that triggered it.
+
+    Attributes:
+        kind (str): Handler to run, see ``OUTBOX_KIND_CHOICES``.
+        payload (dict): JSON arguments for the handler.
+        status (str): Delivery state, see ``OUTBOX_STATUS_CHOICES``.
+        attempts (int): Number of times a worker has tried this entry.
+        available_at (datetime): Earliest time the entry may be picked up.
+        locked_until (datetime): Lease expiry while a worker holds the entry.
+        last_error (str): Error message from the most recent failed attempt.
+        created_at (datetime): Timestamp the entry was queued.
+        processed_at (datetime): Timestamp the entry reached a final state.
+    """
+
+    kind = models.CharField(max_length=30, choices=OUTBOX_KIND_CHOICES)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=20, choices=OUTBOX_STATUS_CHOICES, default='pending'
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='outbox_status_available_idx'),
+        ]
+
+    def __str__(self):
+        """
+        Returns:
+            str: Kind and status of the entry.
+        """
+        return f"{self.kind} ({self.status})"
+
+
+class EmailDelivery(models.Model):
+    """
+    Outcome of delivering an outbox email to a single recipient.
+
+    Recipients recorded as sent or rejected are skipped when the outbox
+    entry is retried, so a partial failure never re-sends to anyone.
+
+    Attributes:
+        outbox_entry (OutboxEntry): Entry whose handler sent the email.
+        email (str): Recipient address.
+        status (str): Outcome, see ``DELIVERY_STATUS_CHOICES``.
+        error (str): Error message for rejected or failed deliveries.
+        created_at (datetime): Timestamp of the attempt.
+    """
+
+    outbox_entry = models.ForeignKey(
+        OutboxEntry, on_delete=models.CASCADE, related_name='deliveries'
+    )
+    email = models.EmailField()
+    status = models.CharField(max_length=20, choices=DELIVERY_STATUS_CHOICES)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['outbox_entry', 'status'], name='delivery_entry_status_idx'),
+        ]
+
+    def __str__(self):
+        """
+        Returns:
+            str: Recipient and delivery status.
+        """
+        return f"{self.email} ({self.status})"
+
+
+class SearchDocument(models.Model):
+    """
+    Searchable text of one approved article or one newsletter.
+
+    Rows are kept in sync by signals (see ``news_room.search``). The text
+    is indexed by an FTS5 table on SQLite and a FULLTEXT index on MySQL,
+    both created by migration ``0007_searchdocument``.
+
+    Attributes:
+        kind (str): Source model, see ``SEARCH_KIND_CHOICES``.
+        object_id (int): Primary key of the article or newsletter.
+        title (str): Copy of the source title.
+        description (str): Copy of the article description, empty for newsletters.
+        content (str): Copy of the source body.
+        created_at (datetime): Copy of the source ``created_at``.
+    """
+
+    kind = models.CharField(max_length=20, choices=SEARCH_KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+    content = models.TextField()
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='searchdoc_kind_object_uniq'),
+        ]
+
+    def __str__(self):
+        """
+        Returns:
+            str: Kind and title of the document.
+        """
+        return f"{self.kind}: {self.title}"
@@ -0,0 +1,86 @@
+"""
+Bulk moderation of articles by editors.
+
+Many articles are approved or sent back for revision with one conditional
+UPDATE. Queryset updates bypass model signals, so ``articles_moderated``
+is sent instead; its receivers in ``news_room.signals`` queue one digest
+notification for the batch, refresh the search index and invalidate
+cached responses. Moderating an article also releases its review claim
+(see ``news_room.review``).
+"""
+
+from collections import namedtuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .models import Article
+from .review import claimable_by
+
+
+MODERATION_ACTIONS = ('approve', 'revise')
+
+ModerationResult = namedtuple('ModerationResult', ['updated', 'approved', 'withdrawn'])
+ModerationResult.__doc__ = """
+Outcome of a bulk moderation action.
+
+Attributes:
+    updated (list[int]): Articles whose state was changed.
+    approved (list[int]): Articles that became approved.
+    withdrawn (list[int]): Previously approved articles sent back for revision.
+"""
+
+# Sent inside the moderation transaction with ``updated``, ``approved``
+# and ``withdrawn`` lists of article ids.
+articles_moderated = Signal()
+
+
+def moderate_articles(article_ids, action, feedback='', editor=None):
+    """
+    Approve or request revision on many articles at once.
+
+    Approving skips articles that are already approved and not flagged,
+    so a repeated request changes nothing and notifies nobody.
+
+    Parameters:
+        article_ids (Iterable[int]): Articles to moderate.
+        action (str): ``'approve'`` or ``'revise'``.
+        feedback (str): Editor feedback stored on revised articles.
+        editor (CustomUser): Editor acting, if any; articles outside their
+            publishers or claimed by another editor are skipped.
+
+    Returns:
+        ModerationResult: Ids of the articles changed by the action.
+
+    Raises:
+        ValueError: If ``action`` is unknown.
+    """
+    if action == 'approve':
+        condition = Q(approved=False) | Q(needs_revision=True)
+        changes = {'approved': True, 'needs_revision': False, 'editor_feedback': ''}
+    elif action == 'revise':
+        condition = Q()
+        changes = {'approved': False, 'needs_revision': True, 'editor_feedback': feedback}
+    else:
+        raise ValueError(f"Unknown moderation action: {action!r}")
+    if editor is not None:
+        condition &= Q(publisher__in=editor.editor_publishers.values('id')) & claimable_by(editor)
+
+    with transaction.atomic():
+        matched = Article.objects.select_for_update().filter(condition, id__in=set(article_ids))
+        was_approved = dict(matched.values_list('id', 'approved'))
+        if not was_approved:
+            return ModerationResult([], [], [])
+        Article.objects.filter(condition, id__in=was_approved).update(
+            updated_at=timezone.now(), claimed_by=None, claimed_until=None, **changes
+        )
+
+        updated = sorted(was_approved)
+        approved = [pk for pk in updated if action == 'approve' and not was_approved[pk]]
+        withdrawn = [pk for pk in updated if action == 'revise' and was_approved[pk]]
+        articles_moderated.send(
+            sender=Article, updated=updated, approved=approved, withdrawn=withdrawn
+        )
+    return ModerationResult(updated, approved, withdrawn)
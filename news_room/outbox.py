@@ -0,0 +1,626 @@
+"""
+Transactional outbox for side effects triggered by content changes.
+
+Signals only insert ``OutboxEntry`` rows, so the request that caused them
+pays for a single INSERT. A worker (``manage.py process_outbox``) claims
+due entries, runs the matching handler, and retries failures with
+exponential backoff until ``OUTBOX_MAX_ATTEMPTS`` is reached.
+
+X posts are kept off the request path even in eager mode: they run in a
+background thread there, and a dedicated worker can serve them in
+production (``process_outbox --kind article_x_post``) so a rate-limited
+X account never delays email or timeline entries.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .delivery import send_bulk
+from .models import Article, EmailDelivery, OutboxEntry
+from . import feeds, timeline, x_publisher
+from .recipients import iter_recipient_emails, recipient_articles
+
+
+# ---------- Enqueueing ----------
+
+def x_posting_enabled():
+    """
+    Check whether X credentials are configured.
+
+    Returns:
+        bool: True if every OAuth credential needed to post is set.
+    """
+    return all([
+        settings.X_API_KEY,
+        settings.X_API_SECRET,
+        settings.X_ACCESS_TOKEN,
+        settings.X_ACCESS_TOKEN_SECRET,
+    ])
+
+
+def enqueue(kind, payload):
+    """
+    Queue a side effect in the current transaction.
+
+    When ``OUTBOX_EAGER`` is enabled the entry is processed once the
+    transaction commits, which is convenient for local development
+    without a running worker.
+
+    Parameters:
+        kind (str): Handler name from ``OUTBOX_KIND_CHOICES``.
+        payload (dict): JSON arguments stored on the entry for its handler.
+
+    Returns:
+        OutboxEntry: The queued entry.
+    """
+    entry = OutboxEntry.objects.create(kind=kind, payload=payload)
+    if settings.OUTBOX_EAGER:
+        transaction.on_commit(lambda: drain_eagerly([entry.id]))
+    return entry
+
+
+def enqueue_many(kind, payloads):
+    """
+    Queue several side effects of one kind with a single INSERT.
+
+    Parameters:
+        kind (str): Handler name from ``OUTBOX_KIND_CHOICES``.
+        payloads (Iterable[dict]): One payload per entry.
+
+    Returns:
+        list[OutboxEntry]: The queued entries.
+    """
+    entries = OutboxEntry.objects.bulk_create([
+        OutboxEntry(kind=kind, payload=payload) for payload in payloads
+    ])
+    if entries and settings.OUTBOX_EAGER:
+        transaction.on_commit(lambda: drain_eagerly([entry.id for entry in entries]))
+    return entries
+
+
+def enqueue_article_approval(article):
+    """
+    Queue the subscriber email, X post, timeline fan-out and feed refresh
+    for an approved article.
+
+    Parameters:
+        article (Article): The article that was approved.
+    """
+    enqueue('article_email', {'article_id': article.id})
+    enqueue('article_timeline', {'article_id': article.id})
+    enqueue_feed_render(feeds.feed_keys([(article.publisher_id, article.author_id)]))
+    if x_posting_enabled():
+        enqueue('article_x_post', {'article_id': article.id})
+        if _mark_x_queued([article.id]):
+            article.x_status = 'queued'
+
+
+def _mark_x_queued(article_ids):
+    """
+    Flag articles as waiting for their X post, unless already posted.
+
+    Returns:
+        int: Number of articles flagged.
+    """
+    return Article.objects.filter(id__in=article_ids).exclude(x_status='posted').update(x_status='queued')
+
+
+def enqueue_feed_render(keys):
+    """
+    Queue re-rendering of syndication feeds.
+
+    Parameters:
+        keys (list[str]): Feed keys, see ``feeds.feed_key``.
+    """
+    enqueue('feed_render', {'feeds': keys})
+
+
+def enqueue_article_withdrawal(article):
+    """
+    Queue removal of a previously approved article from reader timelines
+    and feeds.
+
+    Parameters:
+        article (Article): The article that lost its approval.
+    """
+    enqueue('article_timeline', {'article_id': article.id})
+    enqueue_feed_render(feeds.feed_keys([(article.publisher_id, article.author_id)]))
+
+
+def enqueue_bulk_approval(article_ids):
+    """
+    Queue side effects for articles approved together by bulk moderation.
+
+    Subscribers get one digest for the whole batch instead of one email
+    per article and affected feeds are rendered once; timeline fan-out
+    and X posts stay per article.
+
+    Parameters:
+        article_ids (list[int]): Articles that became approved.
+    """
+    if not article_ids:
+        return
+    enqueue('article_digest', {'article_ids': list(article_ids)})
+    enqueue_many('article_timeline', [{'article_id': pk} for pk in article_ids])
+    enqueue_feed_render(feeds.feed_keys(_sources(article_ids)))
+    if x_posting_enabled():
+        enqueue_many('article_x_post', [{'article_id': pk} for pk in article_ids])
+        _mark_x_queued(article_ids)
+
+
+def enqueue_bulk_withdrawal(article_ids):
+    """
+    Queue timeline retraction and a feed refresh for articles that lost
+    their approval together.
+
+    Parameters:
+        article_ids (list[int]): Previously approved articles.
+    """
+    if not article_ids:
+        return
+    enqueue_many('article_timeline', [{'article_id': pk} for pk in article_ids])
+    enqueue_feed_render(feeds.feed_keys(_sources(article_ids)))
+
+
+def _sources(article_ids):
+    """
+    Returns:
+        set[tuple[int, int]]: Distinct (publisher id, author id) pairs of the articles.
+    """
+    return set(Article.objects.filter(id__in=article_ids).values_list('publisher_id', 'author_id'))
+
+
+# ---------- Handlers ----------
+
+def _approved_article(payload):
+    """
+    Load the article referenced by a payload if it is still publishable.
+
+    Returns:
+        Article | None: The article, or None if it was deleted or unapproved.
+    """
+    return Article.objects.select_related('author', 'publisher').filter(
+        id=payload['article_id'], approved=True, needs_revision=False
+    ).first()
+
+
+class DeliveryIncomplete(Exception):
+    """
+    Raised when some recipients of an outbox email could not be reached.
+    """
+
+
+class RetryLater(Exception):
+    """
+    Raised by a handler to reschedule its entry without using up an attempt.
+
+    Attributes:
+        available_at (datetime): Earliest time the entry may run again.
+    """
+    def __init__(self, available_at, reason=''):
+        super().__init__(reason or f"Deferred until {available_at:%Y-%m-%d %H:%M:%S}")
+        self.available_at = available_at
+
+
+class PermanentFailure(Exception):
+    """
+    Raised by a handler when retrying its entry cannot succeed.
+    """
+
+
+def _delivered(entry):
+    """
+    Returns:
+        QuerySet: Emails an earlier attempt already sent to or saw rejected.
+    """
+    return entry.deliveries.filter(status__in=['sent', 'rejected']).values('email')
+
+
+# Delivery outcomes are written at least every RECORD_BATCH recipients
+# and every RECORD_SECONDS (see ``_record``).
+RECORD_BATCH = 500
+RECORD_SECONDS = 1.0
+
+
+def _record(entry, results):
+    """
+    Store delivery outcomes in batches as they come in.
+
+    A batch is written once it holds ``RECORD_BATCH`` outcomes or is
+    ``RECORD_SECONDS`` old, and whatever is pending is written when
+    sending stops with an error, so a retry sees every recipient already
+    reached and never emails them twice.
+
+    Returns:
+        int: Number of recipients that failed with a retryable error.
+    """
+    failed = 0
+    batch = []
+
+    def flush():
+        EmailDelivery.objects.bulk_create([
+            EmailDelivery(outbox_entry=entry, email=r.email, status=r.status, error=r.error)
+            for r in batch
+        ])
+        batch.clear()
+
+    try:
+        for result in results:
+            if not batch:
+                started = time.monotonic()
+            batch.append(result)
+            if result.status == 'failed':
+                failed += 1
+            if len(batch) >= RECORD_BATCH or time.monotonic() - started >= RECORD_SECONDS:
+                flush()
+    finally:
+        if batch:
+            flush()
+    return failed
+
+
+def _announcement(articles):
+    """
+    Returns:
+        tuple[str, str]: Subject and body announcing one or more articles.
+    """
+    if len(articles) == 1:
+        article = articles[0]
+        return f"New Article: {article.title}", (
+            f"{article.description}\n\n"
+            f"Read more at: {settings.SITE_URL}/article/{article.id}/"
+        )
+    lines = [
+        f"- {article.title} ({article.author.username}, {article.publisher.name})\n"
+        f"  {settings.SITE_URL}/article/{article.id}/"
+        for article in articles
+    ]
+    return f"{len(articles)} new articles", "\n".join(lines)
+
+
+def send_article_email(entry):
+    """
+    Email all subscribers of the article's publisher and journalist.
+
+    Each recipient gets an individual message over one SMTP session.
+    Outcomes are stored as ``EmailDelivery`` rows in batches; recipients
+    already sent or rejected by an earlier attempt are skipped.
+
+    Raises:
+        DeliveryIncomplete: If any recipient failed with a retryable error.
+    """
+    article = _approved_article(entry.payload)
+    if article is None:
+        return
+
+    subject, message = _announcement([article])
+    recipients = iter_recipient_emails(article, exclude=_delivered(entry))
+    failed = _record(entry, send_bulk(subject, message, recipients))
+    if failed:
+        raise DeliveryIncomplete(f"{failed} recipients failed, will retry")
+
+
+# A digest audience is sent once it has gathered DIGEST_BATCH recipients.
+DIGEST_BATCH = 500
+
+
+def send_article_digest(entry):
+    """
+    Email every subscriber once about all the articles of a bulk approval.
+
+    Recipients are grouped by the exact set of articles they follow, so
+    a message is composed once per distinct audience rather than once per
+    reader or per article. Recipients stream in email order and each
+    audience is sent every ``DIGEST_BATCH`` addresses, so memory does not
+    grow with the number of subscribers.
+
+    Raises:
+        DeliveryIncomplete: If any recipient failed with a retryable error.
+    """
+    articles = Article.objects.select_related('author', 'publisher').filter(
+        id__in=entry.payload['article_ids'], approved=True, needs_revision=False
+    ).defer('content').order_by('-created_at', '-id')
+    articles = {article.id: article for article in articles}
+    if not articles:
+        return
+
+    failed = 0
+    messages, audiences = {}, {}
+
+    def send(article_ids):
+        if article_ids not in messages:
+            messages[article_ids] = _announcement([a for pk, a in articles.items() if pk in article_ids])
+        subject, message = messages[article_ids]
+        return _record(entry, send_bulk(subject, message, audiences.pop(article_ids)))
+
+    for email, article_ids in recipient_articles(articles.values(), exclude=_delivered(entry)):
+        article_ids = frozenset(article_ids)
+        audiences.setdefault(article_ids, []).append(email)
+        if len(audiences[article_ids]) >= DIGEST_BATCH:
+            failed += send(article_ids)
+    for article_ids in list(audiences):
+        failed += send(article_ids)
+    if failed:
+        raise DeliveryIncomplete(f"{failed} recipients failed, will retry")
+
+
+def _set_x_status(article, status, **fields):
+    Article.objects.filter(id=article.id).update(x_status=status, **fields)
+
+
+def post_article_to_x(entry):
+    """
+    Publish an approved article to X and record the outcome on the article.
+
+    Articles already posted are skipped, so a retried entry never posts
+    twice. A rate limit defers the entry until the window resets, spread
+    out by up to ``OUTBOX_BASE_BACKOFF`` seconds of jitter, without using
+    up an attempt.
+
+    Raises:
+        RetryLater: If X's rate limit is exhausted.
+        PermanentFailure: If X rejected the post, or did not answer a post
+            it may have published.
+    """
+    article = _approved_article(entry.payload)
+    if article is None or article.x_status == 'posted':
+        return
+
+    text = (f"{article.title} by {article.author.username}\n"
+            f"Read: {settings.SITE_URL}/article/{article.id}/")
+    try:
+        post_id = x_publisher.get_publisher().post(text)
+    except x_publisher.XRateLimited as e:
+        # A stale or skewed reset time must not make the entry due at once,
+        # or drain() would re-claim it and call X in a tight loop.
+        resume = max(datetime.fromtimestamp(e.reset_at, dt_timezone.utc),
+                     timezone.now() + timedelta(seconds=settings.OUTBOX_BASE_BACKOFF))
+        raise RetryLater(resume + timedelta(seconds=random.uniform(0, settings.OUTBOX_BASE_BACKOFF)), str(e))
+    except (x_publisher.XRejected, x_publisher.XOutcomeUnknown) as e:
+        # Retrying an unanswered post could publish it twice.
+        _set_x_status(article, 'failed')
+        raise PermanentFailure(str(e)) from e
+    except Exception:
+        if entry.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            _set_x_status(article, 'failed')
+        raise
+    _set_x_status(article, 'posted', x_post_id=post_id, x_posted_at=timezone.now())
+
+
+def update_article_timeline(entry):
+    """
+    Fan an approved article out to reader timelines, or retract it.
+
+    The article's current state decides the direction, so the handler is
+    safe to run late or more than once.
+    """
+    article = _approved_article(entry.payload)
+    if article is None:
+        article = Article.objects.filter(id=entry.payload['article_id']).first()
+        if article is not None:
+            timeline.retract(article)
+        return
+    timeline.fan_out(article)
+
+
+def render_feeds(entry):
+    """
+    Re-render the feeds named in the payload from current article state.
+    """
+    feeds.refresh(entry.payload['feeds'])
+
+
+HANDLERS = {
+    'article_email': send_article_email,
+    'article_x_post': post_article_to_x,
+    'article_timeline': update_article_timeline,
+    'article_digest': send_article_digest,
+    'feed_render': render_feeds,
+}
+
+# Kinds that call slow or rate-limited third parties.
+BACKGROUND_KINDS = ('article_x_post',)
+
+
+# ---------- Worker ----------
+
+def backoff_delay(attempts):
+    """
+    Compute the delay before the next attempt of a failed entry.
+
+    Parameters:
+        attempts (int): Number of attempts made so far (1 or more).
+
+    Returns:
+        timedelta: Exponential delay with up to 10% random jitter, capped
+        at ``OUTBOX_MAX_BACKOFF`` seconds.
+    """
+    delay = min(settings.OUTBOX_BASE_BACKOFF * 2 ** (attempts - 1), settings.OUTBOX_MAX_BACKOFF)
+    return timedelta(seconds=delay + random.uniform(0, delay * 0.1))
+
+
+def claim_batch(batch_size, kinds=None, ids=None):
+    """
+    Lease up to ``batch_size`` due entries to this worker.
+
+    Entries left in ``processing`` by a crashed worker become claimable
+    again once their lease expires. Rows are locked with SKIP LOCKED on
+    backends that support it so concurrent workers never share an entry.
+
+    Parameters:
+        batch_size (int): Maximum number of entries to claim.
+        kinds (Iterable[str]): Only claim entries of these kinds.
+        ids (Iterable[int]): Only claim these entries.
+
+    Returns:
+        list[OutboxEntry]: The claimed entries.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        due = OutboxEntry.objects.select_for_update(skip_locked=True).filter(
+            Q(status='pending', available_at__lte=now)
+            | Q(status='processing', locked_until__lt=now)
+        ).order_by('available_at', 'id')
+        if kinds is not None:
+            due = due.filter(kind__in=list(kinds))
+        if ids is not None:
+            due = due.filter(id__in=list(ids))
+        entries = list(due[:batch_size])
+        OutboxEntry.objects.filter(id__in=[e.id for e in entries]).update(
+            status='processing',
+            locked_until=now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS),
+        )
+    return entries
+
+
+def process_entry(entry):
+    """
+    Run the handler for one claimed entry and record the outcome.
+
+    Parameters:
+        entry (OutboxEntry): A claimed entry.
+
+    Returns:
+        bool: True if the handler succeeded.
+    """
+    entry.attempts += 1
+    try:
+        HANDLERS[entry.kind](entry)
+    except RetryLater as e:
+        entry.attempts -= 1
+        entry.status = 'pending'
+        entry.available_at = e.available_at
+        entry.last_error = str(e)
+        succeeded = False
+    except Exception as e:
+        entry.last_error = f"{type(e).__name__}: {e}"
+        if isinstance(e, PermanentFailure) or entry.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            entry.status = 'failed'
+            entry.processed_at = timezone.now()
+        else:
+            entry.status = 'pending'
+            entry.available_at = timezone.now() + backoff_delay(entry.attempts)
+        succeeded = False
+    else:
+        entry.status = 'done'
+        entry.last_error = ''
+        entry.processed_at = timezone.now()
+        succeeded = True
+    entry.locked_until = None
+    entry.save(update_fields=[
+        'attempts', 'status', 'last_error', 'available_at', 'locked_until', 'processed_at'
+    ])
+    return succeeded
+
+
+def _process_in_thread(entry):
+    """
+    Process an entry from a pool thread and release its DB connection.
+    """
+    try:
+        return process_entry(entry)
+    finally:
+        close_old_connections()
+
+
+def drain(batch_size=100, concurrency=1, kinds=None, ids=None):
+    """
+    Process due entries until none are left.
+
+    Parameters:
+        batch_size (int): Entries claimed per round trip.
+        concurrency (int): Number of entries handled in parallel threads.
+        kinds (Iterable[str]): Only process entries of these kinds.
+        ids (Iterable[int]): Only process these entries.
+
+    Returns:
+        tuple[int, int]: Count of succeeded and failed attempts.
+    """
+    succeeded = failed = 0
+    pool = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    try:
+        while True:
+            entries = claim_batch(batch_size, kinds, ids)
+            if not entries:
+                break
+            if pool:
+                results = list(pool.map(_process_in_thread, entries))
+            else:
+                results = [process_entry(entry) for entry in entries]
+            succeeded += results.count(True)
+            failed += results.count(False)
+    finally:
+        if pool:
+            pool.shutdown()
+    return succeeded, failed
+
+
+# Entries waiting for the background drain, and whether its thread runs.
+_background_ids = []
+_background_lock = threading.Lock()
+_background_running = False
+
+
+def _drain_in_background():
+    global _background_running
+    try:
+        while True:
+            with _background_lock:
+                ids = _background_ids[:]
+                _background_ids.clear()
+                if not ids:
+                    _background_running = False
+                    return
+            drain(kinds=BACKGROUND_KINDS, ids=ids)
+    except BaseException:
+        with _background_lock:
+            _background_running = False
+        raise
+    finally:
+        close_old_connections()
+
+
+def _start_background_drain(ids):
+    """
+    Drain the given ``BACKGROUND_KINDS`` entries in a daemon thread.
+
+    A running thread picks them up instead of a second one starting.
+
+    Parameters:
+        ids (list[int]): Pending background entries.
+    """
+    global _background_running
+    with _background_lock:
+        _background_ids.extend(ids)
+        if _background_running:
+            return
+        _background_running = True
+    threading.Thread(target=_drain_in_background, daemon=True).start()
+
+
+def drain_eagerly(ids):
+    """
+    Process the entries a transaction queued, once it commits, when
+    ``OUTBOX_EAGER`` is enabled.
+
+    Only those entries run, so a request never works through a backlog
+    left by others. Entries of ``BACKGROUND_KINDS`` are left to a
+    background thread so the request that committed does not wait for X.
+
+    Parameters:
+        ids (list[int]): Entries queued by the committed transaction.
+    """
+    drain(kinds=[kind for kind in HANDLERS if kind not in BACKGROUND_KINDS], ids=ids)
+    background = list(OutboxEntry.objects.filter(
+        id__in=ids, kind__in=BACKGROUND_KINDS, status='pending'
+    ).values_list('id', flat=True))
+    if background:
+        _start_background_drain(background)
@@ -0,0 +1,254 @@
+"""
+Keyset (cursor) pagination for list views and API endpoints.
+
+Pages are ordered newest first by ``(created_at, id)``, or oldest first
+for queues, and each cursor encodes the sort key of the last row
+served. The next page is fetched with a range condition on an index
+instead of an OFFSET, so page cost stays flat no matter how deep a
+client scrolls.
+
+A page merged from several followed sources (publishers, journalists,
+a reader's timeline) is also bounded below: no page reaches past the
+``page_size + 1``-th row of any single source, so each source is
+range-scanned on its own composite index instead of every row of every
+source being sorted.
+"""
+
+import base64
+import json
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db.models import F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class InvalidCursor(ValueError):
+    """
+    Raised when a cursor token cannot be decoded.
+    """
+
+
+def encode_cursor(created_at, pk):
+    """
+    Encode a sort key as an opaque URL-safe token.
+
+    Parameters:
+        created_at (datetime): Timestamp of the last row served.
+        pk (int): Primary key of the last row served.
+
+    Returns:
+        str: Cursor token.
+    """
+    raw = json.dumps([created_at.isoformat(), pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Decode a token produced by ``encode_cursor``.
+
+    Parameters:
+        token (str): Cursor token from the query string.
+
+    Returns:
+        tuple[datetime, int]: The encoded sort key.
+
+    Raises:
+        InvalidCursor: If the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        created_at, pk = json.loads(raw)
+        created_at = parse_datetime(created_at)
+        if created_at is None or not isinstance(pk, int):
+            raise ValueError(token)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor(token) from e
+    return created_at, pk
+
+
+def _sort_value(item, field):
+    return item[field] if isinstance(item, dict) else getattr(item, field)
+
+
+def _after_cursor(queryset, cursor, fields, oldest_first=False):
+    """
+    Order a queryset newest (or oldest) first and skip rows up to a cursor.
+    """
+    timestamp, tie_breaker = fields
+    sign, lookup = ('', 'gt') if oldest_first else ('-', 'lt')
+    queryset = queryset.order_by(f'{sign}{timestamp}', f'{sign}{tie_breaker}')
+    if cursor:
+        last_timestamp, last_pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(**{f'{timestamp}__{lookup}': last_timestamp})
+            | Q(**{timestamp: last_timestamp, f'{tie_breaker}__{lookup}': last_pk})
+        )
+    return queryset
+
+
+def _within_sources(queryset, cursor, page_size, fields, oldest_first, sources):
+    """
+    Bound a page merged from several sources by its furthest possible row.
+
+    Each source alone fills a page with its first ``page_size + 1`` rows
+    after the cursor, so the page ends no further out than the nearest of
+    those per-source limits. A single bound is an uncorrelated subquery, so
+    the page stays one query and the planner treats it as a range constant.
+    Rows matched by an OR of several sources are only range-scanned per
+    source against a literal bound, so their bounds are read first.
+    """
+    if not sources:
+        return queryset
+    timestamp = fields[0]
+    bounds = []
+    for rows, source_field in sources:
+        nth = _after_cursor(queryset.filter(**{source_field: OuterRef('pk')}), cursor, fields, oldest_first)
+        nth = nth.values(timestamp)[page_size:page_size + 1]
+        order = F('nth').asc(nulls_last=True) if oldest_first else F('nth').desc(nulls_last=True)
+        bounds.append(rows.annotate(nth=Subquery(nth)).order_by(order).values_list('nth', flat=True)[:1])
+    lookup = 'lte' if oldest_first else 'gte'
+    if len(bounds) > 1:
+        values = [value for bound in bounds for value in bound if value is not None]
+        if not values:
+            return queryset
+        return queryset.filter(**{f'{timestamp}__{lookup}': (min if oldest_first else max)(values)})
+    # Sources with no more than a page of rows leave the page unbounded.
+    unbounded = datetime.max if oldest_first else datetime.min
+    return queryset.filter(**{f'{timestamp}__{lookup}': Coalesce(
+        Subquery(bounds[0]), Value(unbounded.replace(tzinfo=timezone.utc)),
+    )})
+
+
+def _page(items, page_size, fields):
+    """
+    Trim one extra fetched row off a page and build the next cursor from it.
+    """
+    if len(items) <= page_size:
+        return items, None
+    items = items[:page_size]
+    last = items[-1]
+    timestamp, tie_breaker = fields
+    return items, encode_cursor(_sort_value(last, timestamp), _sort_value(last, tie_breaker))
+
+
+def paginate_keyset(queryset, cursor=None, page_size=20, fields=('created_at', 'id'), oldest_first=False,
+                    sources=None):
+    """
+    Fetch one newest-first page of a queryset after a cursor.
+
+    Parameters:
+        queryset (QuerySet): Rows to paginate; any ordering is replaced.
+        cursor (str): Token from a previous page, or None for the first page.
+        page_size (int): Maximum number of rows to return.
+        fields (tuple[str, str]): Timestamp and tie-breaker field names.
+        oldest_first (bool): Page in ascending order instead.
+        sources (list[tuple[QuerySet, str]] | None): Followed sources the
+            rows come from, each with the field of ``queryset`` pointing at
+            them; bounds the page per source (see module docstring).
+
+    Returns:
+        tuple[list, str | None]: The page and the cursor for the next page,
+        or None when this is the last page.
+
+    Raises:
+        InvalidCursor: If ``cursor`` is malformed.
+    """
+    queryset = _within_sources(queryset, cursor, page_size, fields, oldest_first, sources)
+    queryset = _after_cursor(queryset, cursor, fields, oldest_first)
+    return _page(list(queryset[:page_size + 1]), page_size, fields)
+
+
+async def apaginate_keyset(queryset, cursor=None, page_size=20, fields=('created_at', 'id'), sources=None):
+    """
+    Async version of ``paginate_keyset`` using the async ORM interface.
+
+    Several ``sources`` have their bounds read synchronously (see
+    ``_within_sources``), so async callers pass at most one.
+    """
+    queryset = _within_sources(queryset, cursor, page_size, fields, False, sources)
+    queryset = _after_cursor(queryset, cursor, fields)
+    return _page([item async for item in queryset[:page_size + 1]], page_size, fields)
+
+
+def clamp_page_size(value, default=None):
+    """
+    Parse a requested page size and clamp it to ``API_MAX_PAGE_SIZE``.
+
+    Parameters:
+        value (str | None): Raw value from the query string.
+        default (int): Size used when the value is missing or invalid.
+
+    Returns:
+        int: Page size between 1 and ``API_MAX_PAGE_SIZE``.
+    """
+    default = default or api_settings.PAGE_SIZE
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        size = default
+    return max(1, min(size, settings.API_MAX_PAGE_SIZE))
+
+
+class KeysetPagination(BasePagination):
+    """
+    DRF pagination class backed by ``paginate_keyset``.
+
+    Clients follow the ``next`` link; ``page_size`` may be requested up to
+    ``API_MAX_PAGE_SIZE``. Views listing rows of followed sources provide
+    them through ``get_keyset_sources()``.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    fields = ('created_at', 'id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns:
+            list: Rows for the requested page.
+        """
+        self.request = request
+        page_size = clamp_page_size(request.query_params.get(self.page_size_query_param))
+        sources = view.get_keyset_sources() if hasattr(view, 'get_keyset_sources') else None
+        try:
+            page, self.next_cursor = paginate_keyset(
+                queryset, request.query_params.get(self.cursor_query_param),
+                page_size, fields=getattr(view, 'keyset_fields', self.fields), sources=sources,
+            )
+        except InvalidCursor:
+            raise NotFound("Invalid cursor")
+        return page
+
+    def get_next_link(self):
+        """
+        Returns:
+            str | None: Absolute URL of the next page.
+        """
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        """
+        Returns:
+            Response: ``{'next': ..., 'results': [...]}``.
+        """
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,203 @@
+"""
+Recipient resolution for article notifications.
+
+Readers follow publishers and journalists through two M2M tables. These
+helpers resolve the union of both audiences as a single query and keep
+the optional ``SubscriberIndex`` table in step with subscription changes.
+"""
+
+from itertools import groupby
+from operator import itemgetter
+
+from django.conf import settings
+from django.db.models import F, Q, Value
+
+from .models import CustomUser, SubscriberIndex
+
+
+PublisherSubscription = CustomUser.subscribed_publishers.through
+JournalistSubscription = CustomUser.subscribed_journalists.through
+
+
+def subscriber_filter(publisher_id, author_id, field='id'):
+    """
+    Build a filter matching readers of a publisher or a journalist.
+
+    Both sides are subqueries on the through tables, so the result is
+    one SQL statement no matter how large either audience is.
+
+    Parameters:
+        publisher_id (int): Publisher whose readers to match.
+        author_id (int): Journalist whose readers to match.
+        field (str): Lookup path to the reader id on the filtered model.
+
+    Returns:
+        Q: Filter on ``field`` for the union of both audiences.
+    """
+    return Q(**{f'{field}__in': PublisherSubscription.objects.filter(
+        publisher_id=publisher_id
+    ).values('customuser_id')}) | Q(**{f'{field}__in': JournalistSubscription.objects.filter(
+        to_customuser_id=author_id
+    ).values('from_customuser_id')})
+
+
+def recipient_emails(article, exclude=None):
+    """
+    Query the distinct email addresses subscribed to an article's sources.
+
+    Reads from ``SubscriberIndex`` when ``SUBSCRIBER_INDEX_ENABLED`` is set,
+    otherwise from the through tables joined to the user table.
+
+    Parameters:
+        article (Article): Article being announced.
+        exclude (QuerySet): Optional ``values('email')`` queryset to skip.
+
+    Returns:
+        QuerySet: Flat, sorted, distinct email strings.
+    """
+    if settings.SUBSCRIBER_INDEX_ENABLED:
+        emails = SubscriberIndex.objects.filter(
+            Q(publisher_id=article.publisher_id) | Q(journalist_id=article.author_id)
+        )
+    else:
+        emails = CustomUser.objects.filter(
+            subscriber_filter(article.publisher_id, article.author_id)
+        )
+    emails = emails.exclude(email='')
+    if exclude is not None:
+        emails = emails.exclude(email__in=exclude)
+    return emails.order_by('email').values_list('email', flat=True).distinct()
+
+
+def iter_recipient_emails(article, exclude=None, chunk_size=2000):
+    """
+    Stream recipient emails with bounded memory.
+
+    Parameters:
+        article (Article): Article being announced.
+        exclude (QuerySet): Optional ``values('email')`` queryset to skip.
+        chunk_size (int): Rows fetched from the cursor per round trip.
+
+    Returns:
+        Iterator[str]: Distinct email addresses.
+    """
+    return recipient_emails(article, exclude).iterator(chunk_size=chunk_size)
+
+
+def recipient_articles(articles, exclude=None, chunk_size=2000):
+    """
+    Stream the recipients of several articles grouped by email address.
+
+    Subscriptions are read once per source rather than once per article:
+    publisher and journalist subscriptions are combined with one
+    ``UNION ALL`` ordered by email, so each address arrives as one run of
+    rows and its articles are yielded as soon as the next address starts.
+    Memory stays bounded by one address rather than the whole audience.
+
+    Parameters:
+        articles (Iterable[Article]): Articles being announced together.
+        exclude (QuerySet): Optional ``values('email')`` queryset to skip.
+        chunk_size (int): Rows fetched from the cursor per round trip.
+
+    Yields:
+        tuple[str, set[int]]: Each email address, in order, with the ids
+        of the articles it should hear about.
+    """
+    by_source = [{}, {}]
+    for article in articles:
+        by_source[0].setdefault(article.publisher_id, set()).add(article.id)
+        by_source[1].setdefault(article.author_id, set()).add(article.id)
+
+    if settings.SUBSCRIBER_INDEX_ENABLED:
+        sources = [
+            (SubscriberIndex.objects.filter(publisher_id__in=by_source[0]), 'email', 'publisher_id'),
+            (SubscriberIndex.objects.filter(journalist_id__in=by_source[1]), 'email', 'journalist_id'),
+        ]
+    else:
+        sources = [
+            (PublisherSubscription.objects.filter(publisher_id__in=by_source[0]),
+             'customuser__email', 'publisher_id'),
+            (JournalistSubscription.objects.filter(to_customuser_id__in=by_source[1]),
+             'from_customuser__email', 'to_customuser_id'),
+        ]
+
+    queries = []
+    for kind, (rows, email_field, source_field) in enumerate(sources):
+        rows = rows.exclude(**{email_field: ''})
+        if exclude is not None:
+            rows = rows.exclude(**{f'{email_field}__in': exclude})
+        queries.append(rows.annotate(
+            recipient=F(email_field), kind=Value(kind), source=F(source_field),
+        ).values_list('recipient', 'kind', 'source'))
+    rows = queries[0].union(queries[1], all=True).order_by('recipient')
+
+    for email, group in groupby(rows.iterator(chunk_size=chunk_size), key=itemgetter(0)):
+        article_ids = set()
+        for _, kind, source_id in group:
+            article_ids |= by_source[kind][source_id]
+        yield email, article_ids
+
+
+# ---------- Subscriber index maintenance ----------
+
+def index_publisher_subscriptions(pairs):
+    """
+    Add index rows for (reader id, publisher id) pairs.
+
+    Parameters:
+        pairs (Iterable[tuple[int, int]]): Reader and publisher ids.
+    """
+    _index(pairs, 'publisher_id')
+
+
+def index_journalist_subscriptions(pairs):
+    """
+    Add index rows for (reader id, journalist id) pairs.
+
+    Parameters:
+        pairs (Iterable[tuple[int, int]]): Reader and journalist ids.
+    """
+    _index(pairs, 'journalist_id')
+
+
+def _index(pairs, source_field):
+    pairs = list(pairs)
+    if not pairs:
+        return
+    emails = dict(CustomUser.objects.filter(
+        id__in={reader_id for reader_id, _ in pairs}
+    ).values_list('id', 'email'))
+    SubscriberIndex.objects.bulk_create([
+        SubscriberIndex(reader_id=reader_id, email=emails.get(reader_id, ''),
+                        **{source_field: source_id})
+        for reader_id, source_id in pairs
+    ], ignore_conflicts=True)
+
+
+def rebuild_subscriber_index(batch_size=5000):
+    """
+    Recreate ``SubscriberIndex`` from the subscription tables.
+
+    Parameters:
+        batch_size (int): Rows inserted per ``bulk_create`` call.
+
+    Returns:
+        int: Number of index rows written.
+    """
+    SubscriberIndex.objects.all().delete()
+    written = 0
+    sources = [
+        (PublisherSubscription.objects.values_list(
+            'customuser_id', 'publisher_id', 'customuser__email'), 'publisher_id'),
+        (JournalistSubscription.objects.values_list(
+            'from_customuser_id', 'to_customuser_id', 'from_customuser__email'), 'journalist_id'),
+    ]
+    for rows, source_field in sources:
+        batch = []
+        for reader_id, source_id, email in rows.iterator(chunk_size=batch_size):
+            batch.append(SubscriberIndex(reader_id=reader_id, email=email, **{source_field: source_id}))
+            if len(batch) >= batch_size:
+                written += len(SubscriberIndex.objects.bulk_create(batch))
+                batch = []
+        written += len(SubscriberIndex.objects.bulk_create(batch))
+    return written
@@ -0,0 +1,146 @@
+"""
+Claimable review queue for editors.
+
+An editor reviews only the articles of publishers they edit. Before
+acting on articles an editor claims them: the claim selects rows with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so editors claiming the next batch
+at the same moment each receive different articles instead of waiting on
+one another. A claim is a lease of ``REVIEW_CLAIM_SECONDS``; articles left
+in an abandoned tab return to the queue once it lapses, and claiming them
+again renews it. Moderation clears the claim (see ``news_room.moderation``).
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Article
+
+
+CLAIM_ACTIONS = ('claim', 'claim_next', 'release')
+
+
+def needs_review():
+    """
+    Returns:
+        Q: Articles awaiting approval or flagged for revision.
+    """
+    return Q(approved=False) | Q(needs_revision=True)
+
+
+def unclaimed(now=None):
+    """
+    Returns:
+        Q: Articles without a live claim at ``now``.
+    """
+    now = now or timezone.now()
+    return Q(claimed_until__isnull=True) | Q(claimed_until__lte=now)
+
+
+def claimable_by(editor, now=None):
+    """
+    Returns:
+        Q: Articles ``editor`` may act on: unclaimed or claimed by them.
+    """
+    return unclaimed(now) | Q(claimed_by=editor)
+
+
+def editable_articles(editor):
+    """
+    Articles of the publishers ``editor`` edits.
+
+    The publisher ids are fetched up front: against a literal id list the
+    planner walks ``article_publisher_review_idx`` in queue order, while an
+    ``IN (subquery)`` makes it sort the whole backlog before taking a page.
+
+    Returns:
+        QuerySet: Articles in any state.
+    """
+    return Article.objects.filter(publisher_id__in=list(editor.editor_publishers.values_list('id', flat=True)))
+
+
+def review_queue(editor):
+    """
+    Articles ``editor`` can review, whether claimed or not.
+
+    Returns:
+        QuerySet: Pending and flagged articles of the editor's publishers.
+    """
+    return editable_articles(editor).filter(needs_review())
+
+
+def held_claims(editor, now=None):
+    """
+    Articles of ``editor``'s review queue under a live claim of theirs.
+
+    Unlike ``editable_articles`` the publishers are matched by subquery:
+    against a literal id list the planner walks the publisher's whole
+    backlog in queue order instead of reading ``article_claimed_idx``.
+
+    Returns:
+        QuerySet: Pending and flagged articles claimed by ``editor``.
+    """
+    now = now or timezone.now()
+    return Article.objects.filter(
+        needs_review(), claimed_by=editor, claimed_until__gt=now,
+        publisher__in=editor.editor_publishers.all(),
+    )
+
+
+def claim_articles(editor, article_ids=None, limit=None):
+    """
+    Claim articles for ``editor``, renewing claims they already hold.
+
+    Rows locked by a concurrent claim are skipped rather than waited on.
+    Backends without row locks (SQLite) serialize writers instead; the
+    conditional UPDATE keeps them from taking over a live claim.
+
+    Parameters:
+        editor (CustomUser): Editor taking the articles.
+        article_ids (Iterable[int] | None): Articles to claim, in any state;
+            the oldest unclaimed queue articles when omitted.
+        limit (int): Articles claimed when ``article_ids`` is omitted,
+            ``REVIEW_CLAIM_BATCH`` by default.
+
+    Returns:
+        list[int]: Ids now claimed by ``editor``. Requested articles held
+        by another editor or outside the editor's publishers are left out.
+    """
+    now = timezone.now()
+    if article_ids is None:
+        candidates = review_queue(editor).filter(unclaimed(now)).order_by('created_at', 'id')
+        candidates = candidates[:limit or settings.REVIEW_CLAIM_BATCH]
+    else:
+        candidates = editable_articles(editor).filter(claimable_by(editor, now), id__in=set(article_ids))
+
+    until = now + timedelta(seconds=settings.REVIEW_CLAIM_SECONDS)
+    with transaction.atomic():
+        ids = list(candidates.select_for_update(skip_locked=True).values_list('id', flat=True))
+        if not ids:
+            return []
+        Article.objects.filter(claimable_by(editor, now), id__in=ids).update(
+            claimed_by=editor, claimed_until=until
+        )
+        return sorted(Article.objects.filter(id__in=ids, claimed_by=editor, claimed_until=until)
+                      .values_list('id', flat=True))
+
+
+def release_claims(editor, article_ids=None):
+    """
+    Return articles claimed by ``editor`` to the queue.
+
+    Parameters:
+        editor (CustomUser): Editor holding the claims.
+        article_ids (Iterable[int] | None): Articles to release, or all of
+            the editor's claims when omitted.
+
+    Returns:
+        int: Number of claims released.
+    """
+    claimed = Article.objects.filter(claimed_by=editor)
+    if article_ids is not None:
+        claimed = claimed.filter(id__in=set(article_ids))
+    return claimed.update(claimed_by=None, claimed_until=None)
@@ -0,0 +1,183 @@
+"""
+Database router that sends request reads to read replicas.
+
+Replica aliases are listed in ``DATABASE_REPLICAS``. Reads go to a replica
+only inside ``replica_reads()``, which ``ReplicaRoutingMiddleware`` enters
+for safe requests of clients that have not written recently; workers,
+commands and writes always use the primary. Once a block writes, its
+later reads go to the primary too, so a request always sees its own
+changes. Sessions are always read from the primary because they are
+written on login.
+
+Each block picks one replica and reads everything from it, so the rows,
+related rows and counts of one response share the same replication lag.
+A replica that cannot be reached is skipped for ``REPLICA_RETRY_SECONDS``;
+reads fall back to the primary when none is available or the block's
+replica fails.
+
+Responses cached under a content version are rendered inside
+``primary_reads()``: a write bumps the version at once, and a replica
+that has not caught up would otherwise fill the new version with stale
+rows for the whole cache timeout.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+# App labels whose reads must see the latest writes.
+PRIMARY_ONLY_APPS = ('sessions',)
+
+# Routing state of the current request: None outside ``replica_reads()``,
+# else a dict recording whether the request wrote and the replica it reads.
+_routing = ContextVar('replica_routing', default=None)
+
+_down_until = {}
+_lock = threading.Lock()
+
+
+@contextmanager
+def replica_reads():
+    """
+    Route reads in the enclosed block to replicas until it writes.
+
+    Yields:
+        dict: Routing state; ``wrote`` is set once the block writes,
+        ``replica`` names the alias chosen by its first read and
+        ``primary`` is set inside ``primary_reads()``.
+    """
+    state = {'wrote': False, 'replica': None, 'primary': False}
+    token = _routing.set(state)
+    try:
+        yield state
+    finally:
+        _routing.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Read from the primary in the enclosed block, even inside ``replica_reads()``.
+
+    Used when building entries stored under a cache version, which must
+    not capture rows a replica has yet to receive.
+    """
+    state = _routing.get()
+    if state is None:
+        yield
+        return
+    previous = state['primary']
+    state['primary'] = True
+    try:
+        yield
+    finally:
+        state['primary'] = previous
+
+
+def mark_unavailable(alias):
+    """
+    Skip a replica for ``REPLICA_RETRY_SECONDS``.
+
+    Parameters:
+        alias (str): Replica database alias.
+    """
+    with _lock:
+        _down_until[alias] = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+
+
+def reset_availability():
+    """
+    Forget every replica marked unavailable.
+    """
+    with _lock:
+        _down_until.clear()
+
+
+def _available(alias):
+    """
+    Check that a replica is not marked down and accepts a connection.
+    """
+    with _lock:
+        if _down_until.get(alias, 0) > time.monotonic():
+            return False
+    try:
+        connections[alias].ensure_connection()
+    except DatabaseError:
+        mark_unavailable(alias)
+        return False
+    return True
+
+
+def choose_replica():
+    """
+    Pick an available replica at random.
+
+    Returns:
+        str: Replica alias, or the primary alias if none is available.
+    """
+    replicas = list(settings.DATABASE_REPLICAS)
+    random.shuffle(replicas)
+    for alias in replicas:
+        if _available(alias):
+            return alias
+    return DEFAULT_DB_ALIAS
+
+
+class ReplicaRouter:
+    """
+    Read from replicas inside ``replica_reads()``, write to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        """
+        Returns:
+            str | None: A replica alias, or None to use the primary.
+        """
+        state = _routing.get()
+        if state is None or state['wrote'] or state['primary'] or not settings.DATABASE_REPLICAS:
+            return None
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # Reads in a transaction belong with its writes.
+            return None
+        alias = state['replica']
+        if alias is None:
+            alias = state['replica'] = choose_replica()
+        elif alias != DEFAULT_DB_ALIAS and not _available(alias):
+            # Another replica may lag differently; finish on the primary.
+            alias = state['replica'] = DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        """
+        Returns:
+            str: The primary alias; later reads in the request follow it.
+        """
+        state = _routing.get()
+        if state is not None and model._meta.app_label not in PRIMARY_ONLY_APPS:
+            state['wrote'] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """
+        Allow relations between objects loaded from the primary or any replica.
+        """
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        Replicas receive schema changes through replication.
+        """
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
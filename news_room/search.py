@@ -0,0 +1,211 @@
+"""
+Full-text search over approved articles and newsletters.
+
+Searchable text is copied into ``SearchDocument`` rows by signals. On
+SQLite those rows feed an external-content FTS5 table through triggers;
+on MySQL they carry a FULLTEXT index. Both rank matches by relevance and
+touch only the inverted index, never scanning article bodies. Every
+match is ranked; the page is cut with LIMIT/OFFSET, whose depth
+``search_view`` caps at ``SEARCH_MAX_PAGE``. Other backends fall back to
+an unranked ``icontains`` filter.
+"""
+
+import re
+
+from django.db import connections, router
+
+from .models import Article, Newsletter, SearchDocument
+
+
+FTS_TABLE = 'news_room_searchdocument_fts'
+
+
+def _terms(query):
+    """
+    Returns:
+        list[str]: Word tokens of a user query, without search operators.
+    """
+    return re.findall(r'\w+', query)
+
+
+# ---------- Indexing ----------
+
+def _article_document(article):
+    return SearchDocument(
+        kind='article', object_id=article.pk, title=article.title,
+        description=article.description, content=article.content,
+        created_at=article.created_at,
+    )
+
+
+def _newsletter_document(newsletter):
+    return SearchDocument(
+        kind='newsletter', object_id=newsletter.pk, title=newsletter.title,
+        content=newsletter.content, created_at=newsletter.created_at,
+    )
+
+
+def _store(document):
+    SearchDocument.objects.update_or_create(
+        kind=document.kind, object_id=document.object_id,
+        defaults={field: getattr(document, field)
+                  for field in ('title', 'description', 'content', 'created_at')},
+    )
+
+
+def index_article(article):
+    """
+    Add, refresh or drop an article's search document.
+
+    Only approved articles are searchable.
+
+    Parameters:
+        article (Article): Article that was saved.
+    """
+    if article.approved:
+        _store(_article_document(article))
+    else:
+        remove('article', [article.pk])
+
+
+def index_articles(article_ids):
+    """
+    Refresh the search documents of many articles with bulk statements.
+
+    Used after queryset updates, which do not send ``post_save``.
+
+    Parameters:
+        article_ids (Iterable[int]): Articles whose state changed.
+    """
+    article_ids = list(article_ids)
+    remove('article', article_ids)
+    SearchDocument.objects.bulk_create([
+        _article_document(article)
+        for article in Article.objects.filter(id__in=article_ids, approved=True)
+    ])
+
+
+def index_newsletter(newsletter):
+    """
+    Add or refresh a newsletter's search document.
+
+    Parameters:
+        newsletter (Newsletter): Newsletter that was saved.
+    """
+    _store(_newsletter_document(newsletter))
+
+
+def remove(kind, object_ids):
+    """
+    Drop search documents, e.g. after their sources are deleted.
+
+    Parameters:
+        kind (str): ``'article'`` or ``'newsletter'``.
+        object_ids (Iterable[int]): Primary keys of the sources.
+    """
+    SearchDocument.objects.filter(kind=kind, object_id__in=list(object_ids)).delete()
+
+
+def rebuild_search_index(batch_size=1000):
+    """
+    Recreate every search document from the source tables.
+
+    Parameters:
+        batch_size (int): Rows read and inserted per batch.
+
+    Returns:
+        int: Number of documents written.
+    """
+    SearchDocument.objects.all().delete()
+    sources = [
+        (Article.objects.filter(approved=True), _article_document),
+        (Newsletter.objects.all(), _newsletter_document),
+    ]
+    written = 0
+    for queryset, build in sources:
+        batch = []
+        for instance in queryset.iterator(chunk_size=batch_size):
+            batch.append(build(instance))
+            if len(batch) >= batch_size:
+                SearchDocument.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        SearchDocument.objects.bulk_create(batch)
+        written += len(batch)
+
+    connection = connections[router.db_for_write(SearchDocument)]
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    return written
+
+
+# ---------- Querying ----------
+
+def _ranked_ids(connection, terms, kind, limit, offset):
+    """
+    Fetch ``(id, rank)`` pairs of matching documents, best first.
+    """
+    kind_sql = ' AND kind = %s' if kind else ''
+    kind_params = [kind] if kind else []
+    if connection.vendor == 'sqlite':
+        # Quoting each token makes it a literal phrase, so user input can
+        # never be parsed as FTS5 syntax. Tokens are ANDed.
+        match = ' '.join(f'"{term}"' for term in terms)
+        sql = (f"SELECT rowid, rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s{kind_sql} "
+               f"ORDER BY rank, rowid LIMIT %s OFFSET %s")
+        params = [match, *kind_params, limit, offset]
+    else:
+        # Boolean mode requires every term; natural language mode scores.
+        columns = 'title, description, content'
+        sql = (f"SELECT id, MATCH({columns}) AGAINST (%s IN NATURAL LANGUAGE MODE) AS score "
+               f"FROM news_room_searchdocument "
+               f"WHERE MATCH({columns}) AGAINST (%s IN BOOLEAN MODE){kind_sql} "
+               f"ORDER BY score DESC, id LIMIT %s OFFSET %s")
+        params = [' '.join(terms), ' '.join(f'+{term}' for term in terms),
+                  *kind_params, limit, offset]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def search(query, kind=None, page=1, page_size=20):
+    """
+    Find documents matching every word of a query, most relevant first.
+
+    Parameters:
+        query (str): Free-text query from the user.
+        kind (str): Restrict to ``'article'`` or ``'newsletter'``.
+        page (int): 1-based page number.
+        page_size (int): Results per page.
+
+    Returns:
+        tuple[list[SearchDocument], bool]: The page, each document with a
+        ``rank`` attribute, and whether another page follows.
+    """
+    terms = _terms(query)
+    if not terms:
+        return [], False
+    offset = (page - 1) * page_size
+    connection = connections[router.db_for_read(SearchDocument)]
+
+    if connection.vendor not in ('sqlite', 'mysql'):
+        documents = SearchDocument.objects.all()
+        for term in terms:
+            documents = documents.filter(content__icontains=term) | documents.filter(
+                title__icontains=term) | documents.filter(description__icontains=term)
+        if kind:
+            documents = documents.filter(kind=kind)
+        results = list(documents.order_by('-created_at', '-id')[offset:offset + page_size + 1])
+        for document in results:
+            document.rank = None
+        return results[:page_size], len(results) > page_size
+
+    rows = _ranked_ids(connection, terms, kind, page_size + 1, offset)
+    documents = SearchDocument.objects.in_bulk([pk for pk, _ in rows[:page_size]])
+    results = []
+    for pk, rank in rows[:page_size]:
+        if pk in documents:
+            documents[pk].rank = rank
+            results.append(documents[pk])
+    return results, len(rows) > page_size
@@ -0,0 +1,417 @@
+"""
+Synthetic datasets for exercising the site at production scale.
+
+``seed_scale`` generates publishers, journalists, editors, readers,
+articles in every moderation state, newsletters and subscriptions from a
+random seed, so the same seed and sizes always produce the same graph and
+text. Popularity follows a power law: publishers and journalists are
+ranked and weighted by ``1 / rank ** skew``, which decides who writes the
+most articles and who gathers the most subscribers.
+
+Model rows are written with ``bulk_create`` and explicit primary keys,
+which works on every backend and lets through-table rows be built
+without reading ids back; through-table and timeline rows are inserted
+as batched value tuples. Bulk writes send no signals, so the data the
+signals would maintain is generated alongside the rows:
+- relation counters;
+- role groups;
+- search documents;
+- subscriber index rows, when ``SUBSCRIBER_INDEX_ENABLED`` is set;
+- reader timelines.
+
+Rows are added after the ones already present; run it against a scratch
+database.
+"""
+
+import itertools
+import random
+import time
+from collections import Counter, defaultdict, deque, namedtuple
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connections, router, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from . import feeds
+from .cache import invalidate
+from .models import (
+    Article, CustomUser, Newsletter, Publisher, SearchDocument, SubscriberIndex,
+    TimelineEntry, role_group_id,
+)
+
+
+# Dataset sizes by name; ``seed_scale`` accepts any of the keys as overrides.
+SIZES = {
+    'small': dict(publishers=5, journalists=20, editors=5, readers=200, articles=1_000,
+                  newsletters=100, publisher_subscriptions=2, journalist_subscriptions=2),
+    'medium': dict(publishers=100, journalists=1_000, editors=100, readers=10_000, articles=100_000,
+                   newsletters=10_000, publisher_subscriptions=3, journalist_subscriptions=3),
+    'large': dict(publishers=1_000, journalists=10_000, editors=1_000, readers=100_000,
+                  articles=1_000_000, newsletters=100_000, publisher_subscriptions=3,
+                  journalist_subscriptions=3),
+}
+
+# Shares of articles approved and sent back for revision; the rest await review.
+APPROVED_SHARE = 0.8
+REVISION_SHARE = 0.05
+
+VOCABULARY_SIZE = 5_000
+
+SeedSummary = namedtuple('SeedSummary', ['counts', 'seconds'])
+SeedSummary.__doc__ = """
+Outcome of a seeding run.
+
+Attributes:
+    counts (dict[str, int]): Rows written per model or relation.
+    seconds (float): Wall-clock duration.
+"""
+
+Through = namedtuple('Through', ['model', 'left', 'right'])
+
+ARTICLE_AUTHORS = Through(CustomUser.published_articles.through, 'customuser_id', 'article_id')
+NEWSLETTER_AUTHORS = Through(CustomUser.published_newsletters.through, 'customuser_id', 'newsletter_id')
+PUBLISHER_SUBSCRIPTIONS = Through(CustomUser.subscribed_publishers.through, 'customuser_id', 'publisher_id')
+JOURNALIST_SUBSCRIPTIONS = Through(CustomUser.subscribed_journalists.through,
+                                   'from_customuser_id', 'to_customuser_id')
+PUBLISHER_EDITORS = Through(Publisher.editors.through, 'publisher_id', 'customuser_id')
+PUBLISHER_JOURNALISTS = Through(Publisher.journalists.through, 'publisher_id', 'customuser_id')
+USER_GROUPS = Through(CustomUser.groups.through, 'customuser_id', 'group_id')
+
+
+def power_law(count, skew):
+    """
+    Parameters:
+        count (int): Number of ranked items.
+        skew (float): Exponent; 0 is uniform, larger values concentrate
+            weight on the first items.
+
+    Returns:
+        list[float]: Cumulative weights for ``random.choices``.
+    """
+    return list(itertools.accumulate(1 / rank ** skew for rank in range(1, count + 1)))
+
+
+@contextmanager
+def _explicit_timestamps(*models):
+    """
+    Let ``bulk_create`` store given ``auto_now``/``auto_now_add`` values.
+    """
+    fields = [(field, field.auto_now, field.auto_now_add) for model in models
+              for field in model._meta.concrete_fields if getattr(field, 'auto_now_add', False)
+              or getattr(field, 'auto_now', False)]
+    for field, _, _ in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _next_id(model):
+    return (model.objects.aggregate(top=Max('pk'))['top'] or 0) + 1
+
+
+class _Generator:
+    """
+    State shared by the steps of one seeding run.
+    """
+
+    def __init__(self, sizes, skew, seed, days, batch_size, timeline_depth, password, log):
+        self.sizes = sizes
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.timeline_depth = timeline_depth
+        self.log = log
+        self.connection = connections[router.db_for_write(Article)]
+        self.counts = Counter()
+        self.now = timezone.now()
+        self.start = self.now - timedelta(days=days)
+        self.password = make_password(password)
+        self.skew = skew
+
+        vocabulary = [''.join(self.rng.choices('abcdefghijklmnopqrstuvwxyz', k=self.rng.randint(3, 10)))
+                      for _ in range(VOCABULARY_SIZE)]
+        self.vocabulary = vocabulary
+        self.word_weights = power_law(len(vocabulary), 1.0)
+
+    # ---------- Helpers ----------
+
+    def words(self, k):
+        return ' '.join(self.rng.choices(self.vocabulary, cum_weights=self.word_weights, k=k))
+
+    def write(self, model, rows):
+        """
+        Insert rows in batches, each in its own transaction.
+        """
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, self.batch_size)):
+            with transaction.atomic():
+                model.objects.bulk_create(batch)
+            self.counts[model._meta.label] += len(batch)
+
+    def insert(self, model, columns, rows):
+        """
+        Insert tuples of column values in batches, each in its own transaction.
+
+        Used for through-table and timeline rows, which outnumber all
+        others; building a model instance per row would cost more than the
+        INSERT itself.
+        """
+        connection = self.connection
+        names = {field.attname: field.column for field in model._meta.concrete_fields}
+        sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            connection.ops.quote_name(model._meta.db_table),
+            ', '.join(connection.ops.quote_name(names[column]) for column in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, self.batch_size)):
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                cursor.executemany(sql, batch)
+            self.counts[model._meta.label] += len(batch)
+
+    def link(self, through, pairs):
+        """
+        Insert (left id, right id) pairs into a through table.
+        """
+        self.insert(through.model, (through.left, through.right), pairs)
+
+    def draw(self, population, weights, mean):
+        """
+        Pick about ``mean`` distinct members, favouring popular ones.
+        """
+        k = min(len(population), int(self.rng.expovariate(1 / mean))) if mean else 0
+        return set(self.rng.choices(population, cum_weights=weights, k=k))
+
+    # ---------- Steps ----------
+
+    def graph(self):
+        """
+        Allocate ids and decide memberships, authorship and subscriptions.
+        """
+        sizes, rng = self.sizes, self.rng
+        first_publisher, first_user = _next_id(Publisher), _next_id(CustomUser)
+        self.publishers = list(range(first_publisher, first_publisher + sizes['publishers']))
+        users = iter(itertools.count(first_user))
+        self.journalists = list(itertools.islice(users, sizes['journalists']))
+        self.editors = list(itertools.islice(users, sizes['editors']))
+        self.readers = list(itertools.islice(users, sizes['readers']))
+
+        publisher_weights = power_law(len(self.publishers), self.skew)
+        journalist_weights = power_law(len(self.journalists), self.skew)
+        self.home = dict(zip(self.journalists, rng.choices(
+            self.publishers, cum_weights=publisher_weights, k=len(self.journalists))))
+        self.desks = dict(zip(self.editors, rng.choices(
+            self.publishers, cum_weights=publisher_weights, k=len(self.editors))))
+        self.article_authors = rng.choices(self.journalists, cum_weights=journalist_weights,
+                                           k=sizes['articles'])
+        self.newsletter_authors = rng.choices(self.journalists, cum_weights=journalist_weights,
+                                              k=sizes['newsletters'])
+
+        self.follows = {}
+        for reader in self.readers:
+            self.follows[reader] = (
+                self.draw(self.publishers, publisher_weights, sizes['publisher_subscriptions']),
+                self.draw(self.journalists, journalist_weights, sizes['journalist_subscriptions']),
+            )
+
+    def accounts(self):
+        """
+        Write publishers, users and their memberships with final counters.
+        """
+        publisher_subscribers, journalist_subscribers = Counter(), Counter()
+        for publishers, journalists in self.follows.values():
+            publisher_subscribers.update(publishers)
+            journalist_subscribers.update(journalists)
+        staff = Counter(self.home.values())
+        article_counts = Counter(self.article_authors)
+
+        self.write(Publisher, (
+            Publisher(id=pk, name=f"Publisher {pk}", subscriber_count=publisher_subscribers[pk],
+                      journalist_count=staff[pk])
+            for pk in self.publishers
+        ))
+        roles = [('journalist', self.journalists), ('editor', self.editors), ('reader', self.readers)]
+        self.write(CustomUser, (
+            CustomUser(id=pk, username=f"{role}{pk}", email=f"{role}{pk}@example.com",
+                       password=self.password, role=role, date_joined=self.start,
+                       subscriber_count=journalist_subscribers[pk], article_count=article_counts[pk])
+            for role, pks in roles for pk in pks
+        ))
+        self.link(USER_GROUPS, ((pk, role_group_id(role)) for role, pks in roles for pk in pks))
+        self.link(PUBLISHER_JOURNALISTS, ((publisher, pk) for pk, publisher in self.home.items()))
+        self.link(PUBLISHER_EDITORS, ((publisher, pk) for pk, publisher in self.desks.items()))
+
+        self.link(PUBLISHER_SUBSCRIPTIONS, ((reader, publisher) for reader, (publishers, _)
+                                            in self.follows.items() for publisher in publishers))
+        self.link(JOURNALIST_SUBSCRIPTIONS, ((reader, journalist) for reader, (_, journalists)
+                                             in self.follows.items() for journalist in journalists))
+        if settings.SUBSCRIBER_INDEX_ENABLED:
+            self.write(SubscriberIndex, itertools.chain.from_iterable(
+                [SubscriberIndex(reader_id=reader, email=f"reader{reader}@example.com", publisher_id=pk)
+                 for pk in publishers] +
+                [SubscriberIndex(reader_id=reader, email=f"reader{reader}@example.com", journalist_id=pk)
+                 for pk in journalists]
+                for reader, (publishers, journalists) in self.follows.items()
+            ))
+
+        limit = settings.TIMELINE_FANOUT_LIMIT
+        self.large_publishers = {pk for pk, n in publisher_subscribers.items() if n > limit}
+        self.large_journalists = {pk for pk, n in journalist_subscribers.items() if n > limit}
+        self.log(f"Wrote {len(self.publishers)} publishers and "
+                 f"{len(self.journalists) + len(self.editors) + len(self.readers)} users.")
+
+    def _timestamps(self, count):
+        """
+        Yield ``count`` ascending timestamps spread over the dataset's span.
+        """
+        span = (self.now - self.start) / max(count, 1)
+        return (self.start + span * i for i in range(count))
+
+    def articles(self):
+        """
+        Write articles oldest first, remembering the newest approved ones per source.
+        """
+        depth = self.timeline_depth
+        self.recent_by_publisher = defaultdict(lambda: deque(maxlen=depth))
+        self.recent_by_journalist = defaultdict(lambda: deque(maxlen=depth))
+        adapt = self.connection.ops.adapt_datetimefield_value
+        first = _next_id(Article)
+        rows = zip(itertools.count(first), self.article_authors, self._timestamps(len(self.article_authors)))
+        while batch := list(itertools.islice(rows, self.batch_size)):
+            articles, documents = [], []
+            for pk, author, created_at in batch:
+                state = self.rng.random()
+                approved = state < APPROVED_SHARE
+                needs_revision = APPROVED_SHARE <= state < APPROVED_SHARE + REVISION_SHARE
+                article = Article(
+                    id=pk, title=self.words(6).capitalize(), description=self.words(20),
+                    content=self.words(self.sizes['words']), approved=approved,
+                    needs_revision=needs_revision,
+                    editor_feedback=self.words(12) if needs_revision else '',
+                    author_id=author, publisher_id=self.home[author],
+                    created_at=created_at, updated_at=created_at,
+                )
+                articles.append(article)
+                if approved:
+                    documents.append(SearchDocument(
+                        kind='article', object_id=pk, title=article.title,
+                        description=article.description, content=article.content, created_at=created_at,
+                    ))
+                    if depth:
+                        entry = (pk, adapt(created_at))
+                        self.recent_by_publisher[article.publisher_id].append(entry)
+                        self.recent_by_journalist[author].append(entry)
+            with transaction.atomic():
+                Article.objects.bulk_create(articles)
+                SearchDocument.objects.bulk_create(documents)
+            self.link(ARTICLE_AUTHORS, ((article.author_id, article.id) for article in articles))
+            self.counts['news_room.Article'] += len(articles)
+            self.counts['news_room.SearchDocument'] += len(documents)
+        self.log(f"Wrote {len(self.article_authors)} articles.")
+
+    def newsletters(self):
+        """
+        Write newsletters with their search documents.
+        """
+        first = _next_id(Newsletter)
+        rows = zip(itertools.count(first), self.newsletter_authors,
+                   self._timestamps(len(self.newsletter_authors)))
+        while batch := list(itertools.islice(rows, self.batch_size)):
+            newsletters = [
+                Newsletter(id=pk, title=self.words(5).capitalize(), content=self.words(self.sizes['words']),
+                           author_id=author, publisher_id=self.home[author], created_at=created_at)
+                for pk, author, created_at in batch
+            ]
+            with transaction.atomic():
+                Newsletter.objects.bulk_create(newsletters)
+                SearchDocument.objects.bulk_create([
+                    SearchDocument(kind='newsletter', object_id=n.id, title=n.title, content=n.content,
+                                   created_at=n.created_at)
+                    for n in newsletters
+                ])
+            self.link(NEWSLETTER_AUTHORS, ((n.author_id, n.id) for n in newsletters))
+            self.counts['news_room.Newsletter'] += len(newsletters)
+            self.counts['news_room.SearchDocument'] += len(newsletters)
+        self.log(f"Wrote {len(self.newsletter_authors)} newsletters.")
+
+    def timelines(self):
+        """
+        Fill reader timelines as subscribing would have backfilled them.
+
+        Sources above ``TIMELINE_FANOUT_LIMIT`` subscribers are left out,
+        as the read path merges them in.
+        """
+        if not self.timeline_depth:
+            return
+
+        def entries():
+            for reader, (publishers, journalists) in self.follows.items():
+                recent = {}
+                for pk in publishers - self.large_publishers:
+                    recent.update(self.recent_by_publisher.get(pk, ()))
+                for pk in journalists - self.large_journalists:
+                    recent.update(self.recent_by_journalist.get(pk, ()))
+                for article_id, created_at in recent.items():
+                    yield reader, article_id, created_at
+
+        self.insert(TimelineEntry, ('reader_id', 'article_id', 'created_at'), entries())
+        self.log(f"Wrote {self.counts['news_room.TimelineEntry']} timeline entries.")
+
+    def finish(self):
+        """
+        Move id sequences past the explicit keys and drop stale caches.
+        """
+        connection = connections[router.db_for_write(Article)]
+        statements = connection.ops.sequence_reset_sql(no_style(), [Publisher, CustomUser, Article, Newsletter])
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+        invalidate('directory', 'articles', 'newsletters')
+        with transaction.atomic():
+            feeds.refresh([feeds.GLOBAL_FEED])
+
+
+def seed_scale(size='small', skew=1.1, seed=0, days=365, batch_size=5000, timeline_depth=None,
+               password='password', log=lambda message: None, **overrides):
+    """
+    Generate a reproducible synthetic dataset.
+
+    Parameters:
+        size (str): Key of ``SIZES`` giving the default row counts.
+        skew (float): Power-law exponent of publisher and journalist popularity.
+        seed (int): Random seed; equal seeds and sizes give equal data.
+        days (int): Articles and newsletters are spread over this many days
+            up to now.
+        batch_size (int): Rows inserted per ``bulk_create`` call.
+        timeline_depth (int): Newest approved articles per followed source
+            copied into timelines (default: ``TIMELINE_BACKFILL``, 0 skips).
+        password (str): Password of every generated account.
+        log (callable): Receives a progress message after each step.
+        **overrides: Row counts replacing the ones from ``size``, plus
+            ``words`` per article or newsletter body (default 60).
+
+    Returns:
+        SeedSummary: Rows written per model and the duration.
+    """
+    start = time.perf_counter()
+    sizes = {'words': 60, **SIZES[size], **{key: value for key, value in overrides.items() if value is not None}}
+    generator = _Generator(
+        sizes, skew, seed, days, batch_size,
+        settings.TIMELINE_BACKFILL if timeline_depth is None else timeline_depth, password, log,
+    )
+    generator.graph()
+    with _explicit_timestamps(Article, Newsletter):
+        generator.accounts()
+        generator.articles()
+        generator.newsletters()
+    generator.timelines()
+    generator.finish()
+    return SeedSummary(dict(generator.counts), time.perf_counter() - start)
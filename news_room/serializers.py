@@ -1,11 +1,44 @@
 """
 DRF serializers for articles, newsletters, publishers, and authors.
 
-Serializers include nested fields for relational context.
+Serializers include nested fields for relational context. List variants
+omit the full ``content`` body, and every serializer here honours a
+``?fields=`` query parameter for sparse fieldsets.
 """
 
+from django.conf import settings
 from rest_framework import serializers
 from .models import Article, Publisher, CustomUser, Newsletter
+from .moderation import MODERATION_ACTIONS
+from .subscriptions import source_queryset
+
+
+def requested_fields(request):
+    """
+    Parse the ``?fields=`` sparse fieldset parameter.
+
+    Parameters:
+        request (Request): Current API request, or None.
+
+    Returns:
+        set[str] | None: Requested field names, or None for all fields.
+    """
+    raw = request.query_params.get('fields') if request is not None else None
+    if not raw:
+        return None
+    return {name.strip() for name in raw.split(',') if name.strip()}
+
+
+class SparseFieldsMixin:
+    """
+    Drop any field not named in the request's ``?fields=`` parameter.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        allowed = requested_fields(self.context.get('request'))
+        if allowed is not None:
+            for name in set(self.fields) - allowed:
+                self.fields.pop(name)
 
 
 class PublisherSerializer(serializers.ModelSerializer):
@@ -22,7 +55,7 @@ class AuthorSerializer(serializers.ModelSerializer):
         fields = ['id', 'username']
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for article objects including related author and publisher.
 
@@ -40,7 +73,7 @@ class ArticleSerializer(serializers.ModelSerializer):
         ]
 
 
-class NewsletterSerializer(serializers.ModelSerializer):
+class NewsletterSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for newsletter objects including related author and publisher.
     """
@@ -53,3 +86,61 @@ class NewsletterSerializer(serializers.ModelSerializer):
             'id', 'title', 'content',
             'author', 'publisher', 'created_at'
         ]
+
+
+class ArticleListSerializer(ArticleSerializer):
+    """
+    Compact article representation for feeds, without the ``content`` body.
+    """
+    class Meta(ArticleSerializer.Meta):
+        fields = [f for f in ArticleSerializer.Meta.fields if f != 'content']
+
+
+class NewsletterListSerializer(NewsletterSerializer):
+    """
+    Compact newsletter representation for feeds, without the ``content`` body.
+    """
+    class Meta(NewsletterSerializer.Meta):
+        fields = [f for f in NewsletterSerializer.Meta.fields if f != 'content']
+
+
+class ModerationSerializer(serializers.Serializer):
+    """
+    Validates a bulk moderation request.
+    """
+    article_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False,
+        max_length=settings.MODERATION_MAX_BATCH,
+    )
+    action = serializers.ChoiceField(choices=MODERATION_ACTIONS)
+    feedback = serializers.CharField(required=False, allow_blank=True, default='')
+
+
+class SubscriptionSerializer(serializers.Serializer):
+    """
+    Validates a bulk subscription change.
+
+    Pass ``mode`` in the context; ids being followed (``'set'`` and
+    ``'add'``) must exist, while unknown ids may be unfollowed.
+    """
+    publishers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False,
+        max_length=settings.SUBSCRIPTION_MAX_BATCH,
+    )
+    journalists = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False,
+        max_length=settings.SUBSCRIPTION_MAX_BATCH,
+    )
+
+    def validate(self, data):
+        if not data:
+            raise serializers.ValidationError("Provide publishers, journalists or both.")
+        if self.context.get('mode') != 'remove':
+            errors = {}
+            for relation, ids in data.items():
+                unknown = set(ids) - set(source_queryset(relation).filter(id__in=ids).values_list('id', flat=True))
+                if unknown:
+                    errors[relation] = [f"Unknown ids: {sorted(unknown)}"]
+            if errors:
+                raise serializers.ValidationError(errors)
+        return data
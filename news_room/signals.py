@@ -1,55 +1,363 @@
 """
-Signals triggered on article save events.
+Signals triggered on article save and subscription events.
 
-On approval, sends emails to subscribers and posts to X (Twitter) via OAuth.
+On approval, queues subscriber emails, an X (Twitter) post and the
+timeline fan-out in the transactional outbox. Delivery happens in the
+``process_outbox`` worker. Subscription changes keep the optional
+subscriber index and reader timelines in sync, and content changes
+invalidate cached pages and API responses and refresh the search index
+and syndication feeds.
 """
 
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from django.core.mail import send_mail
 from django.conf import settings
-from requests_oauthlib import OAuth1Session
-from .models import Article
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from .models import (
+    Article, CustomUser, Newsletter, Publisher, SubscriberIndex, clear_role_group_cache,
+)
+from . import counters, feeds, search, timeline
+from .cache import invalidate
+from .moderation import articles_moderated
+from .outbox import (
+    enqueue_article_approval, enqueue_article_withdrawal, enqueue_bulk_approval,
+    enqueue_bulk_withdrawal, enqueue_feed_render,
+)
+from .recipients import index_journalist_subscriptions, index_publisher_subscriptions
 
 
 @receiver(post_save, sender=Article)
 def notify_on_approval(sender, instance, created, **kwargs):
     """
-    Notify readers and post to X when an article is approved.
+    Queue reader notifications and an X post when an article is approved.
+
+    - The outbox rows are written in the same transaction as the article.
+    - Emails, the X post and timeline fan-out run later in the outbox worker.
+    - Triggered only on update (not creation) when the article becomes
+      approved and is not flagged for revision; saving an article that was
+      already approved does not notify again.
+    - Losing approval queues removal from reader timelines.
+    """
+    if created:
+        return
+    if instance.approved and not instance.needs_revision and not instance.was_approved:
+        enqueue_article_approval(instance)
+    elif instance.was_approved and not instance.approved:
+        enqueue_article_withdrawal(instance)
+
+
+@receiver(articles_moderated)
+def notify_on_bulk_moderation(sender, approved, withdrawn, **kwargs):
+    """
+    Queue one digest and per-article fan-out for a bulk moderation batch.
+
+    Bulk moderation updates rows without ``post_save``, so this mirrors
+    ``notify_on_approval`` for the whole batch at once.
+    """
+    enqueue_bulk_approval(approved)
+    enqueue_bulk_withdrawal(withdrawn)
+
+
+# ---------- Relation Counters ----------
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_publishers.through)
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+@receiver(m2m_changed, sender=CustomUser.published_articles.through)
+@receiver(m2m_changed, sender=Publisher.journalists.through)
+def update_relation_counters(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep denormalized relation counters in step with through-table changes.
+    """
+    for counter in counters.counters_for(sender):
+        counters.track(counter, instance, action, reverse, pk_set)
+
+
+@receiver(pre_delete, sender=Article)
+@receiver(pre_delete, sender=CustomUser)
+def release_relation_counters(sender, instance, **kwargs):
+    """
+    Decrement counters of objects linked to a deleted article or user.
+    """
+    counters.forget(instance)
+
+
+# ---------- Subscriber Index ----------
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_publishers.through)
+def sync_publisher_subscriber_index(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Mirror reader-to-publisher subscription changes into ``SubscriberIndex``.
 
-    - Emails are sent to all subscribed readers of the publisher and journalist.
-    - A post is published to X using OAuth credentials.
-    - Triggered only on update (not creation) where approved and not flagged for revision.
+    Handles both sides of the relation (``reader.subscribed_publishers``
+    and ``publisher.subscribed_readers``).
     """
-    if not created and instance.approved and not instance.needs_revision:
-        subject = f"New Article: {instance.title}"
-        message = (
-            f"{instance.description}\n\n"
-            f"Read more at: http://127.0.0.1:8000/articles/{instance.id}/"
+    if not settings.SUBSCRIBER_INDEX_ENABLED:
+        return
+    if action == 'post_add':
+        index_publisher_subscriptions(
+            [(pk, instance.pk) for pk in pk_set] if reverse
+            else [(instance.pk, pk) for pk in pk_set]
         )
-        from_email = settings.DEFAULT_FROM_EMAIL
-
-        publisher_subs = instance.publisher.subscribed_readers.all()
-        journalist_subs = instance.author.reader_subscribers.all()
-        recipients = set([
-            u.email for u in publisher_subs.union(journalist_subs) if u.email
-        ])
-
-        if recipients:
-            send_mail(subject, message, from_email, list(recipients), fail_silently=True)
-
-        try:
-            twitter = OAuth1Session(
-                settings.X_API_KEY,
-                settings.X_API_SECRET,
-                settings.X_ACCESS_TOKEN,
-                settings.X_ACCESS_TOKEN_SECRET
-            )
-            tweet = {
-                "text": f"{instance.title} by {instance.author.username}\n"
-                        f"Read: http://127.0.0.1:8000/articles/{instance.id}/"
-            }
-            response = twitter.post("https://api.twitter.com/2/tweets", json=tweet)
-            response.raise_for_status()
-        except Exception as e:
-            print("Error posting to X:", e)
+    elif action == 'post_remove':
+        rows = (SubscriberIndex.objects.filter(publisher_id=instance.pk, reader_id__in=pk_set) if reverse
+                else SubscriberIndex.objects.filter(reader_id=instance.pk, publisher_id__in=pk_set))
+        rows.delete()
+    elif action == 'pre_clear':
+        rows = (SubscriberIndex.objects.filter(publisher_id=instance.pk) if reverse
+                else SubscriberIndex.objects.filter(reader_id=instance.pk, publisher__isnull=False))
+        rows.delete()
+
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+def sync_journalist_subscriber_index(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Mirror reader-to-journalist subscription changes into ``SubscriberIndex``.
+
+    Handles both sides of the relation (``reader.subscribed_journalists``
+    and ``journalist.reader_subscribers``).
+    """
+    if not settings.SUBSCRIBER_INDEX_ENABLED:
+        return
+    if action == 'post_add':
+        index_journalist_subscriptions(
+            [(pk, instance.pk) for pk in pk_set] if reverse
+            else [(instance.pk, pk) for pk in pk_set]
+        )
+    elif action == 'post_remove':
+        rows = (SubscriberIndex.objects.filter(journalist_id=instance.pk, reader_id__in=pk_set) if reverse
+                else SubscriberIndex.objects.filter(reader_id=instance.pk, journalist_id__in=pk_set))
+        rows.delete()
+    elif action == 'pre_clear':
+        rows = (SubscriberIndex.objects.filter(journalist_id=instance.pk) if reverse
+                else SubscriberIndex.objects.filter(reader_id=instance.pk, journalist__isnull=False))
+        rows.delete()
+
+
+@receiver(post_save, sender=CustomUser)
+def sync_subscriber_index_email(sender, instance, created, **kwargs):
+    """
+    Propagate a reader's email change to their ``SubscriberIndex`` rows.
+    """
+    if settings.SUBSCRIBER_INDEX_ENABLED and not created:
+        SubscriberIndex.objects.filter(reader=instance).exclude(
+            email=instance.email
+        ).update(email=instance.email)
+
+
+# ---------- Reader Timelines ----------
+
+def _sync_timeline(instance, action, reverse, pk_set, related, source_kwarg):
+    """
+    Backfill or prune timelines for one side of a subscription relation.
+
+    Parameters:
+        instance (Model): Object whose relation changed.
+        action (str): ``m2m_changed`` action.
+        reverse (bool): True if ``instance`` is the followed source.
+        pk_set (set[int]): Primary keys added or removed.
+        related (str): Accessor on ``instance`` for the changed relation.
+        source_kwarg (str): ``publisher_ids`` or ``journalist_ids``.
+    """
+    if action == 'pre_clear':
+        # Remember who is affected; pruning must wait until rows are gone.
+        instance._timeline_cleared = set(getattr(instance, related).values_list('pk', flat=True))
+        return
+    if action == 'post_clear':
+        pk_set = getattr(instance, '_timeline_cleared', set())
+        action = 'post_remove'
+    if action not in ('post_add', 'post_remove') or not pk_set:
+        return
+    readers, sources = (pk_set, [instance.pk]) if reverse else ([instance.pk], pk_set)
+    if action == 'post_add':
+        timeline.backfill(readers, **{source_kwarg: sources})
+    else:
+        timeline.prune(readers, **{source_kwarg: sources})
+
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_publishers.through)
+def sync_publisher_timeline(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Backfill or prune reader timelines when publisher subscriptions change.
+    """
+    related = 'subscribed_readers' if reverse else 'subscribed_publishers'
+    _sync_timeline(instance, action, reverse, pk_set, related, 'publisher_ids')
+
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+def sync_journalist_timeline(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Backfill or prune reader timelines when journalist subscriptions change.
+    """
+    related = 'reader_subscribers' if reverse else 'subscribed_journalists'
+    _sync_timeline(instance, action, reverse, pk_set, related, 'journalist_ids')
+
+
+# ---------- Cache Invalidation ----------
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_publishers.through)
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+@receiver(m2m_changed, sender=CustomUser.published_articles.through)
+@receiver(m2m_changed, sender=Publisher.journalists.through)
+def invalidate_directory_on_relation_change(sender, action, **kwargs):
+    """
+    Invalidate cached directory pages when a counted relation changes.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate('directory')
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Publisher)
+@receiver(post_delete, sender=Publisher)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_directory_on_change(sender, **kwargs):
+    """
+    Invalidate cached directory pages when listed objects change.
+    """
+    invalidate('directory')
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_directory_on_user_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Invalidate cached directory pages when a user is added or edited.
+
+    Login only touches ``last_login`` and leaves the directory untouched.
+    """
+    if update_fields is None or set(update_fields) != {'last_login'}:
+        invalidate('directory')
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_article_responses(sender, **kwargs):
+    """
+    Invalidate cached article pages and API responses.
+    """
+    invalidate('articles')
+
+
+@receiver(articles_moderated)
+def invalidate_moderated_article_responses(sender, updated, **kwargs):
+    """
+    Invalidate cached article pages after a bulk moderation batch.
+    """
+    if updated:
+        invalidate('articles')
+
+
+@receiver(post_save, sender=Newsletter)
+@receiver(post_delete, sender=Newsletter)
+def invalidate_newsletter_responses(sender, **kwargs):
+    """
+    Invalidate cached newsletter pages and API responses.
+    """
+    invalidate('newsletters')
+
+
+@receiver(post_save, sender=Publisher)
+def invalidate_publisher_responses(sender, created, **kwargs):
+    """
+    Invalidate cached content that displays a renamed publisher.
+    """
+    if not created:
+        invalidate('articles', 'newsletters')
+
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_publishers.through)
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+def invalidate_subscriber_responses(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Invalidate cached responses of readers whose subscriptions changed.
+    """
+    if action == 'pre_clear' and reverse:
+        # Capture the readers now; they are gone by post_clear.
+        related = 'subscribed_readers' if isinstance(instance, Publisher) else 'reader_subscribers'
+        instance._cache_cleared_readers = set(getattr(instance, related).values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        if not reverse:
+            readers = [instance.pk]
+        elif action == 'post_clear':
+            readers = getattr(instance, '_cache_cleared_readers', set())
+        else:
+            readers = pk_set
+        invalidate(*[f'subscriptions:{pk}' for pk in readers])
+
+
+# ---------- Search Index ----------
+
+@receiver(post_save, sender=Article)
+def index_article_for_search(sender, instance, **kwargs):
+    """
+    Add, refresh or drop the article's search document.
+    """
+    search.index_article(instance)
+
+
+@receiver(post_save, sender=Newsletter)
+def index_newsletter_for_search(sender, instance, **kwargs):
+    """
+    Add or refresh the newsletter's search document.
+    """
+    search.index_newsletter(instance)
+
+
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Newsletter)
+def remove_search_document(sender, instance, **kwargs):
+    """
+    Drop the search document of a deleted article or newsletter.
+    """
+    search.remove(sender._meta.model_name, [instance.pk])
+
+
+@receiver(articles_moderated)
+def index_moderated_articles_for_search(sender, updated, **kwargs):
+    """
+    Refresh search documents of every article in a bulk moderation batch.
+    """
+    search.index_articles(updated)
+
+
+# ---------- Syndication Feeds ----------
+
+@receiver(post_delete, sender=Article)
+def refresh_feeds_on_article_delete(sender, instance, **kwargs):
+    """
+    Queue re-rendering of the feeds that showed a deleted approved article.
+    """
+    if instance.approved:
+        enqueue_feed_render(feeds.feed_keys([(instance.publisher_id, instance.author_id)]))
+
+
+@receiver(post_save, sender=Publisher)
+def refresh_feeds_on_publisher_rename(sender, instance, created, **kwargs):
+    """
+    Queue re-rendering of the feeds that display a renamed publisher's name.
+    """
+    if not created:
+        enqueue_feed_render([feeds.GLOBAL_FEED, feeds.feed_key(publisher_id=instance.pk)])
+
+
+@receiver(post_delete, sender=Publisher)
+@receiver(post_delete, sender=CustomUser)
+def discard_source_feeds(sender, instance, **kwargs):
+    """
+    Drop the stored feed of a deleted publisher or journalist.
+    """
+    if isinstance(instance, Publisher):
+        feeds.discard(feeds.feed_key(publisher_id=instance.pk))
+    elif instance.role == 'journalist':
+        feeds.discard(feeds.feed_key(journalist_id=instance.pk))
+
+
+# ---------- Role Groups ----------
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def reset_role_group_cache(sender, **kwargs):
+    """
+    Drop cached role group ids when any group changes.
+    """
+    clear_role_group_cache()
@@ -0,0 +1,295 @@
+"""
+Set-based changes to reader subscriptions.
+
+Readers follow publishers and journalists through two many-to-many
+relations. The helpers here change many subscriptions at once: current
+subscriptions are read with one query, new through-table rows are
+written with ``bulk_create(ignore_conflicts=True)`` and dropped ones with
+a single DELETE per relation.
+
+Bulk writes do not send ``m2m_changed``, so it is sent explicitly with
+exactly the ids that changed. The subscriber index, reader timelines and
+cached pages therefore follow, just as they do for
+``reader.subscribed_publishers.add()``.
+"""
+
+import csv
+import time
+from collections import defaultdict, namedtuple
+
+from django.db import router, transaction
+from django.db.models import Q, Value
+from django.db.models.signals import m2m_changed
+
+from .ingest import iter_ndjson
+from .models import CustomUser, Publisher
+
+
+SUBSCRIPTION_MODES = ('set', 'add', 'remove')
+
+# Relation name -> (CustomUser accessor, reader column, source column).
+RELATIONS = {
+    'publishers': ('subscribed_publishers', 'customuser_id', 'publisher_id'),
+    'journalists': ('subscribed_journalists', 'from_customuser_id', 'to_customuser_id'),
+}
+
+
+def _through(relation):
+    return getattr(CustomUser, RELATIONS[relation][0]).through
+
+
+def _source_model(relation):
+    return CustomUser._meta.get_field(RELATIONS[relation][0]).related_model
+
+
+def _send(relation, action, instance, pk_set, reverse=False):
+    """
+    Send ``m2m_changed`` as the related manager would for a bulk write.
+    """
+    through = _through(relation)
+    m2m_changed.send(
+        sender=through, instance=instance, action=action, reverse=reverse,
+        model=CustomUser if reverse else _source_model(relation),
+        pk_set=set(pk_set), using=router.db_for_write(through),
+    )
+
+
+def source_queryset(relation):
+    """
+    Returns:
+        QuerySet: Objects a reader may follow through ``relation``.
+    """
+    if relation == 'journalists':
+        return CustomUser.objects.filter(role='journalist')
+    return Publisher.objects.all()
+
+
+def current_subscriptions(reader, relations=tuple(RELATIONS)):
+    """
+    Read a reader's subscriptions in one query.
+
+    Parameters:
+        reader (CustomUser): The subscribing reader.
+        relations (Iterable[str]): Keys of ``RELATIONS`` to read.
+
+    Returns:
+        dict[str, set[int]]: Followed ids per relation.
+    """
+    relations = list(relations)
+    queries = []
+    for relation in relations:
+        _, reader_column, source_column = RELATIONS[relation]
+        queries.append(_through(relation).objects.filter(**{reader_column: reader.pk}).annotate(
+            relation=Value(relation)
+        ).values_list('relation', source_column))
+    current = {relation: set() for relation in relations}
+    if queries:
+        for relation, pk in queries[0].union(*queries[1:], all=True):
+            current[relation].add(pk)
+    return current
+
+
+def update_subscriptions(reader, mode, publishers=None, journalists=None):
+    """
+    Replace, extend or shrink a reader's subscriptions.
+
+    Parameters:
+        reader (CustomUser): The subscribing reader.
+        mode (str): ``'set'`` makes the given ids the full subscription
+            list, ``'add'`` follows them and ``'remove'`` unfollows them.
+        publishers (Iterable[int] | None): Publisher ids, or None to leave
+            publisher subscriptions untouched.
+        journalists (Iterable[int] | None): Journalist ids, or None to leave
+            journalist subscriptions untouched.
+
+    Returns:
+        dict[str, dict[str, list[int]]]: ``added`` and ``removed`` ids per
+        relation that was given.
+    """
+    requested = {relation: set(ids) for relation, ids in
+                 (('publishers', publishers), ('journalists', journalists)) if ids is not None}
+    changes = {}
+    with transaction.atomic():
+        current = current_subscriptions(reader, requested)
+        for relation, ids in requested.items():
+            followed = current[relation]
+            added = ids - followed if mode in ('set', 'add') else set()
+            removed = followed - ids if mode == 'set' else followed & ids if mode == 'remove' else set()
+            through = _through(relation)
+            _, reader_column, source_column = RELATIONS[relation]
+            if removed:
+                _send(relation, 'pre_remove', reader, removed)
+                through.objects.filter(**{reader_column: reader.pk, f'{source_column}__in': removed}).delete()
+                _send(relation, 'post_remove', reader, removed)
+            if added:
+                _send(relation, 'pre_add', reader, added)
+                through.objects.bulk_create([
+                    through(**{reader_column: reader.pk, source_column: pk}) for pk in added
+                ], ignore_conflicts=True)
+                _send(relation, 'post_add', reader, added)
+            changes[relation] = {'added': sorted(added), 'removed': sorted(removed)}
+    return changes
+
+
+# ---------- Import ----------
+
+SubscriptionImportSummary = namedtuple('SubscriptionImportSummary', ['created', 'rejected', 'seconds'])
+SubscriptionImportSummary.__doc__ = """
+Outcome of a subscription import.
+
+Attributes:
+    created (int): Subscriptions added; existing ones are not counted.
+    rejected (list[dict]): ``{'line': n, 'error': message}`` per skipped row.
+    seconds (float): Wall-clock duration.
+"""
+
+
+def iter_csv(lines):
+    """
+    Parse CSV rows with a header line into dicts.
+
+    Parameters:
+        lines (Iterable[bytes | str]): Raw input lines.
+
+    Yields:
+        tuple[int, dict, None]: 1-based line number and the row, in the
+        same shape as ``news_room.ingest.iter_ndjson``.
+    """
+    text = (line.decode('utf-8', errors='replace') if isinstance(line, bytes) else line
+            for line in lines)
+    reader = csv.DictReader(text)
+    for row in reader:
+        if not any(row.values()):
+            continue
+        yield reader.line_num, {key: value for key, value in row.items() if value}, None
+
+
+def _reference(record, field):
+    """
+    Returns:
+        int | str | None: An id (numeric values) or a name from one column.
+    """
+    value = record.get(field)
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value if isinstance(value, (int, str)) and value != '' else None
+
+
+def _resolve(queryset, refs, name_field):
+    """
+    Look up objects referenced by id or name with one query.
+
+    Returns:
+        dict: Object ids keyed by both id and name.
+    """
+    ids = {ref for ref in refs if isinstance(ref, int)}
+    names = {ref for ref in refs if isinstance(ref, str)}
+    if not ids and not names:
+        return {}
+    found = {}
+    # Newest first so a duplicated name resolves to the oldest row.
+    for pk, name in queryset.filter(Q(id__in=ids) | Q(**{f'{name_field}__in': names})).order_by(
+        '-id'
+    ).values_list('id', name_field):
+        found[pk] = found[name] = pk
+    return found
+
+
+def _add_pairs(relation, pairs):
+    """
+    Insert new (reader, source) pairs of one relation and announce them.
+
+    Returns:
+        int: Number of subscriptions that did not exist yet.
+    """
+    through = _through(relation)
+    _, reader_column, source_column = RELATIONS[relation]
+    readers = {reader for reader, _ in pairs}
+    sources = {source for _, source in pairs}
+    existing = set(through.objects.filter(**{
+        f'{reader_column}__in': readers, f'{source_column}__in': sources,
+    }).values_list(reader_column, source_column))
+    new = sorted(set(pairs) - existing)
+    if not new:
+        return 0
+
+    by_source = defaultdict(set)
+    for reader, source in new:
+        by_source[source].add(reader)
+    instances = source_queryset(relation).in_bulk(list(by_source))
+    # Announced from the source side: an import usually brings many readers
+    # to few sources, so this sends one signal per source, not per reader.
+    for source, reader_ids in by_source.items():
+        _send(relation, 'pre_add', instances[source], reader_ids, reverse=True)
+    through.objects.bulk_create([
+        through(**{reader_column: reader, source_column: source}) for reader, source in new
+    ], ignore_conflicts=True)
+    for source, reader_ids in by_source.items():
+        _send(relation, 'post_add', instances[source], reader_ids, reverse=True)
+    return len(new)
+
+
+def import_subscriptions(lines, file_format='csv', batch_size=5000):
+    """
+    Add subscriptions from CSV or NDJSON rows.
+
+    Each row names a ``reader`` and either a ``publisher`` or a
+    ``journalist``, by id (numeric values) or by name/username. Rows are resolved with one
+    query per referenced model per batch, and each batch is committed
+    separately.
+
+    Parameters:
+        lines (Iterable[bytes | str]): Input lines.
+        file_format (str): ``'csv'`` (with a header line) or ``'ndjson'``.
+        batch_size (int): Rows resolved and inserted together.
+
+    Returns:
+        SubscriptionImportSummary: Counts, rejections and duration.
+    """
+    start = time.perf_counter()
+    created, rejected = 0, []
+    rows = iter_csv(lines) if file_format == 'csv' else iter_ndjson(lines)
+
+    def flush(batch):
+        readers = _resolve(CustomUser.objects.filter(role='reader'),
+                           {_reference(r, 'reader') for _, r in batch}, 'username')
+        publishers = _resolve(Publisher.objects.all(),
+                              {_reference(r, 'publisher') for _, r in batch}, 'name')
+        journalists = _resolve(CustomUser.objects.filter(role='journalist'),
+                               {_reference(r, 'journalist') for _, r in batch}, 'username')
+        pairs = {'publishers': set(), 'journalists': set()}
+        for number, record in batch:
+            reader = readers.get(_reference(record, 'reader'))
+            has_publisher = _reference(record, 'publisher') is not None
+            has_journalist = _reference(record, 'journalist') is not None
+            if reader is None:
+                error = "Unknown reader."
+            elif has_publisher == has_journalist:
+                error = "Name exactly one of publisher or journalist."
+            elif has_publisher and _reference(record, 'publisher') not in publishers:
+                error = "Unknown publisher."
+            elif has_journalist and _reference(record, 'journalist') not in journalists:
+                error = "Unknown journalist."
+            else:
+                if has_publisher:
+                    pairs['publishers'].add((reader, publishers[_reference(record, 'publisher')]))
+                else:
+                    pairs['journalists'].add((reader, journalists[_reference(record, 'journalist')]))
+                continue
+            rejected.append({'line': number, 'error': error})
+        with transaction.atomic():
+            return sum(_add_pairs(relation, relation_pairs)
+                       for relation, relation_pairs in pairs.items() if relation_pairs)
+
+    batch = []
+    for number, record, error in rows:
+        if error:
+            rejected.append({'line': number, 'error': error})
+            continue
+        batch.append((number, record))
+        if len(batch) >= batch_size:
+            created += flush(batch)
+            batch = []
+    if batch:
+        created += flush(batch)
+    return SubscriptionImportSummary(created, rejected, time.perf_counter() - start)
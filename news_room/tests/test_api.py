@@ -1,7 +1,8 @@
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
+from django.test import override_settings
 from django.urls import reverse
-from news_room.models import CustomUser, Publisher, Article
+from news_room.models import CustomUser, Publisher, Article, Newsletter
 
 
 class ArticleAPITests(APITestCase):
@@ -61,7 +62,7 @@ class ArticleAPITests(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        titles = [a.get('title') for a in response.data]
+        titles = [a.get('title') for a in response.data['results']]
         self.assertIn("Pub1 Article", titles)
         self.assertNotIn("Pub2 Article", titles)
 
@@ -71,7 +72,7 @@ class ArticleAPITests(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        titles = [a.get('title') for a in response.data]
+        titles = [a.get('title') for a in response.data['results']]
         self.assertIn("Pub2 Article", titles)
         self.assertNotIn("Pub1 Article", titles)
 
@@ -79,5 +80,99 @@ class ArticleAPITests(APITestCase):
         self.client.force_authenticate(user=self.reader)
         url = reverse('journalist_articles_api')
         response = self.client.get(url)
-        titles = [a.get('title') for a in response.data]
+        titles = [a.get('title') for a in response.data['results']]
         self.assertNotIn("Unapproved", titles)
+
+
+class PaginationAPITests(APITestCase):
+    """
+    Tests for keyset pagination on the list endpoints.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Publisher")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.reader.subscribed_publishers.add(self.publisher)
+        for i in range(5):
+            Newsletter.objects.create(
+                title=f"Newsletter {i}", content="Content",
+                author=self.journalist, publisher=self.publisher,
+            )
+        self.client.force_authenticate(user=self.reader)
+
+    def test_cursor_walks_every_item_once_newest_first(self):
+        url = reverse('newsletter_api') + '?page_size=2'
+        titles = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [n['title'] for n in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(titles, [f"Newsletter {i}" for i in reversed(range(5))])
+
+    @override_settings(API_MAX_PAGE_SIZE=3)
+    def test_page_size_is_capped(self):
+        response = self.client.get(reverse('newsletter_api') + '?page_size=1000')
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse('newsletter_api') + '?cursor=garbage')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_followed_sources_are_merged_across_page_bounds(self):
+        # A busy source and two quiet ones interleaved in time.
+        quiet = [Publisher.objects.create(name=f"Quiet {i}") for i in range(2)]
+        self.reader.subscribed_publishers.add(*quiet)
+        Publisher.objects.create(name="Unfollowed")
+        for i in range(9):
+            publisher = quiet[i // 3 % 2] if i % 3 == 0 else self.publisher
+            Article.objects.create(title=f"Story {i}", description="desc", content="body", approved=True,
+                                   author=self.journalist, publisher=publisher)
+        url = reverse('publisher_articles_api') + '?page_size=2'
+        titles = []
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            titles += [a['title'] for a in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(titles, [f"Story {i}" for i in reversed(range(9))])
+
+
+class ListRepresentationAPITests(APITestCase):
+    """
+    Tests pinning query counts and payload shape of the list endpoints.
+    """
+    def setUp(self):
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        for i in range(3):
+            publisher = Publisher.objects.create(name=f"Publisher {i}")
+            journalist = CustomUser.objects.create_user(username=f"j{i}", password="pass", role="journalist")
+            self.reader.subscribed_publishers.add(publisher)
+            self.reader.subscribed_journalists.add(journalist)
+            Article.objects.create(
+                title=f"Article {i}", description="Desc", content="Long body",
+                approved=True, author=journalist, publisher=publisher,
+            )
+            Newsletter.objects.create(
+                title=f"Newsletter {i}", content="Long body",
+                author=journalist, publisher=publisher,
+            )
+        self.client.force_authenticate(user=self.reader)
+
+    def test_each_list_endpoint_uses_one_query(self):
+        for name in ['publisher_articles_api', 'journalist_articles_api', 'newsletter_api']:
+            with self.subTest(endpoint=name), self.assertNumQueries(1):
+                response = self.client.get(reverse(name))
+                self.assertEqual(len(response.data['results']), 3)
+                self.assertEqual(response.data['results'][0]['author']['username'], "j2")
+
+    def test_compact_mode_omits_content(self):
+        response = self.client.get(reverse('publisher_articles_api') + '?compact=true')
+        article = response.data['results'][0]
+        self.assertNotIn('content', article)
+        self.assertEqual(article['publisher']['name'], "Publisher 2")
+
+    def test_sparse_fieldset(self):
+        response = self.client.get(reverse('newsletter_api') + '?fields=id,title')
+        self.assertEqual(set(response.data['results'][0]), {'id', 'title'})
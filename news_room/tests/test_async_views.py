@@ -0,0 +1,110 @@
+from io import StringIO
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import LiveServerTestCase, TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from news_room.benchmarking import run_load
+from news_room.models import Article, CustomUser, Newsletter, Publisher
+
+
+class AsyncReadPathTests(TestCase):
+    """
+    Tests that the async API and feed views mirror their sync counterparts.
+    """
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.reader.subscribed_publishers.add(self.publisher)
+        self.articles = [
+            Article.objects.create(title=f"Story {i}", description="desc", content="body", approved=True,
+                                   author=self.journalist, publisher=self.publisher)
+            for i in range(3)
+        ]
+        Newsletter.objects.create(title="Weekly", content="body", author=self.journalist, publisher=self.publisher)
+        self.token = Token.objects.create(user=self.reader)
+        self.auth = {'Authorization': f'Token {self.token.key}'}
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.reader)
+
+    async def test_lists_match_sync_views(self):
+        for sync_name, async_name in [('publisher_articles_api', 'async_publisher_articles_api'),
+                                      ('newsletter_api', 'async_newsletter_api')]:
+            params = {'page_size': 2, 'compact': 'true'}
+            expected = (await self.async_sync_get(reverse(sync_name), params)).json()
+            response = await self.async_client.get(reverse(async_name), params, headers=self.auth)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertEqual(data['results'], expected['results'])
+            self.assertEqual(data['next'] is None, expected['next'] is None)
+
+    async def test_cursor_and_conditional_get(self):
+        url = reverse('async_publisher_articles_api')
+        first = await self.async_client.get(url, {'page_size': 2}, headers=self.auth)
+        second = await self.async_client.get(first.json()['next'], headers=self.auth)
+        self.assertEqual([a['title'] for a in second.json()['results']], ["Story 0"])
+        repeat = await self.async_client.get(url, {'page_size': 2},
+                                            headers={**self.auth, 'If-None-Match': first['ETag']})
+        self.assertEqual(repeat.status_code, 304)
+        invalid = await self.async_client.get(url, {'cursor': 'bogus'}, headers=self.auth)
+        self.assertEqual(invalid.status_code, 404)
+
+    async def test_detail_matches_sync_view(self):
+        article = self.articles[0]
+        expected = (await self.async_sync_get(reverse('article_detail_api', args=[article.id]))).json()
+        url = reverse('async_article_detail_api', args=[article.id])
+        self.assertEqual((await self.async_client.get(url, headers=self.auth)).json(), expected)
+        missing = await self.async_client.get(reverse('async_article_detail_api', args=[999999]),
+                                              headers=self.auth)
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_token_required(self):
+        response = await self.async_client.get(reverse('async_newsletter_api'))
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get(reverse('async_newsletter_api'),
+                                               headers={'Authorization': 'Token nope'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_feed(self):
+        url = reverse('async_publisher_feed', args=[self.publisher.id, 'atom'])
+        first = await self.async_client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn(b"Story 2", first.content)
+        repeat = await self.async_client.get(url, headers={'If-None-Match': first['ETag']})
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual((await self.async_client.get(reverse('async_feed', args=['json']))).status_code, 404)
+        self.assertEqual((await self.async_client.post(url)).status_code, 405)
+
+    async def async_sync_get(self, url, params=None):
+        return await sync_to_async(self.api.get)(url, params)
+
+
+class ConcurrencyBenchmarkTests(LiveServerTestCase):
+    """
+    Tests for the HTTP load generator behind bench_concurrency.
+    """
+    def setUp(self):
+        publisher = Publisher.objects.create(name="Pub")
+        journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        Article.objects.create(title="Story", description="desc", content="body", approved=True,
+                               author=journalist, publisher=publisher)
+
+    def test_load_and_command(self):
+        url = reverse('feed', args=['rss'])
+        # Render the feed once; the in-memory test database locks tables
+        # when concurrent requests write it.
+        self.client.get(url)
+        result = run_load(self.live_server_url + url, clients=4, requests=20)
+        self.assertEqual((result['ok'], result['errors']), (20, 0))
+        self.assertGreater(result['rps'], 0)
+
+        out = StringIO()
+        call_command('bench_concurrency', '--wsgi', self.live_server_url, '--asgi', self.live_server_url,
+                     '--clients', '2', '--requests-per-client', '2', stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in lines], ['wsgi', 'asgi'])
+        self.assertTrue(all(line.endswith('errors 0') for line in lines))
@@ -0,0 +1,49 @@
+import os
+from unittest import skipUnless
+from django.core.cache import cache
+from django.test import TestCase
+from news_room.budgets import budgets_from, check_budgets, load_budgets, measure_endpoints
+from news_room.seeding import seed_scale
+from news_room.urls import urlpatterns
+
+# Larger datasets take minutes to seed; list them to opt in, e.g. PERF_BUDGET_SIZES=medium,large.
+OPT_IN = os.environ.get('PERF_BUDGET_SIZES', '').split(',')
+
+
+class EndpointBudgetTests(TestCase):
+    """
+    Tests that every route stays within the committed performance budget.
+    """
+    def setUp(self):
+        cache.clear()
+
+    def assertWithinBudget(self, size):
+        budgets = load_budgets()
+        self.assertIn(size, budgets)
+        seed_scale(size=size)
+        results = measure_endpoints()
+        self.assertEqual(set(results), {pattern.name for pattern in urlpatterns if getattr(pattern, 'name', None)})
+        self.assertEqual([name for name, result in results.items() if result['status'] >= 500], [])
+        self.assertEqual(check_budgets(results, budgets[size]), [])
+
+    def test_small(self):
+        self.assertWithinBudget('small')
+
+    @skipUnless('medium' in OPT_IN, "set PERF_BUDGET_SIZES=medium")
+    def test_medium(self):
+        self.assertWithinBudget('medium')
+
+    @skipUnless('large' in OPT_IN, "set PERF_BUDGET_SIZES=large")
+    def test_large(self):
+        self.assertWithinBudget('large')
+
+    def test_check_reports_exceeded_and_missing_budgets(self):
+        results = {'feed': {'status': 200, 'queries': 2, 'ms': 10.0, 'peak_kb': 100}}
+        budgets = budgets_from(results)
+        self.assertEqual(budgets['feed'], {'queries': 2, 'ms': 100, 'peak_kb': 214})
+        self.assertEqual(check_budgets(results, budgets), [])
+
+        results['feed']['queries'] = 3
+        results['directory'] = {'status': 200, 'queries': 1, 'ms': 1.0, 'peak_kb': 1}
+        self.assertEqual(check_budgets(results, budgets),
+                         ["feed: queries 3 exceeds budget 2", "directory: no budget"])
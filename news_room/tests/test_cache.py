@@ -0,0 +1,97 @@
+import tempfile
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from news_room.models import Article, CustomUser, Newsletter, Publisher
+
+
+class ResponseCacheTests(TestCase):
+    """
+    Tests for versioned page and API caching with conditional GET.
+    """
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.article = Article.objects.create(
+            title="Story", description="desc", content="body", approved=True,
+            author=self.journalist, publisher=self.publisher,
+        )
+        Newsletter.objects.create(title="Weekly", content="body", author=self.journalist, publisher=self.publisher)
+        self.client.login(username="reader", password="pass")
+
+    def get(self, url, **extra):
+        # The first rendered form sets the CSRF cookie, which is part of the key.
+        if 'csrftoken' not in self.client.cookies:
+            self.client.get(url)
+        return self.client.get(url, **extra)
+
+    def test_repeat_page_request_skips_orm_and_rendering(self):
+        first = self.get(reverse('article_list'))
+        self.assertIn('ETag', first)
+        self.assertIn('Last-Modified', first)
+        # Only the session and user lookups remain.
+        with self.assertNumQueries(2):
+            second = self.client.get(reverse('article_list'))
+        self.assertEqual(second.content, first.content)
+
+    @override_settings(ARTICLE_LIST_PAGE_SIZE=1)
+    def test_article_list_pages_are_cached_separately(self):
+        Article.objects.create(title="Newer", description="desc", content="body", approved=True,
+                               author=self.journalist, publisher=self.publisher)
+        first = self.get(reverse('article_list'))
+        self.assertContains(first, "Newer")
+        self.assertNotContains(first, "Story")
+        second = self.client.get(reverse('article_list'), {'cursor': first.context['next_cursor']})
+        self.assertContains(second, "Story")
+        self.assertIsNone(second.context['next_cursor'])
+        self.assertEqual(self.client.get(reverse('article_list'), {'cursor': 'bad'}).status_code, 404)
+
+    def test_matching_etag_returns_304(self):
+        etag = self.get(reverse('view_article', args=[self.article.id]))['ETag']
+        response = self.get(reverse('view_article', args=[self.article.id]), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_article_save_invalidates_cached_pages(self):
+        etag = self.get(reverse('article_list'))['ETag']
+        self.article.title = "Updated Story"
+        self.article.save()
+        response = self.get(reverse('article_list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Updated Story")
+
+    def test_subscribing_invalidates_only_that_readers_pages(self):
+        self.client.get(reverse('article_list'))
+        self.reader.subscribed_publishers.add(self.publisher)
+        response = self.client.get(reverse('article_list'))
+        self.assertContains(response, "Subscribed to Publisher")
+
+    def test_api_conditional_get(self):
+        api = APIClient()
+        api.force_authenticate(user=self.reader)
+        first = api.get(reverse('newsletter_api'))
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(api.get(reverse('newsletter_api'), HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        Newsletter.objects.create(title="Daily", content="body", author=self.journalist, publisher=self.publisher)
+        response = api.get(reverse('newsletter_api'), HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['title'], "Daily")
+
+
+class FileCacheBackendTests(ResponseCacheTests):
+    """
+    Runs the response cache tests against Django's file-based cache backend.
+    """
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        override = override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': self.cache_dir.name,
+        }})
+        override.enable()
+        self.addCleanup(override.disable)
+        super().setUp()
@@ -1,6 +1,10 @@
-from django.test import TestCase
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from news_room.models import CustomUser, Publisher, Article
+from news_room.models import CustomUser, Publisher, Article, Newsletter, clear_role_group_cache, role_group_id
 
 
 class CoreModelsTests(TestCase):
@@ -47,3 +51,221 @@ class CoreViewsTests(TestCase):
         response = self.client.get(reverse('dashboard'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "journalist1")
+
+
+class UserRoleTests(TestCase):
+    """
+    Tests that role reconciliation only runs on real role changes.
+    """
+    def setUp(self):
+        cache.clear()
+        # Ids created inside a rolled-back test transaction must not leak.
+        clear_role_group_cache()
+        self.addCleanup(clear_role_group_cache)
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+
+    def test_save_without_role_change_is_one_query(self):
+        reader = CustomUser.objects.get(pk=self.reader.pk)
+        reader.first_name = "Ada"
+        with self.assertNumQueries(1):
+            reader.save()
+
+    def test_create_uses_cached_role_group(self):
+        role_group_id('editor')
+        with self.assertNumQueries(2):
+            user = CustomUser.objects.create(username="new", role="editor")
+        self.assertEqual(list(user.groups.values_list('name', flat=True)), ["Editor"])
+
+    def test_role_change_reconciles_groups_and_relations(self):
+        self.reader.subscribed_publishers.add(self.publisher)
+        self.reader.subscribed_journalists.add(self.journalist)
+        self.reader.role = 'journalist'
+        self.reader.save()
+        self.assertEqual(list(self.reader.groups.values_list('name', flat=True)), ["Journalist"])
+        self.assertFalse(self.reader.subscribed_publishers.exists())
+        self.assertFalse(self.reader.subscribed_journalists.exists())
+
+    def test_deleted_role_group_is_recreated(self):
+        Group.objects.filter(name="Reader").delete()
+        user = CustomUser.objects.create(username="late", role="reader")
+        self.assertEqual(list(user.groups.values_list('name', flat=True)), ["Reader"])
+
+    def test_group_deleted_by_another_process_is_recreated(self):
+        role_group_id('reader')
+        # Another worker deletes the group; its signal clears the shared cache.
+        CustomUser.groups.through.objects.filter(group__name="Reader").delete()
+        groups = Group.objects.filter(name="Reader")
+        groups._raw_delete(groups.db)
+        cache.delete('role_group:Reader')
+        user = CustomUser.objects.create(username="late", role="reader")
+        self.assertEqual(list(user.groups.values_list('name', flat=True)), ["Reader"])
+
+    def test_subscribe_views_do_not_rewrite_user(self):
+        self.client.force_login(self.reader)
+        other = Publisher.objects.create(name="Warm-up")
+        self.client.post(reverse('subscribe_publisher', args=[other.id]))
+        # Session, user, target, existing-link check, insert, counter,
+        # timeline backfill.
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(reverse('subscribe_publisher', args=[self.publisher.id]))
+        self.assertEqual(len(queries), 7)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(reverse('subscribe_journalist', args=[self.journalist.id]))
+        self.assertEqual(len(queries), 7)
+        self.assertFalse(any(q['sql'].startswith('UPDATE "news_room_customuser" SET "password"') for q in queries))
+        self.assertTrue(self.reader.subscribed_journalists.filter(pk=self.journalist.pk).exists())
+
+
+@override_settings(DASHBOARD_PAGE_SIZE=20)
+class DashboardPaginationTests(TestCase):
+    """
+    Tests for the keyset-paginated dashboard and its fragment endpoint.
+    """
+    def setUp(self):
+        publisher = Publisher.objects.create(name="Pub")
+        journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        Article.objects.bulk_create([
+            Article(title=f"Story {i}", description="desc", content="body", approved=True,
+                    author=journalist, publisher=publisher)
+            for i in range(25)
+        ])
+        self.client.login(username="reader", password="pass")
+
+    def test_dashboard_renders_first_page_in_constant_queries(self):
+        # Session, user and one page of articles.
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('dashboard'))
+        self.assertEqual(len(response.context['articles']), 20)
+        self.assertContains(response, "<h4>Story 24</h4>", html=True)
+        self.assertNotContains(response, "<h4>Story 4</h4>", html=True)
+        self.assertContains(response, "Load more")
+
+    def test_fragment_loads_remaining_articles(self):
+        cursor = self.client.get(reverse('dashboard')).context['next_cursor']
+        response = self.client.get(reverse('dashboard_articles'), {'cursor': cursor})
+        self.assertTemplateNotUsed(response, 'news_room/base.html')
+        self.assertEqual([a.title for a in response.context['articles']],
+                         [f"Story {i}" for i in range(4, -1, -1)])
+        self.assertNotContains(response, "Load more")
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse('dashboard_articles'), {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(ARTICLE_LIST_PAGE_SIZE=2, NEWSLETTER_LIST_PAGE_SIZE=2)
+class JournalistPaginationTests(TestCase):
+    """
+    Tests for the keyset-paginated feedback and newsletter lists.
+    """
+    def setUp(self):
+        cache.clear()
+        publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        other = CustomUser.objects.create_user(username="j2", password="pass", role="journalist")
+        for author in (self.journalist, other):
+            for i in range(3):
+                Article.objects.create(title=f"{author.username} story {i}", description="desc",
+                                       content="body", author=author, publisher=publisher)
+                Newsletter.objects.create(title=f"{author.username} weekly {i}", content="body",
+                                          author=author, publisher=publisher)
+        self.client.login(username="j1", password="pass")
+
+    def pages(self, name, attribute):
+        titles, params = [], {}
+        while True:
+            response = self.client.get(reverse(name), params)
+            titles.append([item.title for item in response.context[attribute]])
+            if not response.context['next_cursor']:
+                break
+            self.assertContains(response, "Next page")
+            params = {'cursor': response.context['next_cursor']}
+        self.assertEqual(self.client.get(reverse(name), {'cursor': 'bogus'}).status_code, 404)
+        return titles
+
+    def test_feedback_pages_own_articles(self):
+        self.assertEqual(self.pages('journalist_feedback', 'articles'),
+                         [["j1 story 2", "j1 story 1"], ["j1 story 0"]])
+
+    def test_my_newsletters_pages_own_newsletters(self):
+        self.assertEqual(self.pages('my_newsletters', 'newsletters'),
+                         [["j1 weekly 2", "j1 weekly 1"], ["j1 weekly 0"]])
+
+    def test_newsletter_list_pages_every_newsletter(self):
+        pages = self.pages('newsletter_list', 'newsletters')
+        self.assertEqual([len(page) for page in pages], [2, 2, 2])
+        self.assertEqual(pages[0], ["j2 weekly 2", "j2 weekly 1"])
+
+
+class PublisherSelectTests(TestCase):
+    """
+    Tests for the publisher select of the article and newsletter forms.
+    """
+    def setUp(self):
+        self.daily = Publisher.objects.create(name="Daily <News>")
+        self.weekly = Publisher.objects.create(name="Weekly")
+        CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.client.login(username="j1", password="pass")
+
+    def test_every_publisher_is_listed_and_escaped(self):
+        for name in ('create_article', 'create_newsletter'):
+            response = self.client.get(reverse(name))
+            self.assertContains(response, f'<option value="{self.daily.id}">Daily &lt;News&gt;</option>')
+            self.assertContains(response, f'<option value="{self.weekly.id}">Weekly</option>')
+
+    def test_invalid_newsletter_keeps_selected_publisher(self):
+        response = self.client.post(reverse('create_newsletter'), {
+            'title': '', 'content': 'body', 'publisher': self.weekly.id,
+        })
+        self.assertContains(response, f'<option value="{self.weekly.id}" selected>Weekly</option>')
+
+
+class DirectoryViewTests(TestCase):
+    """
+    Tests for the annotated, paginated and cached directory.
+    """
+    def setUp(self):
+        cache.clear()
+        self.reader = CustomUser.objects.create_user(username="reader1", password="testpass", role="reader")
+        for i in range(5):
+            journalist = CustomUser.objects.create_user(
+                username=f"journalist{i}", password="testpass", role="journalist"
+            )
+            publisher = Publisher.objects.create(name=f"Publisher {i}")
+            publisher.journalists.add(journalist)
+            self.reader.subscribed_journalists.add(journalist)
+            self.reader.subscribed_publishers.add(publisher)
+        self.client.login(username="reader1", password="testpass")
+
+    def test_query_count_does_not_grow_with_profiles(self):
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(reverse('directory'))
+        cache.clear()
+        for i in range(5, 15):
+            CustomUser.objects.create_user(username=f"journalist{i}", password="testpass", role="journalist")
+            Publisher.objects.create(name=f"Publisher {i}")
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(reverse('directory'))
+        self.assertEqual(len(small), len(large))
+        self.assertContains(response, "Subscribers: 1", count=10)
+
+    def test_cached_listing_is_invalidated_by_subscription(self):
+        self.client.get(reverse('directory'))
+        with CaptureQueriesContext(connection) as cached:
+            self.client.get(reverse('directory'))
+        self.assertFalse(any('news_room_publisher' in q['sql'] for q in cached))
+
+        other = CustomUser.objects.create_user(username="reader2", password="testpass", role="reader")
+        other.subscribed_publishers.add(Publisher.objects.get(name="Publisher 0"))
+        response = self.client.get(reverse('directory'))
+        self.assertContains(response, "Subscribers: 2", count=1)
+
+    @override_settings(DIRECTORY_PAGE_SIZE=2)
+    def test_directory_is_paginated(self):
+        response = self.client.get(reverse('directory') + '?page=3')
+        self.assertContains(response, "journalist4")
+        self.assertNotContains(response, "journalist0")
+        self.assertNotContains(response, "Next")
@@ -0,0 +1,117 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from news_room.ingest import import_articles
+from news_room.models import Article, CustomUser, Publisher
+from news_room.subscriptions import import_subscriptions, update_subscriptions
+
+
+class RelationCounterTests(TestCase):
+    """
+    Tests for the denormalized subscriber, journalist and article counters.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.other = Publisher.objects.create(name="Other")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.readers = [
+            CustomUser.objects.create_user(username=f"r{i}", password="pass", role="reader") for i in range(3)
+        ]
+
+    def counts(self):
+        self.publisher.refresh_from_db()
+        self.journalist.refresh_from_db()
+        return (self.publisher.subscriber_count, self.publisher.journalist_count,
+                self.journalist.subscriber_count, self.journalist.article_count)
+
+    def article(self, title="Story"):
+        article = Article.objects.create(title=title, description="desc", content="body",
+                                         author=self.journalist, publisher=self.publisher)
+        self.journalist.published_articles.add(article)
+        return article
+
+    def test_manager_changes_update_counters(self):
+        for reader in self.readers:
+            reader.subscribed_publishers.add(self.publisher)
+            reader.subscribed_journalists.add(self.journalist)
+        self.publisher.journalists.add(self.journalist)
+        self.article()
+        self.assertEqual(self.counts(), (3, 1, 3, 1))
+
+        # Removing something that is not linked must not decrement.
+        self.readers[0].subscribed_publishers.remove(self.publisher, self.other)
+        self.readers[0].subscribed_publishers.remove(self.publisher)
+        self.journalist.reader_subscribers.remove(self.readers[1])
+        self.assertEqual(self.counts(), (2, 1, 2, 1))
+
+        self.publisher.subscribed_readers.clear()
+        self.readers[2].subscribed_journalists.clear()
+        self.assertEqual(self.counts(), (0, 1, 1, 1))
+
+    def test_role_change_clears_article_count(self):
+        self.article()
+        self.article("Second")
+        self.journalist.role = 'reader'
+        self.journalist.save()
+        self.assertEqual(self.counts()[3], 0)
+
+    def test_bulk_subscriptions_and_import_update_counters(self):
+        update_subscriptions(self.readers[0], 'add', publishers=[self.publisher.id], journalists=[self.journalist.id])
+        import_subscriptions(["reader,publisher,journalist\n", "r1,Pub,\n", "r2,,j1\n"])
+        self.assertEqual(self.counts(), (2, 0, 2, 0))
+        update_subscriptions(self.readers[0], 'set', publishers=[], journalists=[])
+        self.assertEqual(self.counts(), (1, 0, 1, 0))
+
+    def test_article_import_updates_article_count(self):
+        import_articles(['{"title": "T", "content": "c", "publisher": "Pub", "author": "j1"}'] * 3)
+        self.assertEqual(self.counts()[3], 3)
+
+    def test_deletes_release_counts(self):
+        article = self.article()
+        self.readers[0].subscribed_publishers.add(self.publisher)
+        self.readers[0].subscribed_journalists.add(self.journalist)
+        self.publisher.journalists.add(self.journalist)
+        article.delete()
+        self.readers[0].delete()
+        self.assertEqual(self.counts(), (0, 1, 0, 0))
+        self.journalist.delete()
+        self.publisher.refresh_from_db()
+        self.assertEqual(self.publisher.journalist_count, 0)
+
+    def test_stale_instance_save_keeps_counters(self):
+        stale = Publisher.objects.get(pk=self.publisher.pk)
+        self.readers[0].subscribed_publishers.add(self.publisher)
+        stale.name = "Renamed"
+        stale.save()
+        self.assertEqual(self.counts()[0], 1)
+        self.assertEqual(self.publisher.name, "Renamed")
+
+    def test_deferred_fields_are_not_fetched_on_save(self):
+        article = Article.objects.defer('description', 'content').get(pk=self.article().pk)
+        article.title = "Renamed"
+        with CaptureQueriesContext(connection) as queries:
+            article.save()
+        fetches = [query['sql'] for query in queries.captured_queries
+                   if query['sql'].startswith('SELECT') and '"news_room_article"."content"' in query['sql']]
+        self.assertEqual(fetches, [])
+        article = Article.objects.get(pk=article.pk)
+        self.assertEqual((article.title, article.content), ("Renamed", "body"))
+
+    def test_save_of_deleted_row_inserts_it_again(self):
+        stale = Publisher.objects.get(pk=self.other.pk)
+        Publisher.objects.filter(pk=self.other.pk).delete()
+        stale.name = "Restored"
+        stale.save()
+        self.assertEqual(Publisher.objects.get(pk=self.other.pk).name, "Restored")
+
+    def test_recount_repairs_drift(self):
+        self.readers[0].subscribed_publishers.add(self.publisher)
+        Publisher.objects.update(subscriber_count=42)
+        CustomUser.objects.filter(pk=self.journalist.pk).update(article_count=-1)
+        out = StringIO()
+        call_command('recount', stdout=out)
+        self.assertIn("Publisher.subscriber_count: 2 rows corrected", out.getvalue())
+        self.assertIn("CustomUser.article_count: 1 rows corrected", out.getvalue())
+        self.assertEqual(self.counts(), (1, 0, 0, 0))
@@ -0,0 +1,128 @@
+import smtplib
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.test import SimpleTestCase, TestCase, override_settings
+from news_room.benchmarking import LocalSMTPServer
+from news_room.delivery import DeliveryResult, send_bulk
+from news_room.models import Article, CustomUser, EmailDelivery, OutboxEntry, Publisher
+from news_room.outbox import _record, drain
+
+
+class UnreachableBackend(BaseEmailBackend):
+    """
+    Backend whose session drops after the first message and never reconnects.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sent = []
+        self.opened = False
+
+    def open(self):
+        if self.opened:
+            raise ConnectionRefusedError("connection refused")
+        self.opened = True
+
+    def send_messages(self, messages):
+        if self.sent:
+            raise smtplib.SMTPServerDisconnected("gone")
+        self.sent.extend(messages)
+        return len(messages)
+
+
+class SendBulkTests(SimpleTestCase):
+    """
+    Tests for the delivery engine against a local SMTP stand-in.
+    """
+    def test_one_session_one_message_per_recipient(self):
+        addresses = [f"r{i}@example.com" for i in range(5)]
+        with LocalSMTPServer() as server:
+            results = list(send_bulk("Subject", "Body", addresses,
+                                     connection=server.connection(), chunk_size=1))
+        self.assertEqual(server.sessions, 1)
+        self.assertEqual(server.messages, 5)
+        self.assertEqual([r.status for r in results], ['sent'] * 5)
+
+    def test_rejected_recipient_does_not_stop_delivery(self):
+        addresses = ["a@example.com", "bad@example.com", "c@example.com"]
+        with LocalSMTPServer(reject={"bad@example.com"}) as server:
+            results = list(send_bulk("Subject", "Body", addresses,
+                                     connection=server.connection(), chunk_size=1))
+        statuses = {r.email: r.status for r in results}
+        self.assertEqual(statuses["bad@example.com"], 'rejected')
+        self.assertEqual(server.recipients, ["a@example.com", "c@example.com"])
+
+    def test_rejected_recipient_keeps_the_session(self):
+        addresses = ["a@example.com", "bad@example.com", "c@example.com",
+                     "worse@example.com", "e@example.com"]
+        with LocalSMTPServer(reject={"bad@example.com", "worse@example.com"}) as server:
+            results = list(send_bulk("Subject", "Body", addresses,
+                                     connection=server.connection(), chunk_size=1))
+        self.assertEqual(server.sessions, 1)
+        self.assertEqual([r.status for r in results],
+                         ['sent', 'rejected', 'sent', 'rejected', 'sent'])
+
+    def test_bcc_chunks_hide_recipients(self):
+        addresses = [f"r{i}@example.com" for i in range(4)]
+        with LocalSMTPServer() as server:
+            list(send_bulk("Subject", "Body", addresses,
+                           connection=server.connection(), chunk_size=2))
+        self.assertEqual(server.messages, 2)
+        self.assertEqual(sorted(server.recipients), addresses)
+
+    def test_unreachable_server_fails_remaining_recipients(self):
+        addresses = [f"r{i}@example.com" for i in range(4)]
+        backend = UnreachableBackend()
+        results = list(send_bulk("Subject", "Body", addresses, connection=backend, chunk_size=1))
+        self.assertEqual([r.status for r in results], ['sent', 'failed', 'failed', 'failed'])
+        self.assertEqual([r.email for r in results], addresses)
+        self.assertIn("ConnectionRefusedError", results[-1].error)
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', X_API_KEY=None)
+class ArticleEmailDeliveryTests(TestCase):
+    """
+    Tests that the outbox email handler records an outcome per recipient.
+    """
+    def setUp(self):
+        publisher = Publisher.objects.create(name="Pub")
+        journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        for i in range(3):
+            reader = CustomUser.objects.create_user(
+                username=f"r{i}", password="pass", role="reader", email=f"r{i}@example.com"
+            )
+            reader.subscribed_publishers.add(publisher)
+        self.article = Article.objects.create(
+            title="Story", description="desc", content="content",
+            author=journalist, publisher=publisher,
+        )
+
+    def test_each_reader_gets_an_individual_message(self):
+        self.article.approved = True
+        self.article.save()
+        drain()
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertTrue(all(len(m.recipients()) == 1 for m in mail.outbox))
+        self.assertEqual(EmailDelivery.objects.filter(status='sent').count(), 3)
+
+    def test_retry_skips_recipients_already_sent(self):
+        self.article.approved = True
+        self.article.save()
+        entry = OutboxEntry.objects.get(kind='article_email')
+        EmailDelivery.objects.create(outbox_entry=entry, email="r0@example.com", status='sent')
+        drain()
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), ["r1@example.com", "r2@example.com"])
+
+    def test_outcomes_are_saved_when_sending_stops(self):
+        self.article.approved = True
+        self.article.save()
+        entry = OutboxEntry.objects.get(kind='article_email')
+
+        def interrupted():
+            yield DeliveryResult("r0@example.com", 'sent', '')
+            yield DeliveryResult("r1@example.com", 'failed', 'timeout')
+            raise RuntimeError("worker stopped")
+
+        with self.assertRaises(RuntimeError):
+            _record(entry, interrupted())
+        self.assertEqual(sorted(entry.deliveries.values_list('email', 'status')),
+                         [("r0@example.com", 'sent'), ("r1@example.com", 'failed')])
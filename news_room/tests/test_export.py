@@ -0,0 +1,137 @@
+import asyncio
+import gzip
+import json
+import os
+import tempfile
+import tracemalloc
+import warnings
+from datetime import timedelta
+from io import StringIO
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from news_room.export import iter_export
+from news_room.models import Article, CustomUser, Publisher
+from news_room.serializers import ArticleSerializer
+
+
+class ArticleExportTests(TestCase):
+    """
+    Tests for the streaming NDJSON archive export.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.other = Publisher.objects.create(name="Other")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.old = self.article("Old story", approved=True)
+        Article.objects.filter(pk=self.old.pk).update(created_at=timezone.now() - timedelta(days=30))
+        self.new = self.article("New störy", approved=True, publisher=self.other)
+        self.article("Draft", approved=False)
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.reader)
+
+    def article(self, title, approved, publisher=None):
+        return Article.objects.create(title=title, description="desc", content="body", approved=approved,
+                                      author=self.journalist, publisher=publisher or self.publisher)
+
+    def export(self, **params):
+        response = self.api.get(reverse('article_export_api'), params)
+        self.assertTrue(response.streaming)
+        return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+    def test_streams_approved_articles_oldest_first_like_the_serializer(self):
+        records = self.export()
+        self.assertEqual([r['title'] for r in records], ["Old story", "New störy"])
+        self.old.refresh_from_db()
+        expected = json.loads(JSONRenderer().render(ArticleSerializer(self.old).data))
+        self.assertEqual(records[0], expected)
+
+    def test_since_and_publisher_filters(self):
+        since = (timezone.now() - timedelta(days=1)).date().isoformat()
+        self.assertEqual([r['title'] for r in self.export(since=since)], ["New störy"])
+        self.assertEqual([r['title'] for r in self.export(publisher=self.publisher.id)], ["Old story"])
+        self.assertEqual(len(self.export(publisher=[self.publisher.id, self.other.id])), 2)
+
+    def test_invalid_filters_are_rejected(self):
+        self.assertEqual(self.api.get(reverse('article_export_api'), {'since': 'yesterday'}).status_code, 400)
+        self.assertEqual(self.api.get(reverse('article_export_api'), {'publisher': 'x'}).status_code, 400)
+
+    def test_gzip_when_accepted(self):
+        response = self.api.get(reverse('article_export_api'), HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        lines = gzip.decompress(b''.join(response.streaming_content)).splitlines()
+        self.assertEqual(len(lines), 2)
+
+    def test_requires_authentication(self):
+        self.assertIn(APIClient().get(reverse('article_export_api')).status_code, (401, 403))
+
+    def test_memory_does_not_grow_with_archive_size(self):
+        def peak(count):
+            Article.objects.all().delete()
+            Article.objects.bulk_create([
+                Article(title=f"Story {i}", description="desc", content="body " * 50, approved=True,
+                        author=self.journalist, publisher=self.publisher)
+                for i in range(count)
+            ])
+            tracemalloc.start()
+            for _ in iter_export(chunk_size=100, block_size=16 * 1024):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        small, large = peak(300), peak(3000)
+        self.assertLess(large, small * 1.5 + 100 * 1024)
+
+    @override_settings(ASGI_SERVER=True)
+    async def test_asgi_streams_without_collecting_the_body(self):
+        token = await Token.objects.acreate(user=self.reader)
+        path = reverse('article_export_api')
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+            'headers': [(b'host', b'testserver'), (b'authorization', f'Token {token.key}'.encode())],
+            'client': ('127.0.0.1', 50000), 'server': ('testserver', 80),
+        }
+        requests = asyncio.Queue()
+        await requests.put({'type': 'http.request', 'body': b'', 'more_body': False})
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        # Like Django's test client, keep the test transaction's connection open.
+        request_started.disconnect(close_old_connections)
+        request_finished.disconnect(close_old_connections)
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                await ASGIHandler()(scope, requests.get, send)
+        finally:
+            request_started.connect(close_old_connections)
+            request_finished.connect(close_old_connections)
+
+        self.assertEqual([str(w.message) for w in caught if 'synchronous iterators' in str(w.message)], [])
+        self.assertEqual(messages[0]['status'], 200)
+        body = b''.join(m.get('body', b'') for m in messages if m['type'] == 'http.response.body')
+        self.assertEqual([json.loads(line)['title'] for line in body.splitlines()], ["Old story", "New störy"])
+
+    def test_command_writes_gzip_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'archive.ndjson.gz')
+            out = StringIO()
+            call_command('export_articles', '--output', path, '--gzip',
+                         '--publisher', str(self.other.id), stdout=out)
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual([r['title'] for r in records], ["New störy"])
+        self.assertIn("Wrote", out.getvalue())
@@ -0,0 +1,112 @@
+import xml.etree.ElementTree as ET
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from news_room.models import Article, CustomUser, Publisher, RenderedFeed
+from news_room.moderation import moderate_articles
+from news_room.outbox import drain
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+
+
+class SyndicationFeedTests(TestCase):
+    """
+    Tests for pre-rendered RSS and Atom feeds.
+    """
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.article = Article.objects.create(title="Scoop", description="desc", content="body",
+                                              author=self.journalist, publisher=self.publisher)
+
+    def drain(self):
+        # Rendered feeds reach the cache once the worker's transaction commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            drain()
+
+    def approve(self, article):
+        article.approved = True
+        article.save()
+        self.drain()
+
+    def rss_titles(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [item.findtext('title') for item in ET.fromstring(response.content).iter('item')]
+
+    def test_approval_renders_global_publisher_and_journalist_feeds(self):
+        self.approve(self.article)
+        self.assertEqual(RenderedFeed.objects.count(), 6)
+        self.assertEqual(self.rss_titles(reverse('feed', args=['rss'])), ["Scoop"])
+        self.assertEqual(self.rss_titles(reverse('publisher_feed', args=[self.publisher.id, 'rss'])), ["Scoop"])
+
+        response = self.client.get(reverse('journalist_feed', args=[self.journalist.id, 'atom']))
+        self.assertEqual(response['Content-Type'], 'application/atom+xml; charset=utf-8')
+        entries = ET.fromstring(response.content).findall(f'{ATOM}entry')
+        self.assertEqual([entry.findtext(f'{ATOM}title') for entry in entries], ["Scoop"])
+
+    def test_polls_are_served_from_cache_with_validators(self):
+        self.approve(self.article)
+        url = reverse('feed', args=['rss'])
+        first = self.client.get(url)
+        self.assertIn('public', first['Cache-Control'])
+        with self.assertNumQueries(0):
+            again = self.client.get(url)
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+            not_modified_since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(again.content, first.content)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified_since.status_code, 304)
+
+    def test_withdrawal_and_deletion_update_feeds(self):
+        other = Article.objects.create(title="Follow-up", description="desc", content="body",
+                                       author=self.journalist, publisher=self.publisher)
+        self.approve(self.article)
+        self.approve(other)
+        url = reverse('publisher_feed', args=[self.publisher.id, 'rss'])
+        etag = self.client.get(url)['ETag']
+
+        moderate_articles([other.id], 'revise', feedback="Check sources")
+        self.drain()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.rss_titles(url), ["Scoop"])
+
+        self.article.delete()
+        self.drain()
+        self.assertEqual(self.rss_titles(reverse('feed', args=['rss'])), [])
+
+    def test_unknown_feeds_are_not_found(self):
+        reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.assertEqual(self.client.get(reverse('feed', args=['json'])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('publisher_feed', args=[999999, 'rss'])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('journalist_feed', args=[reader.id, 'rss'])).status_code, 404)
+
+    def test_unknown_feed_polls_do_not_write(self):
+        url = reverse('publisher_feed', args=[999999, 'atom'])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 404)
+        statements = [query['sql'].split()[0].upper() for query in queries.captured_queries]
+        self.assertEqual(set(statements), {'SELECT'})
+
+    def test_first_poll_renders_without_writing_and_feed_drops_with_its_source(self):
+        url = reverse('publisher_feed', args=[self.publisher.id, 'rss'])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.rss_titles(url), [])
+        statements = [query['sql'].split()[0].upper() for query in queries.captured_queries]
+        self.assertEqual(set(statements), {'SELECT'})
+        self.assertFalse(RenderedFeed.objects.exists())
+        self.publisher.delete()
+        self.drain()
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_render_feeds_command(self):
+        out = StringIO()
+        call_command('render_feeds', stdout=out)
+        self.assertIn("Rendered 3 feeds.", out.getvalue())
+        self.assertEqual(RenderedFeed.objects.count(), 6)
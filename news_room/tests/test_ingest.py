@@ -0,0 +1,113 @@
+import json
+import tempfile
+import uuid
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from news_room.ingest import import_articles
+from news_room.models import Article, CustomUser, Publisher
+
+
+def ndjson(records):
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+class ArticleImportTests(TestCase):
+    """
+    Tests for bulk NDJSON article import via the command and the API.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Wire")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.other = CustomUser.objects.create_user(username="j2", password="pass", role="journalist")
+
+    def records(self, count, **extra):
+        return [{'title': f"Wire {i}", 'description': "desc", 'content': "body",
+                 'publisher': "Wire", 'author': "j1", **extra} for i in range(count)]
+
+    def test_query_count_does_not_grow_with_batch(self):
+        counts = []
+        for size in (5, 50):
+            with CaptureQueriesContext(connection) as queries:
+                summary = import_articles(ndjson(self.records(size)).splitlines(), batch_size=100)
+            self.assertEqual(summary.created, size)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(self.journalist.published_articles.count(), 55)
+        self.assertFalse(Article.objects.filter(approved=True).exists())
+
+    def test_backends_without_returned_ids_still_insert_in_bulk(self):
+        records = self.records(3) + self.records(2)
+        with CaptureQueriesContext(connection) as returning:
+            import_articles(ndjson(records).splitlines())
+        with mock.patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False), \
+                CaptureQueriesContext(connection) as queries:
+            summary = import_articles(ndjson(records).splitlines())
+        self.assertEqual(summary.created, 5)
+        self.assertEqual(len(queries), len(returning) + 1)
+        linked = set(self.journalist.published_articles.values_list('id', flat=True))
+        self.assertEqual(linked, set(Article.objects.values_list('id', flat=True)))
+        self.assertEqual(len(linked), 10)
+
+    def test_unmatched_import_batch_rolls_back(self):
+        token = uuid.uuid4()
+        Article.objects.create(title="Earlier", description="desc", content="body", author=self.journalist,
+                               publisher=self.publisher, import_batch=token)
+        with mock.patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False), \
+                mock.patch('news_room.ingest.uuid.uuid4', return_value=token), \
+                self.assertRaisesMessage(DatabaseError, "matched 4 rows for 3 inserted articles"):
+            import_articles(ndjson(self.records(3)).splitlines())
+        self.assertEqual(Article.objects.count(), 1)
+        self.assertFalse(self.journalist.published_articles.exists())
+
+    def test_command_reports_rejections_and_throughput(self):
+        lines = ndjson(self.records(3) + [
+            {'title': "No body", 'publisher': "Wire", 'author': "j1"},
+            {'title': "Nowhere", 'content': "body", 'publisher_id': 999, 'author': "j1"},
+        ]) + "not json\n"
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson') as f:
+            f.write(lines)
+            f.flush()
+            out, err = StringIO(), StringIO()
+            call_command('import_articles', f.name, '--batch-size', '2', stdout=out, stderr=err)
+        self.assertIn("Imported 3 articles", out.getvalue())
+        self.assertIn("articles/s", out.getvalue())
+        self.assertIn("line 4: content is required.", err.getvalue())
+        self.assertIn("line 5: Unknown publisher.", err.getvalue())
+        self.assertIn("line 6: Invalid JSON", err.getvalue())
+
+    def test_api_imports_as_requesting_journalist(self):
+        client = APIClient()
+        client.force_authenticate(user=self.journalist)
+        body = ndjson(self.records(2) + [{'title': "Spoof", 'content': "body", 'publisher': "Wire",
+                                          'author': "j2"}])
+        response = client.post(reverse('article_import_api'), body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['rejected'],
+                         [{'line': 3, 'error': "Articles can only be imported for yourself."}])
+        self.assertFalse(Article.objects.filter(author=self.other).exists())
+
+    @override_settings(IMPORT_MAX_REJECTIONS=2)
+    def test_api_caps_reported_rejections(self):
+        client = APIClient()
+        client.force_authenticate(user=self.journalist)
+        body = ndjson(self.records(1)) + "not json\n" * 5
+        response = client.post(reverse('article_import_api'), body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([rejection['line'] for rejection in response.data['rejected']], [2, 3])
+        self.assertEqual(response.data['rejected_count'], 5)
+
+    def test_api_rejects_readers(self):
+        reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        client = APIClient()
+        client.force_authenticate(user=reader)
+        response = client.post(reverse('article_import_api'), ndjson(self.records(1)),
+                               content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Article.objects.exists())
@@ -0,0 +1,84 @@
+import re
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from news_room import metrics
+from news_room.models import Article, CustomUser, Publisher
+
+
+def sample(text, name, **labels):
+    """
+    Value of the exposition line for ``name`` whose labels include ``labels``.
+    """
+    for line in text.splitlines():
+        match = re.match(rf'{name}\{{(.*)\}} (\S+)$', line)
+        if match and all(f'{key}="{value}"' in match.group(1) for key, value in labels.items()):
+            return float(match.group(2))
+    return None
+
+
+class RequestMetricsTests(TestCase):
+    """
+    Tests for per-view request metrics and the Prometheus endpoint.
+    """
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.staff = CustomUser.objects.create_user(username="ops", password="pass", is_staff=True)
+        for i in range(6):
+            Article.objects.create(title=f"Story {i}", description="desc", content="body", approved=True,
+                                   author=self.journalist, publisher=self.publisher)
+
+    def scrape(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        return response.content.decode()
+
+    def test_records_queries_templates_and_latency_per_view(self):
+        self.client.force_login(self.journalist)
+        self.client.get(reverse('dashboard'))
+        self.client.get(reverse('dashboard'))
+        text = self.scrape()
+        labels = {'view': 'news_room.views.dashboard_view', 'url_name': 'dashboard'}
+        self.assertEqual(sample(text, 'newsroom_request_duration_seconds_count', **labels), 2)
+        self.assertEqual(sample(text, 'newsroom_request_duration_seconds_bucket', le='+Inf', **labels), 2)
+        self.assertGreater(sample(text, 'newsroom_db_queries_per_request_sum', **labels), 0)
+        self.assertGreater(sample(text, 'newsroom_db_duration_seconds_sum', **labels), 0)
+        self.assertGreater(sample(text, 'newsroom_template_duration_seconds_sum', **labels), 0)
+        self.assertIsNone(sample(text, 'newsroom_suspected_n_plus_one_total', **labels))
+
+    def test_flags_repeated_statements(self):
+        with metrics.collecting() as stats:
+            authors = [article.author.username for article in Article.objects.all()]
+        self.assertEqual(len(authors), 6)
+        self.assertEqual(stats['queries'], 7)
+        repeated = metrics.repeated_statements(stats)
+        self.assertEqual(list(repeated.values()), [6])
+
+        with self.assertLogs('news_room.metrics', 'WARNING'):
+            metrics.record(('news_room.views.example', 'example'), 0.1, stats)
+        text = self.scrape()
+        labels = {'view': 'news_room.views.example', 'url_name': 'example'}
+        self.assertEqual(sample(text, 'newsroom_suspected_n_plus_one_total', **labels), 1)
+        self.assertEqual(sample(text, 'newsroom_repeated_query_executions', **labels), 6)
+        self.assertIn('news_room_customuser', text)
+
+    async def test_async_views_are_recorded(self):
+        response = await self.async_client.get(reverse('async_feed', args=['rss']))
+        self.assertEqual(response.status_code, 200)
+        text = metrics.render_metrics()
+        self.assertEqual(sample(text, 'newsroom_request_duration_seconds_count',
+                                view='news_room.async_views.feed_view', url_name='async_feed'), 1)
+
+    def test_endpoint_requires_staff_or_token(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        with override_settings(METRICS_TOKEN='s3cret'):
+            self.assertEqual(self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer nope').status_code, 403)
+            response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer s3cret')
+            self.assertEqual(response.status_code, 200)
+        self.assertIn('# TYPE newsroom_request_duration_seconds histogram', response.content.decode())
@@ -0,0 +1,89 @@
+from django.core import mail
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from news_room.models import Article, CustomUser, OutboxEntry, Publisher, SearchDocument
+from news_room.moderation import moderate_articles
+from news_room.outbox import drain
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', X_API_KEY='')
+class BulkModerationTests(TestCase):
+    """
+    Tests for bulk approval and revision with a single digest notification.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.j1 = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.j2 = CustomUser.objects.create_user(username="j2", password="pass", role="journalist")
+        self.editor = CustomUser.objects.create_user(username="ed", password="pass", role="editor")
+        self.publisher.editors.add(self.editor)
+        self.follows_publisher = CustomUser.objects.create_user(
+            username="r1", password="pass", role="reader", email="r1@example.com"
+        )
+        self.follows_j2 = CustomUser.objects.create_user(
+            username="r2", password="pass", role="reader", email="r2@example.com"
+        )
+        self.follows_publisher.subscribed_publishers.add(self.publisher)
+        self.follows_publisher.subscribed_journalists.add(self.j2)
+        self.follows_j2.subscribed_journalists.add(self.j2)
+        self.articles = [
+            Article.objects.create(title=f"Story {i}", description="desc", content="body",
+                                   author=self.j2 if i == 0 else self.j1, publisher=self.publisher)
+            for i in range(3)
+        ]
+        self.ids = [article.id for article in self.articles]
+
+    def test_approve_uses_one_update_and_one_digest(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = moderate_articles(self.ids, 'approve')
+        updates = [q for q in queries if q['sql'].startswith('UPDATE "news_room_article"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(result.approved, self.ids)
+        self.assertEqual(Article.objects.filter(approved=True).count(), 3)
+        self.assertEqual(OutboxEntry.objects.filter(kind='article_digest').count(), 1)
+        self.assertEqual(OutboxEntry.objects.filter(kind='article_timeline').count(), 3)
+        self.assertEqual(SearchDocument.objects.filter(kind='article').count(), 3)
+
+        self.assertEqual(moderate_articles(self.ids, 'approve').updated, [])
+        self.assertEqual(OutboxEntry.objects.filter(kind='article_digest').count(), 1)
+
+    def test_digest_groups_recipients_across_articles(self):
+        moderate_articles(self.ids, 'approve')
+        drain()
+        messages = {message.to[0]: message for message in mail.outbox}
+        self.assertEqual(sorted(messages), ["r1@example.com", "r2@example.com"])
+        self.assertEqual(messages["r1@example.com"].subject, "3 new articles")
+        self.assertEqual(messages["r2@example.com"].subject, "New Article: Story 0")
+
+    def test_revise_withdraws_approved_articles(self):
+        moderate_articles(self.ids[:1], 'approve')
+        result = moderate_articles(self.ids, 'revise', feedback="Cite sources")
+        self.assertEqual(result.updated, self.ids)
+        self.assertEqual(result.withdrawn, self.ids[:1])
+        self.assertEqual(Article.objects.filter(needs_revision=True, editor_feedback="Cite sources").count(), 3)
+        self.assertFalse(SearchDocument.objects.filter(kind='article').exists())
+
+    def test_review_page_form(self):
+        self.client.force_login(self.editor)
+        response = self.client.post(reverse('moderate_articles'), {
+            'action': 'approve', 'article_ids': [str(pk) for pk in self.ids[:2]],
+        }, follow=True)
+        self.assertContains(response, "2 articles approved.")
+        self.assertEqual(Article.objects.filter(approved=True).count(), 2)
+
+    def test_api_requires_editor_and_valid_payload(self):
+        client = APIClient()
+        client.force_authenticate(user=self.j1)
+        url = reverse('article_moderation_api')
+        self.assertEqual(client.post(url, {'article_ids': self.ids, 'action': 'approve'},
+                                     format='json').status_code, 403)
+
+        client.force_authenticate(user=self.editor)
+        self.assertEqual(client.post(url, {'article_ids': self.ids, 'action': 'publish'},
+                                     format='json').status_code, 400)
+        response = client.post(url, {'article_ids': self.ids, 'action': 'approve'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['approved'], self.ids)
@@ -0,0 +1,105 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from news_room.benchmarking import full_table_scans
+from news_room.models import Article, CustomUser, Newsletter, Publisher, TimelineEntry
+from news_room.recipients import recipient_emails
+from news_room.review import held_claims, review_queue, unclaimed
+from news_room.timeline import reader_feed
+
+
+class QueryPlanTests(TestCase):
+    """
+    Regression tests asserting hot queries are served from indexes.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        # Enough distinct sources and readers that ANALYZE statistics make
+        # index lookups cheaper than scans, as they are in production.
+        publishers = Publisher.objects.bulk_create([Publisher(name=f"Pub {i}") for i in range(20)])
+        journalists = CustomUser.objects.bulk_create([
+            CustomUser(username=f"j{i}", role="journalist") for i in range(20)
+        ])
+        readers = CustomUser.objects.bulk_create([
+            CustomUser(username=f"r{i}", role="reader", email=f"r{i}@example.com") for i in range(200)
+        ])
+        PublisherSubscription = CustomUser.subscribed_publishers.through
+        JournalistSubscription = CustomUser.subscribed_journalists.through
+        PublisherSubscription.objects.bulk_create([
+            PublisherSubscription(customuser=reader, publisher=publishers[i % 20])
+            for i, reader in enumerate(readers)
+        ])
+        JournalistSubscription.objects.bulk_create([
+            JournalistSubscription(from_customuser=reader, to_customuser=journalists[i % 20])
+            for i, reader in enumerate(readers)
+        ])
+        Article.objects.bulk_create([
+            Article(title=f"Story {i}", description="desc", content="body", approved=i % 4 != 0,
+                    needs_revision=i % 10 == 0, author=journalists[i % 20], publisher=publishers[i % 19])
+            for i in range(1000)
+        ])
+        Newsletter.objects.bulk_create([
+            Newsletter(title=f"Issue {i}", content="body", author=journalists[i % 20],
+                       publisher=publishers[i % 20])
+            for i in range(500)
+        ])
+        editors = CustomUser.objects.bulk_create([
+            CustomUser(username=f"e{i}", role="editor") for i in range(20)
+        ])
+        Publisher.editors.through.objects.bulk_create([
+            Publisher.editors.through(customuser=editor, publisher=publishers[i])
+            for i, editor in enumerate(editors)
+        ])
+        cls.publisher, cls.journalist, cls.reader = publishers[0], journalists[0], readers[0]
+        cls.editor = editors[0]
+        claimed = Article.objects.filter(publisher=cls.publisher, approved=False).values('id')[:3]
+        Article.objects.filter(id__in=claimed).update(
+            claimed_by=cls.editor, claimed_until=timezone.now() + timedelta(minutes=5)
+        )
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+    def assertIndexed(self, queryset):
+        self.assertEqual(full_table_scans(queryset), [], queryset.explain())
+
+    def recent(self, queryset):
+        return queryset.order_by('-created_at', '-id')[:21]
+
+    def test_approved_article_list(self):
+        self.assertIndexed(self.recent(Article.objects.filter(approved=True)))
+
+    def test_subscribed_article_endpoints(self):
+        self.assertIndexed(self.recent(Article.objects.filter(
+            approved=True, publisher__in=self.reader.subscribed_publishers.all()
+        )))
+        self.assertIndexed(self.recent(Article.objects.filter(
+            approved=True, author__in=self.reader.subscribed_journalists.all()
+        )))
+
+    def test_timeline_backfill_and_journalist_articles(self):
+        self.assertIndexed(self.recent(Article.objects.filter(approved=True, publisher=self.publisher)))
+        self.assertIndexed(Article.objects.filter(author=self.journalist))
+
+    def test_review_queue(self):
+        queue = review_queue(self.editor).filter(unclaimed(timezone.now())).order_by('created_at', 'id')
+        self.assertIndexed(queue[:10])
+        self.assertNotIn('TEMP B-TREE', queue[:10].explain())
+        claims = held_claims(self.editor).select_related('author', 'publisher').order_by('created_at', 'id')[:10]
+        self.assertIn('article_claimed_idx', claims.explain())
+        self.assertNotIn('TEMP B-TREE', claims.explain())
+
+    def test_newsletter_lists(self):
+        self.assertIndexed(self.recent(Newsletter.objects.all()))
+        self.assertIndexed(self.recent(Newsletter.objects.filter(author=self.journalist)))
+
+    def test_feed_and_recipients(self):
+        queryset, fields, sources = reader_feed(self.reader)
+        self.assertIs(queryset.model, TimelineEntry)
+        self.assertIsNone(sources)
+        self.assertIndexed(queryset.order_by(*[f'-{field}' for field in fields])[:21])
+        self.assertIndexed(recipient_emails(Article.objects.first()))
+
+    def test_unindexed_filter_is_reported(self):
+        self.assertEqual(full_table_scans(Article.objects.filter(title="Story 1")), ['news_room_article'])
@@ -0,0 +1,73 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from news_room.models import Article, CustomUser, Publisher, SubscriberIndex
+from news_room.recipients import iter_recipient_emails, recipient_articles, recipient_emails
+
+
+class RecipientResolutionTests(TestCase):
+    """
+    Tests for resolving article recipients with and without the subscriber index.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.both = CustomUser.objects.create_user(
+            username="both", password="pass", role="reader", email="both@example.com"
+        )
+        self.pub_only = CustomUser.objects.create_user(
+            username="pub", password="pass", role="reader", email="pub@example.com"
+        )
+        self.no_email = CustomUser.objects.create_user(username="none", password="pass", role="reader")
+        self.article = Article.objects.create(
+            title="Story", description="desc", content="content",
+            author=self.journalist, publisher=self.publisher,
+        )
+
+    def subscribe_all(self):
+        self.both.subscribed_publishers.add(self.publisher)
+        self.both.subscribed_journalists.add(self.journalist)
+        self.publisher.subscribed_readers.add(self.pub_only, self.no_email)
+
+    def test_distinct_emails_in_one_query(self):
+        self.subscribe_all()
+        with self.assertNumQueries(1):
+            emails = list(iter_recipient_emails(self.article))
+        self.assertEqual(emails, ["both@example.com", "pub@example.com"])
+
+    def test_articles_stream_per_email_in_one_query(self):
+        self.subscribe_all()
+        other = Article.objects.create(title="Other", description="desc", content="content",
+                                       author=self.journalist, publisher=self.publisher)
+        expected = [("both@example.com", {self.article.id, other.id}),
+                    ("pub@example.com", {self.article.id, other.id})]
+        for indexed in (False, True):
+            call_command('rebuild_subscriber_index', stdout=StringIO())
+            with self.settings(SUBSCRIBER_INDEX_ENABLED=indexed), self.assertNumQueries(1):
+                grouped = recipient_articles([self.article, other])
+                self.assertEqual(next(grouped), expected[0])
+                self.assertEqual(list(grouped), expected[1:])
+            self.assertEqual(list(recipient_articles([other], exclude=CustomUser.objects.filter(
+                username="both").values('email'))), [("pub@example.com", {other.id})])
+
+    @override_settings(SUBSCRIBER_INDEX_ENABLED=True)
+    def test_index_follows_subscription_changes(self):
+        self.subscribe_all()
+        self.assertEqual(list(recipient_emails(self.article)), ["both@example.com", "pub@example.com"])
+
+        self.publisher.subscribed_readers.remove(self.pub_only)
+        self.both.email = "new@example.com"
+        self.both.save()
+        self.assertEqual(list(recipient_emails(self.article)), ["new@example.com"])
+
+        self.publisher.subscribed_readers.clear()
+        self.journalist.reader_subscribers.clear()
+        self.assertFalse(SubscriberIndex.objects.exists())
+
+    def test_rebuild_command_populates_index(self):
+        self.subscribe_all()
+        self.assertFalse(SubscriberIndex.objects.exists())
+        call_command('rebuild_subscriber_index', stdout=StringIO())
+        self.assertEqual(SubscriberIndex.objects.count(), 4)
+        with self.settings(SUBSCRIBER_INDEX_ENABLED=True):
+            self.assertEqual(list(recipient_emails(self.article)), ["both@example.com", "pub@example.com"])
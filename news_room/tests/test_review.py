@@ -0,0 +1,120 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from news_room.models import Article, CustomUser, Publisher
+from news_room.review import claim_articles, release_claims, review_queue
+
+
+@override_settings(REVIEW_PAGE_SIZE=2, REVIEW_CLAIM_BATCH=2, X_API_KEY='')
+class ReviewQueueTests(TestCase):
+    """
+    Tests for the per-publisher editor review queue and its claims.
+    """
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.other_publisher = Publisher.objects.create(name="Elsewhere")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.ed1 = CustomUser.objects.create_user(username="ed1", password="pass", role="editor")
+        self.ed2 = CustomUser.objects.create_user(username="ed2", password="pass", role="editor")
+        self.publisher.editors.add(self.ed1, self.ed2)
+        self.articles = [self.article(f"Story {i}", self.publisher) for i in range(5)]
+        self.ids = [article.id for article in self.articles]
+        self.foreign = self.article("Foreign", self.other_publisher)
+        self.article("Live", self.publisher, approved=True)
+
+    def article(self, title, publisher, approved=False):
+        return Article.objects.create(title=title, description=f"{title} teaser", content="FULL BODY",
+                                      approved=approved, author=self.journalist, publisher=publisher)
+
+    def test_queue_is_scoped_paginated_and_oldest_first(self):
+        self.assertEqual(sorted(review_queue(self.ed1).values_list('id', flat=True)), self.ids)
+
+        self.client.force_login(self.ed1)
+        response = self.client.get(reverse('review_articles'))
+        self.assertEqual([a.id for a in response.context['articles']], self.ids[:2])
+        self.assertContains(response, "Story 0 teaser")
+        self.assertNotContains(response, "FULL BODY")
+        self.assertNotContains(response, "Foreign")
+
+        response = self.client.get(reverse('review_articles'), {'cursor': response.context['next_cursor']})
+        self.assertEqual([a.id for a in response.context['articles']], self.ids[2:4])
+        self.assertEqual(self.client.get(reverse('review_articles'), {'cursor': 'bad'}).status_code, 404)
+
+    def test_editors_claim_disjoint_batches(self):
+        first = claim_articles(self.ed1)
+        second = claim_articles(self.ed2)
+        self.assertEqual(first, self.ids[:2])
+        self.assertEqual(second, self.ids[2:4])
+        self.assertEqual(claim_articles(self.ed2, self.ids[:3]), self.ids[2:3])
+        self.assertEqual(claim_articles(self.ed1, [self.foreign.id]), [])
+
+        self.client.force_login(self.ed1)
+        response = self.client.get(reverse('review_articles'))
+        self.assertEqual([a.id for a in response.context['claimed']], first)
+        self.assertEqual([a.id for a in response.context['articles']], self.ids[4:])
+
+        self.assertEqual(release_claims(self.ed1, first[:1]), 1)
+        self.assertEqual(claim_articles(self.ed2), [self.ids[0], self.ids[4]])
+
+    def test_expired_claims_return_to_the_queue(self):
+        claim_articles(self.ed1, self.ids[:1])
+        Article.objects.filter(id=self.ids[0]).update(claimed_until=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(claim_articles(self.ed2, self.ids[:1]), self.ids[:1])
+        self.assertEqual(Article.objects.get(id=self.ids[0]).claimed_by, self.ed2)
+
+    def test_claim_view(self):
+        self.client.force_login(self.ed1)
+        response = self.client.post(reverse('claim_articles'), {'action': 'claim_next'}, follow=True)
+        self.assertContains(response, "2 articles claimed.")
+        claim_articles(self.ed2, self.ids[2:3])
+        response = self.client.post(reverse('claim_articles'), {
+            'action': 'claim', 'article_ids': [str(pk) for pk in self.ids[2:4]],
+        }, follow=True)
+        self.assertContains(response, "1 articles claimed.")
+        self.assertContains(response, "1 articles are claimed by another editor.")
+        response = self.client.post(reverse('claim_articles'), {
+            'action': 'release', 'article_ids': [str(self.ids[0])],
+        }, follow=True)
+        self.assertContains(response, "1 articles released.")
+        self.assertEqual(sorted(self.ed1.claimed_articles.values_list('id', flat=True)), [self.ids[1], self.ids[3]])
+
+    def test_moderation_skips_other_editors_claims_and_publishers(self):
+        claim_articles(self.ed2, self.ids[:1])
+        claim_articles(self.ed1, self.ids[1:2])
+        self.client.force_login(self.ed1)
+        response = self.client.post(reverse('moderate_articles'), {
+            'action': 'approve', 'article_ids': [str(pk) for pk in [*self.ids[:3], self.foreign.id]],
+        }, follow=True)
+        self.assertContains(response, "2 articles approved.")
+        self.assertEqual(list(Article.objects.filter(id__in=self.ids, approved=True)
+                              .order_by('id').values_list('id', flat=True)), self.ids[1:3])
+        self.assertFalse(Article.objects.filter(claimed_by=self.ed1).exists())
+
+        client = APIClient()
+        client.force_authenticate(user=self.ed1)
+        response = client.post(reverse('article_moderation_api'), {
+            'article_ids': [self.ids[0], self.foreign.id], 'action': 'revise',
+        }, format='json')
+        self.assertEqual(response.data['updated'], [])
+
+    def test_single_article_actions_claim_first(self):
+        claim_articles(self.ed2, self.ids[:1])
+        self.client.force_login(self.ed1)
+        response = self.client.get(reverse('approve_article', args=[self.ids[0]]), follow=True)
+        self.assertContains(response, "is claimed by another editor")
+        self.assertFalse(Article.objects.get(id=self.ids[0]).approved)
+        self.assertEqual(self.client.get(reverse('approve_article', args=[self.foreign.id])).status_code, 404)
+
+        self.client.get(reverse('request_revision', args=[self.ids[1]]))
+        self.assertEqual(Article.objects.get(id=self.ids[1]).claimed_by, self.ed1)
+        self.client.post(reverse('request_revision', args=[self.ids[1]]), {'feedback': "Cite sources"})
+        article = Article.objects.get(id=self.ids[1])
+        self.assertEqual((article.needs_revision, article.claimed_by), (True, None))
+
+        self.client.get(reverse('approve_article', args=[self.ids[2]]))
+        article = Article.objects.get(id=self.ids[2])
+        self.assertEqual((article.approved, article.claimed_by), (True, None))
@@ -0,0 +1,135 @@
+import os
+import sqlite3
+import tempfile
+from unittest import mock
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from news_room.models import Article, CustomUser, Newsletter, Publisher, clear_role_group_cache
+from news_room.routers import ReplicaRouter, replica_reads, reset_availability
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTests(TransactionTestCase):
+    """
+    Tests for replica reads with a second SQLite file standing in for a lagging replica.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.replica_path = os.path.join(cls.directory.name, 'replica.sqlite3')
+        connections.settings['replica'] = connections.configure_settings({
+            'default': {'ENGINE': 'django.db.backends.sqlite3'},
+            'replica': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': cls.replica_path},
+        })['replica']
+        # Declared here rather than on the class because the test runner
+        # checks declared aliases before any test sets this one up.
+        cls.databases = {'default', 'replica'}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+        cls.directory.cleanup()
+
+    def setUp(self):
+        cache.clear()
+        # The flush between tests drops the role groups behind the cache's back.
+        clear_role_group_cache()
+        reset_availability()
+        self.addCleanup(reset_availability)
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.replicated = self.article("Replicated")
+        self.api = APIClient()
+        self.api.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.reader).key}')
+
+        # Snapshot the primary into the replica file, then write past it.
+        connections['replica'].close()
+        connections['default'].ensure_connection()
+        replica = sqlite3.connect(self.replica_path)
+        connections['default'].connection.backup(replica)
+        replica.close()
+        self.fresh = self.article("Fresh")
+
+    def article(self, title):
+        return Article.objects.create(title=title, description="desc", content="body", approved=True,
+                                      author=self.journalist, publisher=self.publisher)
+
+    def titles(self):
+        return set(Article.objects.values_list('title', flat=True))
+
+    def detail(self, article):
+        return self.api.get(reverse('article_detail_api', args=[article.id])).status_code
+
+    def test_reads_inside_replica_block_use_the_replica(self):
+        self.assertEqual(self.titles(), {"Replicated", "Fresh"})
+        with replica_reads():
+            self.assertEqual(self.titles(), {"Replicated"})
+
+    def test_writes_send_later_reads_to_the_primary(self):
+        with replica_reads() as state:
+            self.article("Written")
+            self.assertTrue(state['wrote'])
+            self.assertEqual(self.titles(), {"Replicated", "Fresh", "Written"})
+        router = ReplicaRouter()
+        with replica_reads():
+            self.assertIsNone(router.db_for_read(Session))
+            self.assertEqual(router.db_for_write(Article), 'default')
+
+    def test_safe_requests_read_from_replica_until_the_client_writes(self):
+        self.assertEqual((self.detail(self.replicated), self.detail(self.fresh)), (200, 404))
+
+        response = self.api.post(reverse('subscriptions_api'), {'publishers': [self.publisher.id]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('primary_until', response.cookies)
+        self.assertEqual(self.detail(self.fresh), 200)
+
+        with override_settings(REPLICA_STICKY_SECONDS=-1):
+            self.api.post(reverse('subscriptions_api'), {'publishers': [self.publisher.id]}, format='json')
+        self.assertEqual(self.detail(self.fresh), 404)
+
+    def test_cached_pages_are_rendered_from_the_primary(self):
+        # The newsletter exists only on the primary; a page built from the
+        # lagging replica would be cached without it under the new version.
+        Newsletter.objects.create(title="Fresh briefing", content="body",
+                                  author=self.journalist, publisher=self.publisher)
+        for name in ('newsletter_api', 'async_newsletter_api'):
+            for _ in range(2):
+                response = self.api.get(reverse(name))
+                self.assertEqual([item['title'] for item in response.json()['results']], ["Fresh briefing"])
+        self.assertEqual(self.detail(self.fresh), 404)
+
+    @override_settings(DATABASE_REPLICAS=['replica', 'replica2'])
+    def test_one_replica_serves_the_whole_block(self):
+        router = ReplicaRouter()
+        with mock.patch('news_room.routers._available', return_value=True):
+            with replica_reads() as state:
+                aliases = {router.db_for_read(Article) for _ in range(20)}
+                self.assertEqual(aliases, {state['replica']})
+        # Once the chosen replica fails, the block finishes on the primary
+        # rather than switching to a replica with a different lag.
+        up = {'replica': False, 'replica2': True}
+        with mock.patch('news_room.routers.random.shuffle'), \
+                mock.patch('news_room.routers._available', side_effect=up.get):
+            with replica_reads():
+                self.assertEqual(router.db_for_read(Article), 'replica2')
+                up.update(replica=True, replica2=False)
+                self.assertEqual(router.db_for_read(Article), 'default')
+
+    def test_unavailable_replica_falls_back_to_primary(self):
+        replica = connections['replica']
+        replica.close()
+        self.addCleanup(replica.settings_dict.__setitem__, 'NAME', self.replica_path)
+        replica.settings_dict['NAME'] = os.path.join(self.replica_path, 'missing', 'replica.sqlite3')
+        self.assertEqual(self.detail(self.fresh), 200)
+        with replica_reads():
+            self.assertEqual(self.titles(), {"Replicated", "Fresh"})
@@ -0,0 +1,97 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from news_room.models import Article, CustomUser, Newsletter, Publisher, SearchDocument
+from news_room.search import search
+
+
+class SearchTests(TestCase):
+    """
+    Tests for the full-text search index, its signal sync and the search view.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.headline = Article.objects.create(
+            title="Harbour bridge reopens", description="Traffic update", content="Cars are moving again.",
+            approved=True, author=self.journalist, publisher=self.publisher,
+        )
+        self.mention = Article.objects.create(
+            title="City roundup", description="Weekly summary",
+            content="Among other news, the harbour bridge repairs finished early.",
+            approved=True, author=self.journalist, publisher=self.publisher,
+        )
+        self.draft = Article.objects.create(
+            title="Bridge draft", description="Unpublished", content="harbour bridge",
+            author=self.journalist, publisher=self.publisher,
+        )
+        self.newsletter = Newsletter.objects.create(
+            title="Morning briefing", content="The harbour bridge is open.",
+            author=self.journalist, publisher=self.publisher,
+        )
+
+    def titles(self, query, **kwargs):
+        return [document.title for document in search(query, **kwargs)[0]]
+
+    def test_ranks_title_matches_first_and_skips_unapproved(self):
+        self.assertEqual(self.titles("harbour bridge"),
+                         ["Harbour bridge reopens", "Morning briefing", "City roundup"])
+        self.assertEqual(self.titles("bridge", kind="newsletter"), ["Morning briefing"])
+        self.assertEqual(self.titles("harbour OR NEAR* \"bridge"), [])
+
+    def test_older_matches_are_still_ranked(self):
+        for number in range(5):
+            Article.objects.create(
+                title=f"Update {number}", description="Roundup", content="A bridge was mentioned.",
+                approved=True, author=self.journalist, publisher=self.publisher,
+            )
+        self.assertEqual(self.titles("harbour bridge", kind="article"), ["Harbour bridge reopens", "City roundup"])
+        self.assertEqual(self.titles("bridge", page_size=1), ["Harbour bridge reopens"])
+
+    def test_stemming_and_pagination(self):
+        self.assertEqual(self.titles("repair"), ["City roundup"])
+        page, has_next = search("bridge", page=1, page_size=2)
+        self.assertEqual(len(page), 2)
+        self.assertTrue(has_next)
+        page, has_next = search("bridge", page=2, page_size=2)
+        self.assertEqual(len(page), 1)
+        self.assertFalse(has_next)
+
+    def test_signals_keep_index_in_sync(self):
+        self.draft.approved = True
+        self.draft.save()
+        self.assertIn("Bridge draft", self.titles("bridge"))
+
+        self.headline.title = "Harbour ferry delayed"
+        self.headline.save()
+        self.assertEqual(self.titles("ferry"), ["Harbour ferry delayed"])
+
+        self.headline.approved = False
+        self.headline.save()
+        self.newsletter.delete()
+        self.assertEqual(self.titles("harbour"), ["Bridge draft", "City roundup"])
+
+    def test_rebuild_command(self):
+        SearchDocument.objects.all().delete()
+        self.assertEqual(self.titles("bridge"), [])
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(SearchDocument.objects.count(), 3)
+        self.assertEqual(len(self.titles("bridge")), 3)
+
+    def test_search_view(self):
+        reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.client.force_login(reader)
+        response = self.client.get(reverse('search'), {'q': 'harbour', 'kind': 'article'})
+        self.assertContains(response, "Harbour bridge reopens")
+        self.assertContains(response, reverse('view_article', args=[self.mention.id]))
+        self.assertNotContains(response, "Morning briefing")
+
+    @override_settings(SEARCH_PAGE_SIZE=1, SEARCH_MAX_PAGE=2)
+    def test_search_view_caps_page_depth(self):
+        reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.client.force_login(reader)
+        response = self.client.get(reverse('search'), {'q': 'harbour', 'page': '10000000'})
+        self.assertEqual(response.context['page_number'], 2)
+        self.assertEqual(len(response.context['results']), 1)
+        self.assertFalse(response.context['has_next'])
@@ -1,13 +1,22 @@
+from io import StringIO
+from django.db import DatabaseError
 from django.test import TestCase, override_settings
+from django.urls import reverse
 from django.core import mail
+from django.core.management import call_command
 from unittest.mock import patch
-from news_room.models import Article, CustomUser, Publisher
+from news_room.models import Article, CustomUser, OutboxEntry, Publisher
+from news_room.outbox import drain
 
 
-@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    X_API_KEY='key', X_API_SECRET='secret',
+    X_ACCESS_TOKEN='token', X_ACCESS_TOKEN_SECRET='token-secret',
+)
 class SignalsTests(TestCase):
     """
-    Tests that signals correctly trigger emails and X posts upon article approval.
+    Tests that article approval queues emails and X posts in the outbox.
     """
     def setUp(self):
         self.publisher = Publisher.objects.create(name="Pub")
@@ -31,14 +40,91 @@ class SignalsTests(TestCase):
             needs_revision=False
         )
 
-    @patch('news_room.signals.requests.post')
-    def test_tweet_posted_on_approval(self, mock_post):
+    def test_approval_only_queues_outbox_entries(self):
         self.article.approved = True
         self.article.save()  # Triggers post_save signal
+        kinds = set(OutboxEntry.objects.values_list('kind', flat=True))
+        self.assertEqual(kinds, {'article_email', 'article_timeline', 'article_x_post', 'feed_render'})
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(X_API_KEY=None)
+    def test_x_post_not_queued_without_credentials(self):
+        self.article.approved = True
+        self.article.save()
+        kinds = set(OutboxEntry.objects.values_list('kind', flat=True))
+        self.assertEqual(kinds, {'article_email', 'article_timeline', 'feed_render'})
+
+    def test_failed_enqueue_rolls_back_the_approval(self):
+        editor = CustomUser.objects.create_user(username="ed", password="pass", role="editor")
+        self.publisher.editors.add(editor)
+        self.client.force_login(editor)
+        with patch('news_room.signals.enqueue_article_approval', side_effect=DatabaseError("outbox down")):
+            with self.assertRaises(DatabaseError):
+                self.client.get(reverse('approve_article', args=[self.article.id]))
+        self.article.refresh_from_db()
+        self.assertFalse(self.article.approved)
+        self.assertEqual(self.article.claimed_by, editor)
+        self.assertFalse(OutboxEntry.objects.exists())
+
+    @patch('news_room.x_publisher.XPublisher.post', return_value='1')
+    def test_tweet_posted_on_approval(self, mock_post):
+        self.article.approved = True
+        self.article.save()
+        drain()
         mock_post.assert_called_once()
+        self.article.refresh_from_db()
+        self.assertEqual((self.article.x_status, self.article.x_post_id), ('posted', '1'))
 
-    def test_email_sent_on_approval(self):
+    @patch('news_room.x_publisher.XPublisher.post', return_value='1')
+    def test_email_sent_on_approval(self, mock_post):
         self.article.approved = True
         self.article.save()
+        call_command('process_outbox', '--once', '--concurrency', '1', stdout=StringIO())
         self.assertGreater(len(mail.outbox), 0)
         self.assertIn("Test Article", mail.outbox[0].subject)
+        self.assertFalse(OutboxEntry.objects.exclude(status='done').exists())
+
+    @patch('news_room.x_publisher.XPublisher.post', side_effect=ConnectionError("X unavailable"))
+    def test_failed_entry_is_retried_with_backoff(self, mock_post):
+        self.article.approved = True
+        self.article.save()
+        succeeded, failed = drain()
+        self.assertEqual((succeeded, failed), (3, 1))
+
+        entry = OutboxEntry.objects.get(kind='article_x_post')
+        self.assertEqual(entry.status, 'pending')
+        self.assertEqual(entry.attempts, 1)
+        self.assertGreater(entry.available_at, entry.created_at)
+        self.assertIn("X unavailable", entry.last_error)
+
+    def test_resaving_approved_article_does_not_notify_again(self):
+        self.article.approved = True
+        self.article.save()
+        self.article.title = "Edited"
+        self.article.save()
+        self.assertEqual(OutboxEntry.objects.filter(kind='article_email').count(), 1)
+
+    @override_settings(OUTBOX_EAGER=True)
+    @patch('news_room.outbox._start_background_drain')
+    @patch('news_room.x_publisher.XPublisher.post')
+    def test_eager_mode_drains_on_commit(self, mock_post, mock_background):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.approved = True
+            self.article.save()
+        self.assertEqual(len(mail.outbox), 1)
+        # The X post is left to a background thread.
+        mock_post.assert_not_called()
+        x_entry = OutboxEntry.objects.get(kind='article_x_post')
+        mock_background.assert_called_once_with([x_entry.id])
+        self.assertEqual(x_entry.status, 'pending')
+
+    @override_settings(OUTBOX_EAGER=True)
+    @patch('news_room.outbox._start_background_drain')
+    def test_eager_mode_leaves_earlier_backlog_to_the_worker(self, mock_background):
+        backlog = OutboxEntry.objects.create(kind='feed_render', payload={'feeds': ['all']})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.approved = True
+            self.article.save()
+        self.assertEqual(len(mail.outbox), 1)
+        backlog.refresh_from_db()
+        self.assertEqual(backlog.status, 'pending')
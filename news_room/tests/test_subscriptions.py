@@ -0,0 +1,172 @@
+import json
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from news_room.models import Article, CustomUser, Publisher, SubscriberIndex, TimelineEntry
+from news_room.subscriptions import current_subscriptions, update_subscriptions
+
+
+@override_settings(SUBSCRIBER_INDEX_ENABLED=True)
+class BulkSubscriptionTests(TestCase):
+    """
+    Tests for set-based subscription changes through the API.
+    """
+    def setUp(self):
+        self.publishers = Publisher.objects.bulk_create([Publisher(name=f"Pub {i}") for i in range(60)])
+        self.journalists = [
+            CustomUser.objects.create_user(username=f"j{i}", password="pass", role="journalist")
+            for i in range(3)
+        ]
+        self.reader = CustomUser.objects.create_user(
+            username="reader", password="pass", role="reader", email="reader@example.com"
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.reader)
+
+    def ids(self, objects):
+        return [obj.id for obj in objects]
+
+    def test_put_replaces_and_reports_changes(self):
+        first = self.api.put(reverse('subscriptions_api'), {
+            'publishers': self.ids(self.publishers[:3]), 'journalists': self.ids(self.journalists[:2]),
+        }, format='json')
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data['publishers']['added'], self.ids(self.publishers[:3]))
+
+        second = self.api.put(reverse('subscriptions_api'), {
+            'publishers': self.ids(self.publishers[2:4]),
+        }, format='json')
+        self.assertEqual(second.data, {'publishers': {
+            'added': [self.publishers[3].id], 'removed': self.ids(self.publishers[:2]),
+        }})
+        current = self.api.get(reverse('subscriptions_api')).data
+        self.assertEqual(current['publishers'], self.ids(self.publishers[2:4]))
+        # Journalist subscriptions were not named, so they are untouched.
+        self.assertEqual(current['journalists'], self.ids(self.journalists[:2]))
+
+    def test_post_adds_and_delete_removes(self):
+        self.reader.subscribed_publishers.add(self.publishers[0])
+        added = self.api.post(reverse('subscriptions_api'), {
+            'publishers': self.ids(self.publishers[:2]),
+        }, format='json')
+        self.assertEqual(added.data['publishers'], {'added': [self.publishers[1].id], 'removed': []})
+        removed = self.api.delete(reverse('subscriptions_api'), {
+            'publishers': [self.publishers[0].id, 999999],
+        }, format='json')
+        self.assertEqual(removed.data['publishers'], {'added': [], 'removed': [self.publishers[0].id]})
+        self.assertEqual(list(self.reader.subscribed_publishers.all()), [self.publishers[1]])
+
+    def test_unknown_or_non_journalist_ids_are_rejected(self):
+        response = self.api.post(reverse('subscriptions_api'), {
+            'publishers': [999999], 'journalists': [self.reader.id],
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data), {'publishers', 'journalists'})
+        self.assertFalse(self.reader.subscribed_publishers.exists())
+        self.assertEqual(self.api.post(reverse('subscriptions_api'), {}, format='json').status_code, 400)
+
+    def test_only_readers_have_subscriptions(self):
+        self.api.force_authenticate(user=self.journalists[0])
+        self.assertEqual(self.api.get(reverse('subscriptions_api')).status_code, 403)
+
+    def test_query_count_does_not_grow_with_sources(self):
+        with CaptureQueriesContext(connection) as few:
+            update_subscriptions(self.reader, 'add', publishers=self.ids(self.publishers[:5]))
+        with CaptureQueriesContext(connection) as many:
+            update_subscriptions(self.reader, 'add', publishers=self.ids(self.publishers[5:]))
+        self.assertEqual(len(many), len(few))
+        self.assertEqual(self.reader.subscribed_publishers.count(), 60)
+        # Unfollowing is one DELETE plus the index and timeline cleanup.
+        with CaptureQueriesContext(connection) as removal:
+            update_subscriptions(self.reader, 'set', publishers=[])
+        self.assertEqual(sum(q['sql'].startswith('DELETE') for q in removal), 3)
+
+    @override_settings(TIMELINE_BACKFILL=2)
+    def test_backfill_takes_newest_articles_of_each_source(self):
+        for publisher in self.publishers[:3]:
+            for i in range(3):
+                Article.objects.create(title=f"{publisher.name} {i}", description="desc", content="body",
+                                       approved=True, author=self.journalists[0], publisher=publisher)
+        update_subscriptions(self.reader, 'add', publishers=self.ids(self.publishers[:3]))
+        titles = set(TimelineEntry.objects.filter(reader=self.reader).values_list('article__title', flat=True))
+        self.assertEqual(titles, {f"{p.name} {i}" for p in self.publishers[:3] for i in (1, 2)})
+
+    def test_current_subscriptions_is_one_query(self):
+        self.reader.subscribed_publishers.add(self.publishers[0])
+        self.reader.subscribed_journalists.add(self.journalists[0])
+        with self.assertNumQueries(1):
+            current = current_subscriptions(self.reader)
+        self.assertEqual(current, {'publishers': {self.publishers[0].id}, 'journalists': {self.journalists[0].id}})
+
+    def test_side_effects_follow_bulk_changes(self):
+        article = Article.objects.create(title="Story", description="desc", content="body", approved=True,
+                                         author=self.journalists[0], publisher=self.publishers[0])
+        update_subscriptions(self.reader, 'add', publishers=[self.publishers[0].id],
+                             journalists=[self.journalists[0].id])
+        self.assertEqual(SubscriberIndex.objects.filter(reader=self.reader).count(), 2)
+        self.assertTrue(TimelineEntry.objects.filter(reader=self.reader, article=article).exists())
+
+        update_subscriptions(self.reader, 'remove', publishers=[self.publishers[0].id],
+                             journalists=[self.journalists[0].id])
+        self.assertFalse(SubscriberIndex.objects.filter(reader=self.reader).exists())
+        self.assertFalse(TimelineEntry.objects.filter(reader=self.reader).exists())
+
+
+@override_settings(SUBSCRIBER_INDEX_ENABLED=True)
+class SubscriptionImportTests(TestCase):
+    """
+    Tests for the import_subscriptions management command.
+    """
+    def setUp(self):
+        self.publisher = Publisher.objects.create(name="Daily Planet")
+        self.journalist = CustomUser.objects.create_user(username="clark", password="pass", role="journalist")
+        self.readers = [
+            CustomUser.objects.create_user(username=f"r{i}", password="pass", role="reader",
+                                           email=f"r{i}@example.com")
+            for i in range(3)
+        ]
+
+    def run_import(self, content, suffix):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix) as f:
+            f.write(content)
+            f.flush()
+            out, err = StringIO(), StringIO()
+            call_command('import_subscriptions', f.name, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_csv_import_resolves_names_and_ids(self):
+        csv = (
+            "reader,publisher,journalist\n"
+            "r0,Daily Planet,\n"
+            f"{self.readers[1].id},{self.publisher.id},\n"
+            f"r2,,{self.journalist.id}\n"
+            "r0,Daily Planet,\n"
+            "nobody,Daily Planet,\n"
+            "r1,Daily Planet,clark\n"
+        )
+        out, err = self.run_import(csv, '.csv')
+        self.assertIn("Imported 3 subscriptions", out)
+        self.assertIn("line 6: Unknown reader.", err)
+        self.assertIn("line 7: Name exactly one of publisher or journalist.", err)
+        self.assertEqual(set(self.publisher.subscribed_readers.all()), set(self.readers[:2]))
+        self.assertEqual(list(self.journalist.reader_subscribers.all()), [self.readers[2]])
+        self.assertEqual(SubscriberIndex.objects.count(), 3)
+
+        out, _ = self.run_import(csv, '.csv')
+        self.assertIn("Imported 0 subscriptions", out)
+
+    def test_ndjson_import(self):
+        lines = "\n".join(json.dumps(row) for row in [
+            {'reader': 'r0', 'journalist': 'clark'},
+            {'reader': self.readers[1].id, 'publisher': 'Daily Planet'},
+            {'reader': 'r2', 'publisher': 'Unknown'},
+        ])
+        out, err = self.run_import(lines, '.ndjson')
+        self.assertIn("Imported 2 subscriptions", out)
+        self.assertIn("line 3: Unknown publisher.", err)
+        self.assertEqual(list(self.readers[0].subscribed_journalists.all()), [self.journalist])
@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from news_room.models import Article, CustomUser, Publisher, TimelineEntry
+from news_room.outbox import drain
+
+
+@override_settings(X_API_KEY=None, EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class ReaderTimelineTests(APITestCase):
+    """
+    Tests for timeline fan-out, backfill, pruning and the feed endpoint.
+    """
+    def setUp(self):
+        cache.clear()
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.reader = CustomUser.objects.create_user(username="reader", password="pass", role="reader")
+        self.reader.subscribed_publishers.add(self.publisher)
+        self.reader.subscribed_journalists.add(self.journalist)
+        self.client.force_authenticate(user=self.reader)
+
+    def approve(self, title):
+        article = Article.objects.create(
+            title=title, description="desc", content="body",
+            author=self.journalist, publisher=self.publisher,
+        )
+        article.approved = True
+        article.save()
+        drain()
+        return article
+
+    def feed_titles(self):
+        response = self.client.get(reverse('feed_api'))
+        self.assertEqual(response.status_code, 200)
+        return [a['title'] for a in response.data['results']]
+
+    def test_approval_fans_out_once_per_reader(self):
+        self.approve("First")
+        self.approve("Second")
+        self.assertEqual(TimelineEntry.objects.filter(reader=self.reader).count(), 2)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.feed_titles(), ["Second", "First"])
+
+    def test_unapproval_retracts_article(self):
+        article = self.approve("Story")
+        article.approved = False
+        article.needs_revision = True
+        article.save()
+        drain()
+        self.assertEqual(self.feed_titles(), [])
+
+    def test_subscribe_backfills_and_unsubscribe_prunes(self):
+        self.approve("Story")
+        newcomer = CustomUser.objects.create_user(username="new", password="pass", role="reader")
+        newcomer.subscribed_publishers.add(self.publisher)
+        self.assertTrue(TimelineEntry.objects.filter(reader=newcomer).exists())
+
+        # Still followed through the journalist, so the entry stays.
+        self.reader.subscribed_publishers.remove(self.publisher)
+        self.assertTrue(TimelineEntry.objects.filter(reader=self.reader).exists())
+        self.reader.subscribed_journalists.clear()
+        self.assertFalse(TimelineEntry.objects.filter(reader=self.reader).exists())
+
+    @override_settings(TIMELINE_FANOUT_LIMIT=0)
+    def test_large_sources_fall_back_to_fan_out_on_read(self):
+        self.approve("Story")
+        self.assertFalse(TimelineEntry.objects.exists())
+        self.assertEqual(self.feed_titles(), ["Story"])
+
+    @override_settings(TIMELINE_FANOUT_LIMIT=1)
+    def test_timeline_and_large_sources_are_merged_across_page_bounds(self):
+        # The publisher has two readers and is merged at read time; the
+        # journalist has one and is fanned out, also from a quiet publisher.
+        CustomUser.objects.create_user(username="other", password="pass", role="reader").subscribed_publishers.add(
+            self.publisher)
+        stranger = CustomUser.objects.create_user(username="j2", password="pass", role="journalist")
+        quiet = Publisher.objects.create(name="Quiet")
+        for i in range(9):
+            article = Article.objects.create(
+                title=f"Story {i}", description="desc", content="body",
+                author=self.journalist if i % 3 == 0 else stranger,
+                publisher=quiet if i % 3 == 0 else self.publisher,
+            )
+            article.approved = True
+            article.save()
+            drain()
+        self.assertEqual(TimelineEntry.objects.filter(reader=self.reader).count(), 3)
+        url = reverse('feed_api') + '?page_size=2'
+        titles = []
+        while url:
+            response = self.client.get(url)
+            titles += [a['title'] for a in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(titles, [f"Story {i}" for i in reversed(range(9))])
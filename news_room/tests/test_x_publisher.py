@@ -0,0 +1,241 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+import requests
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from news_room import x_publisher
+from news_room.models import Article, CustomUser, OutboxEntry, Publisher
+from news_room.outbox import drain
+
+
+class StubX:
+    """
+    Local HTTP server standing in for the X posts endpoint.
+
+    Queued responses are ``(status, headers, delay)`` tuples, optionally
+    followed by a raw body; once they run out every post succeeds.
+    """
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, so pooling is observable
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                stub.requests.append({
+                    'text': body['text'],
+                    'authorization': self.headers.get('Authorization', ''),
+                    'port': self.client_address[1],
+                })
+                status, headers, delay, *raw = stub.responses.pop(0) if stub.responses else (201, {}, 0)
+                time.sleep(delay)
+                payload = raw[0] if raw else json.dumps(
+                    {'data': {'id': str(len(stub.requests)), 'text': body['text']}}
+                    if status < 400 else {'title': 'Error'}).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_port}/2/tweets'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    X_API_KEY='key', X_API_SECRET='secret',
+    X_ACCESS_TOKEN='token', X_ACCESS_TOKEN_SECRET='token-secret',
+    X_RETRY_BASE_DELAY=0,
+)
+class XPublisherTests(TestCase):
+    """
+    Tests for pooled, rate-limit aware X posting against a local stub.
+    """
+    def setUp(self):
+        self.stub = StubX()
+        self.addCleanup(self.stub.stop)
+        override = override_settings(X_API_URL=self.stub.url)
+        override.enable()
+        self.addCleanup(override.disable)
+        x_publisher.reset_publisher()
+        self.addCleanup(x_publisher.reset_publisher)
+
+        self.publisher = Publisher.objects.create(name="Pub")
+        self.journalist = CustomUser.objects.create_user(username="j1", password="pass", role="journalist")
+        self.editor = CustomUser.objects.create_user(username="editor", password="pass", role="editor")
+        self.publisher.editors.add(self.editor)
+
+    def approve(self, title):
+        article = Article.objects.create(title=title, description="desc", content="body",
+                                         author=self.journalist, publisher=self.publisher)
+        article.approved = True
+        article.save()
+        return article
+
+    def x_entries(self):
+        return OutboxEntry.objects.filter(kind='article_x_post').order_by('id')
+
+    def test_posts_reuse_one_pooled_connection(self):
+        first, second = self.approve("First"), self.approve("Second")
+        drain()
+        self.assertEqual([r['text'].split(' by ')[0] for r in self.stub.requests], ["First", "Second"])
+        self.assertEqual(len({r['port'] for r in self.stub.requests}), 1)
+        self.assertTrue(self.stub.requests[0]['authorization'].startswith('OAuth '))
+        for article, post_id in ((first, '1'), (second, '2')):
+            article.refresh_from_db()
+            self.assertEqual((article.x_status, article.x_post_id), ('posted', post_id))
+            self.assertIsNotNone(article.x_posted_at)
+
+    def test_rate_limit_defers_entries_until_window_resets(self):
+        reset = int(time.time()) + 600
+        self.stub.responses = [(429, {'x-rate-limit-remaining': '0', 'x-rate-limit-reset': str(reset)}, 0)]
+        first, second = self.approve("First"), self.approve("Second")
+        drain()
+        # The second post is deferred without calling X again.
+        self.assertEqual(len(self.stub.requests), 1)
+        for entry in self.x_entries():
+            self.assertEqual((entry.status, entry.attempts), ('pending', 0))
+            self.assertGreaterEqual(entry.available_at.timestamp(), reset)
+        for article in (first, second):
+            article.refresh_from_db()
+            self.assertEqual(article.x_status, 'queued')
+
+    def test_stale_rate_limit_reset_still_backs_off(self):
+        self.stub.responses = [(429, {'x-rate-limit-remaining': '0',
+                                      'x-rate-limit-reset': str(int(time.time()) - 60)}, 0)]
+        self.approve("First")
+        drain()
+        self.assertEqual(len(self.stub.requests), 1)
+        entry = self.x_entries().get()
+        self.assertEqual(entry.status, 'pending')
+        self.assertGreaterEqual(entry.available_at.timestamp(), time.time() + settings.OUTBOX_BASE_BACKOFF - 5)
+
+    def test_exhausted_window_pauses_before_next_post(self):
+        reset = int(time.time()) + 600
+        self.stub.responses = [(201, {'x-rate-limit-remaining': '0', 'x-rate-limit-reset': str(reset)}, 0)]
+        self.approve("First")
+        self.approve("Second")
+        drain()
+        self.assertEqual(len(self.stub.requests), 1)
+        self.assertEqual([e.status for e in self.x_entries()], ['done', 'pending'])
+
+    def test_server_errors_are_retried_with_backoff(self):
+        self.stub.responses = [(503, {}, 0), (500, {}, 0)]
+        article = self.approve("Story")
+        drain()
+        self.assertEqual(len(self.stub.requests), 3)
+        entry = self.x_entries().get()
+        self.assertEqual((entry.status, entry.attempts), ('done', 1))
+        article.refresh_from_db()
+        self.assertEqual(article.x_status, 'posted')
+
+    def test_rejected_post_fails_without_retry(self):
+        self.stub.responses = [(403, {}, 0)]
+        article = self.approve("Story")
+        drain()
+        entry = self.x_entries().get()
+        self.assertEqual(entry.status, 'failed')
+        self.assertIn("403", entry.last_error)
+        self.assertEqual(len(self.stub.requests), 1)
+        article.refresh_from_db()
+        self.assertEqual(article.x_status, 'failed')
+
+    @override_settings(X_TIMEOUT=0.5)
+    def test_unanswered_post_is_not_sent_again(self):
+        self.stub.responses = [(201, {}, 1.5)]
+        article = self.approve("Story")
+        drain()
+        self.assertEqual(len(self.stub.requests), 1)
+        entry = self.x_entries().get()
+        self.assertEqual(entry.status, 'failed')
+        self.assertIn("may have been published", entry.last_error)
+        article.refresh_from_db()
+        self.assertEqual(article.x_status, 'failed')
+
+    def test_gateway_error_is_not_posted_again(self):
+        self.stub.responses = [(504, {}, 0)]
+        article = self.approve("Story")
+        drain()
+        entry = self.x_entries().get()
+        self.assertEqual(entry.status, 'failed')
+        self.assertIn("may have been published", entry.last_error)
+        # Draining again does not retry the post either.
+        drain()
+        self.assertEqual(len(self.stub.requests), 1)
+        article.refresh_from_db()
+        self.assertEqual(article.x_status, 'failed')
+
+    def test_success_without_post_id_is_not_posted_again(self):
+        self.stub.responses = [(201, {}, 0, b''), (200, {}, 0, b'{"errors": []}')]
+        first, second = self.approve("First"), self.approve("Second")
+        drain()
+        drain()
+        self.assertEqual(len(self.stub.requests), 2)
+        for entry in self.x_entries():
+            self.assertEqual(entry.status, 'failed')
+            self.assertIn("without a post id", entry.last_error)
+        for article in (first, second):
+            article.refresh_from_db()
+            self.assertEqual(article.x_status, 'failed')
+
+    def test_refused_connections_are_retried(self):
+        self.stub.stop()
+        publisher = x_publisher.XPublisher(('k', 's', 't', 'ts'), self.stub.url, max_retries=2, base_delay=0)
+        self.addCleanup(publisher.close)
+        with mock.patch.object(publisher.session, 'post', wraps=publisher.session.post) as post, \
+                self.assertRaises(requests.ConnectionError):
+            publisher.post("Story")
+        self.assertEqual(post.call_count, 3)
+
+    def test_posted_article_is_not_posted_again(self):
+        article = self.approve("Story")
+        drain()
+        article.approved = False
+        article.save()
+        article.approved = True
+        article.save()
+        drain()
+        self.assertEqual(len(self.stub.requests), 1)
+        article.refresh_from_db()
+        self.assertEqual(article.x_status, 'posted')
+
+    def test_backoff_is_jittered_and_capped(self):
+        publisher = x_publisher.XPublisher(('k', 's', 't', 'ts'), self.stub.url, base_delay=1, max_delay=5)
+        self.addCleanup(publisher.close)
+        delays = [publisher.backoff(retry) for retry in range(10) for _ in range(20)]
+        self.assertTrue(all(0 <= delay <= 5 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_approval_latency_does_not_depend_on_x(self):
+        self.stub.responses = [(201, {}, 3)]
+        article = Article.objects.create(title="Slow", description="desc", content="body",
+                                         author=self.journalist, publisher=self.publisher)
+        self.client.login(username="editor", password="pass")
+        start = time.perf_counter()
+        response = self.client.post(reverse('approve_article', args=[article.id]))
+        elapsed = time.perf_counter() - start
+        self.assertEqual(response.status_code, 302)
+        self.assertLess(elapsed, 3)
+        self.assertEqual(self.stub.requests, [])
+
+        drain()
+        article.refresh_from_db()
+        self.assertEqual(article.x_status, 'posted')
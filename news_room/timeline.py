@@ -0,0 +1,212 @@
+"""
+Precomputed reader timelines for the unified ``api/feed/`` endpoint.
+
+Approved articles are fanned out to ``TimelineEntry`` rows for every
+reader of their publisher and journalist (fan-out-on-write). Sources with
+more than ``TIMELINE_FANOUT_LIMIT`` subscribers are skipped at write time
+and merged into their readers' feeds at read time (fan-out-on-read), so a
+single approval never writes millions of rows.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, F, OuterRef, Q, Window
+from django.db.models.functions import RowNumber
+
+from .models import Article, CustomUser, Publisher, TimelineEntry
+from .recipients import JournalistSubscription, PublisherSubscription
+
+
+def large_source_ids():
+    """
+    Find publishers and journalists handled with fan-out-on-read.
+
+    Sources are picked by their ``subscriber_count`` counters on an index,
+    so a refresh reads only the large sources instead of counting every
+    subscription. The result is cached for ``TIMELINE_LARGE_SOURCES_TTL``
+    seconds so the write and read paths agree.
+
+    Returns:
+        tuple[set[int], set[int]]: Publisher ids and journalist ids with
+        more than ``TIMELINE_FANOUT_LIMIT`` subscribers.
+    """
+    limit = settings.TIMELINE_FANOUT_LIMIT
+
+    def compute():
+        publishers = Publisher.objects.filter(subscriber_count__gt=limit).values_list('id', flat=True)
+        journalists = CustomUser.objects.filter(
+            role='journalist', subscriber_count__gt=limit
+        ).values_list('id', flat=True)
+        return set(publishers), set(journalists)
+
+    return cache.get_or_set(
+        f'timeline:large-sources:{limit}', compute, settings.TIMELINE_LARGE_SOURCES_TTL
+    )
+
+
+def _entries(pairs, batch_size=1000):
+    """
+    Insert (reader id, article) pairs, ignoring ones already present.
+    """
+    batch = []
+    for reader_id, article in pairs:
+        batch.append(TimelineEntry(reader_id=reader_id, article_id=article.id,
+                                   created_at=article.created_at))
+        if len(batch) >= batch_size:
+            TimelineEntry.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    TimelineEntry.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+# ---------- Write path ----------
+
+def fan_out(article):
+    """
+    Add an approved article to the timelines of its subscribers.
+
+    Parameters:
+        article (Article): The approved article.
+    """
+    large_publishers, large_journalists = large_source_ids()
+    audience = Q(pk__in=[])
+    if article.publisher_id not in large_publishers:
+        audience |= Q(id__in=PublisherSubscription.objects.filter(
+            publisher_id=article.publisher_id).values('customuser_id'))
+    if article.author_id not in large_journalists:
+        audience |= Q(id__in=JournalistSubscription.objects.filter(
+            to_customuser_id=article.author_id).values('from_customuser_id'))
+
+    reader_ids = CustomUser.objects.filter(audience).values_list('id', flat=True)
+    _entries((reader_id, article) for reader_id in reader_ids.iterator(chunk_size=2000))
+
+
+def retract(article):
+    """
+    Remove an article from every timeline, e.g. after it is unapproved.
+
+    Parameters:
+        article (Article): The article to remove.
+    """
+    TimelineEntry.objects.filter(article=article).delete()
+
+
+def backfill(reader_ids, publisher_ids=(), journalist_ids=()):
+    """
+    Copy recent approved articles of newly followed sources into timelines.
+
+    Only the newest ``TIMELINE_BACKFILL`` articles per source are copied;
+    large sources are skipped because they are merged at read time.
+
+    Parameters:
+        reader_ids (Iterable[int]): Readers who subscribed.
+        publisher_ids (Iterable[int]): Publishers they now follow.
+        journalist_ids (Iterable[int]): Journalists they now follow.
+    """
+    large_publishers, large_journalists = large_source_ids()
+    sources = [('publisher_id', set(publisher_ids) - large_publishers),
+               ('author_id', set(journalist_ids) - large_journalists)]
+    reader_ids = list(reader_ids)
+    for field, pks in sources:
+        if pks:
+            recent = _recent_articles(field, pks)
+            _entries((reader_id, article) for reader_id in reader_ids for article in recent)
+
+
+def _recent_articles(field, pks):
+    """
+    Fetch the newest ``TIMELINE_BACKFILL`` approved articles of each source.
+
+    One source is read with an index-ordered LIMIT. Several sources are
+    ranked with ``ROW_NUMBER()`` per source in a single query, so following
+    many sources at once does not cost a query each.
+
+    Parameters:
+        field (str): ``'publisher_id'`` or ``'author_id'``.
+        pks (set[int]): Source ids.
+
+    Returns:
+        list[Article]: Articles with only ``id`` and ``created_at`` loaded.
+    """
+    approved = Article.objects.filter(approved=True).only('id', 'created_at')
+    if len(pks) == 1:
+        return list(approved.filter(**{field: next(iter(pks))}).order_by(
+            '-created_at', '-id'
+        )[:settings.TIMELINE_BACKFILL])
+    return list(approved.filter(**{f'{field}__in': pks}).annotate(rank=Window(
+        RowNumber(), partition_by=F(field), order_by=[F('created_at').desc(), F('id').desc()],
+    )).filter(rank__lte=settings.TIMELINE_BACKFILL))
+
+
+def prune(reader_ids, publisher_ids=None, journalist_ids=None):
+    """
+    Drop timeline entries that readers no longer follow.
+
+    An entry survives if the reader still follows the article's other
+    source (its journalist or its publisher).
+
+    Parameters:
+        reader_ids (Iterable[int]): Readers who unsubscribed.
+        publisher_ids (Iterable[int]): Publishers unfollowed, or None for all.
+        journalist_ids (Iterable[int]): Journalists unfollowed, or None for all.
+    """
+    still_follows_publisher = Exists(PublisherSubscription.objects.filter(
+        customuser_id=OuterRef('reader_id'), publisher_id=OuterRef('article__publisher_id')
+    ))
+    still_follows_journalist = Exists(JournalistSubscription.objects.filter(
+        from_customuser_id=OuterRef('reader_id'), to_customuser_id=OuterRef('article__author_id')
+    ))
+    entries = TimelineEntry.objects.filter(reader_id__in=list(reader_ids))
+    if publisher_ids is not None:
+        stale = entries.filter(article__publisher_id__in=list(publisher_ids))
+        stale.exclude(still_follows_journalist).delete()
+    if journalist_ids is not None:
+        stale = entries.filter(article__author_id__in=list(journalist_ids))
+        stale.exclude(still_follows_publisher).delete()
+
+
+# ---------- Read path ----------
+
+def reader_feed(reader):
+    """
+    Build the feed queryset for a reader.
+
+    When the reader follows no large source this is a single range scan of
+    the reader's timeline index. Otherwise the timeline is merged with the
+    approved articles of the large sources they follow, and the timeline
+    and each of those sources are returned to bound every page (see
+    ``news_room.pagination``) instead of sorting every article they wrote.
+
+    Parameters:
+        reader (CustomUser): The reader requesting the feed.
+
+    Returns:
+        tuple[QuerySet, tuple[str, str], list | None]: Either
+        ``TimelineEntry`` rows with their articles joined, or ``Article``
+        rows, plus the keyset fields and the sources to paginate it by.
+    """
+    large_publishers, large_journalists = large_source_ids()
+    followed_publishers = followed_journalists = []
+    if large_publishers:
+        followed_publishers = list(reader.subscribed_publishers.filter(
+            id__in=large_publishers).values_list('id', flat=True))
+    if large_journalists:
+        followed_journalists = list(reader.subscribed_journalists.filter(
+            id__in=large_journalists).values_list('id', flat=True))
+
+    if not followed_publishers and not followed_journalists:
+        entries = TimelineEntry.objects.filter(
+            reader=reader, article__approved=True
+        ).select_related('article__publisher', 'article__author')
+        return entries, ('created_at', 'article_id'), None
+
+    articles = Article.objects.filter(approved=True).filter(
+        Q(id__in=TimelineEntry.objects.filter(reader=reader).values('article_id'))
+        | Q(publisher_id__in=followed_publishers)
+        | Q(author_id__in=followed_journalists)
+    ).select_related('publisher', 'author')
+    sources = [(CustomUser.objects.filter(pk=reader.pk), 'timeline_entries__reader')]
+    if followed_publishers:
+        sources.append((Publisher.objects.filter(id__in=followed_publishers), 'publisher'))
+    if followed_journalists:
+        sources.append((CustomUser.objects.filter(id__in=followed_journalists), 'author'))
+    return articles, ('created_at', 'id'), sources
@@ -1,10 +1,11 @@
 from django.urls import path, reverse_lazy
 from django.contrib.auth import views as auth_views
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     # Core & auth
     path('', views.dashboard_view, name='dashboard'),
+    path('dashboard/articles/', views.dashboard_articles_view, name='dashboard_articles'),
     path('register/', views.register_view, name='register'),
     path('login/', views.login_view, name='login'),
     path('logout/', views.logout_view, name='logout'),
@@ -32,6 +33,8 @@ urlpatterns = [
     path('edit-article/<int:article_id>/', views.edit_article_view, name='edit_article'),
     path('journalist-feedback/', views.journalist_feedback_view, name='journalist_feedback'),
     path('review-articles/', views.review_articles_view, name='review_articles'),
+    path('claim-articles/', views.claim_articles_view, name='claim_articles'),
+    path('moderate-articles/', views.moderate_articles_view, name='moderate_articles'),
     path('approve-article/<int:article_id>/', views.approve_article_view, name='approve_article'),
     path('request-revision/<int:article_id>/', views.request_revision_view, name='request_revision'),
     path('create-publisher/', views.create_publisher_view, name='create_publisher'),
@@ -46,6 +49,17 @@ urlpatterns = [
     # Directory
     path('directory/', views.directory_view, name='directory'),
 
+    # Syndication feeds
+    path('feeds/<str:fmt>/', views.feed_view, name='feed'),
+    path('feeds/publisher/<int:publisher_id>/<str:fmt>/', views.feed_view, name='publisher_feed'),
+    path('feeds/journalist/<int:journalist_id>/<str:fmt>/', views.feed_view, name='journalist_feed'),
+
+    # Metrics
+    path('metrics/', views.metrics_view, name='metrics'),
+
+    # Search
+    path('search/', views.search_view, name='search'),
+
     # Newsletters
     path('newsletters/', views.newsletter_list_view, name='newsletter_list'),
     path('newsletter/<int:newsletter_id>/', views.view_newsletter_view,
@@ -65,6 +79,31 @@ urlpatterns = [
          name='journalist_articles_api'),
     path('api/newsletters/', views.NewsletterListAPIView.as_view(),
          name='newsletter_api'),
+    path('api/feed/', views.FeedAPIView.as_view(), name='feed_api'),
+    path('api/articles/<int:article_id>/', views.ArticleDetailAPIView.as_view(),
+         name='article_detail_api'),
+    path('api/articles/import/', views.ArticleImportAPIView.as_view(),
+         name='article_import_api'),
+    path('api/articles/export/', views.ArticleExportAPIView.as_view(),
+         name='article_export_api'),
+    path('api/articles/moderate/', views.ArticleModerationAPIView.as_view(),
+         name='article_moderation_api'),
+    path('api/subscriptions/', views.SubscriptionAPIView.as_view(),
+         name='subscriptions_api'),
+
+    # Async read path, served natively under ASGI (see newsroom/asgi.py)
+    path('async/api/publisher-articles/', async_views.publisher_articles_api,
+         name='async_publisher_articles_api'),
+    path('async/api/journalist-articles/', async_views.journalist_articles_api,
+         name='async_journalist_articles_api'),
+    path('async/api/newsletters/', async_views.newsletter_api, name='async_newsletter_api'),
+    path('async/api/articles/<int:article_id>/', async_views.article_detail_api,
+         name='async_article_detail_api'),
+    path('async/feeds/<str:fmt>/', async_views.feed_view, name='async_feed'),
+    path('async/feeds/publisher/<int:publisher_id>/<str:fmt>/', async_views.feed_view,
+         name='async_publisher_feed'),
+    path('async/feeds/journalist/<int:journalist_id>/<str:fmt>/', async_views.feed_view,
+         name='async_journalist_feed'),
 
     # OAuth callback
     path('twitter/callback/', views.twitter_callback_view, name='twitter_callback'),
@@ -6,17 +6,48 @@ publisher creation, directory browsing, and REST API endpoints.
 Role-based access is enforced for readers, journalists, and editors.
 """
 
+import hmac
+import json
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.shortcuts import render, redirect, get_object_or_404
+from django.template.loader import render_to_string
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth import login, logout
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib import messages
-from django.http import HttpResponse, HttpResponseForbidden
-from rest_framework import generics, permissions
-
+from django.http import Http404, HttpResponse, HttpResponseForbidden, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils import timezone
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .cache import cached_page, conditional, make_etag, response_cache_key, versioned_key
 from .models import Article, Publisher, CustomUser, Newsletter
+from .pagination import InvalidCursor, paginate_keyset
+from .search import search
+from .subscriptions import current_subscriptions, update_subscriptions
 from .forms import CustomUserCreationForm, NewsletterForm, PublisherForm
-from .serializers import ArticleSerializer, NewsletterSerializer
+from .export import aiter_export, iter_export, parse_since
+from .feeds import CONTENT_TYPES as FEED_CONTENT_TYPES, FORMATS as FEED_FORMATS, feed_key, get_feed
+from .ingest import import_articles
+from .metrics import render_metrics
+from .moderation import MODERATION_ACTIONS, moderate_articles
+from .routers import primary_reads
+from .review import (
+    CLAIM_ACTIONS, claim_articles, editable_articles, held_claims, release_claims, review_queue, unclaimed,
+)
+from .timeline import reader_feed
+from .serializers import (
+    ArticleListSerializer, ArticleSerializer, ModerationSerializer,
+    NewsletterListSerializer, NewsletterSerializer, SubscriptionSerializer,
+    requested_fields,
+)
 
 
 # ---------- Helper Role Checks ----------
@@ -106,13 +137,38 @@ def logout_view(request):
 
 # ---------- Dashboard ----------
 
+def _dashboard_articles(request):
+    """
+    Fetch one page of approved articles for the dashboard.
+
+    Parameters:
+        request (HttpRequest): Request carrying an optional ``cursor``.
+
+    Returns:
+        dict: ``articles`` for the page and the ``next_cursor``, if any.
+
+    Raises:
+        Http404: If the cursor is malformed.
+    """
+    articles = Article.objects.filter(approved=True).only('id', 'title', 'description', 'created_at')
+    try:
+        articles, next_cursor = paginate_keyset(
+            articles, request.GET.get('cursor'), settings.DASHBOARD_PAGE_SIZE
+        )
+    except InvalidCursor:
+        raise Http404("Invalid cursor")
+    return {'articles': articles, 'next_cursor': next_cursor}
+
+
 @login_required
 def dashboard_view(request):
     """
     Render dashboard view.
 
-    Readers and journalists see all approved articles and newsletters.
-    Editors see an empty view.
+    Readers and journalists see the newest page of approved articles;
+    further pages are loaded from ``dashboard_articles_view``, so the page
+    costs the same however large the archive grows. Editors see an empty
+    view.
 
     Parameters:
         request (HttpRequest): Current user request.
@@ -120,27 +176,77 @@ def dashboard_view(request):
     Returns:
         HttpResponse: Rendered dashboard page.
     """
-    show = request.user.role in ['reader', 'journalist']
-    articles = Article.objects.filter(approved=True) if show else []
-    newsletters = Newsletter.objects.all() if show else []
-    return render(request, 'news_room/dashboard.html', {
-        'articles': articles,
-        'newsletters': newsletters,
-    })
+    context = {}
+    if request.user.role in ['reader', 'journalist']:
+        context = _dashboard_articles(request)
+    return render(request, 'news_room/dashboard.html', context)
+
+
+@login_required
+def dashboard_articles_view(request):
+    """
+    Render the next page of dashboard articles as an HTML fragment.
+
+    Returns:
+        HttpResponse: Article cards followed by a "Load more" link when
+        more articles remain.
+    """
+    if request.user.role not in ['reader', 'journalist']:
+        return HttpResponseForbidden("Only readers and journalists have an article dashboard.")
+    return render(request, 'news_room/dashboard_articles.html', _dashboard_articles(request))
 
 
 # ---------- Article Views ----------
 
+def _subscription_context(user):
+    """
+    Collect the ids a reader follows for subscribe buttons in templates.
+
+    Parameters:
+        user (CustomUser): Current user.
+
+    Returns:
+        dict: ``subscribed_publisher_ids`` and ``subscribed_journalist_ids`` sets.
+    """
+    if user.role != 'reader':
+        return {'subscribed_publisher_ids': set(), 'subscribed_journalist_ids': set()}
+    return {
+        'subscribed_publisher_ids': set(user.subscribed_publishers.values_list('id', flat=True)),
+        'subscribed_journalist_ids': set(user.subscribed_journalists.values_list('id', flat=True)),
+    }
+
+
 @login_required
 def article_list_view(request):
     """
-    Display all approved articles.
+    Display one page of approved articles, newest first.
+
+    Pages follow keyset cursors like the dashboard. Each rendered page is
+    cached per user until an article or the user's subscriptions change,
+    and served with ``ETag``/``Last-Modified``.
 
     Returns:
         HttpResponse: Rendered article list.
+
+    Raises:
+        Http404: If the cursor is malformed.
     """
-    articles = Article.objects.filter(approved=True)
-    return render(request, 'news_room/article_list.html', {'articles': articles})
+    def build():
+        try:
+            articles, next_cursor = paginate_keyset(
+                Article.objects.filter(approved=True).select_related('author', 'publisher'),
+                request.GET.get('cursor'), settings.ARTICLE_LIST_PAGE_SIZE,
+            )
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        response = render(request, 'news_room/article_list.html', {
+            'articles': articles,
+            'next_cursor': next_cursor,
+            **_subscription_context(request.user),
+        })
+        return response, max((a.updated_at for a in articles), default=None)
+
+    return cached_page(request, ['articles', f'subscriptions:{request.user.pk}'], build)
 
 
 @login_required
@@ -148,17 +254,27 @@ def view_article_view(request, article_id):
     """
     Display details of a single article.
 
+    Cached and validated like ``article_list_view``.
+
     Parameters:
         article_id (int): ID of the article.
 
     Returns:
         HttpResponse: Rendered article view.
     """
-    if request.user.role == 'editor':
-        article = get_object_or_404(Article, id=article_id)
-    else:
-        article = get_object_or_404(Article, id=article_id, approved=True)
-    return render(request, 'news_room/view_article.html', {'article': article})
+    def build():
+        articles = Article.objects.select_related('author', 'publisher')
+        if request.user.role == 'editor':
+            article = get_object_or_404(articles, id=article_id)
+        else:
+            article = get_object_or_404(articles, id=article_id, approved=True)
+        response = render(request, 'news_room/view_article.html', {
+            'article': article,
+            **_subscription_context(request.user),
+        })
+        return response, article.updated_at
+
+    return cached_page(request, ['articles', f'subscriptions:{request.user.pk}'], build)
 
 
 @login_required
@@ -185,7 +301,7 @@ def create_article_view(request):
         request.user.published_articles.add(article)
         messages.success(request, 'Article submitted for approval.')
         return redirect('dashboard')
-    publishers = Publisher.objects.all()
+    publishers = Publisher.objects.values_list('id', 'name')
     return render(request, 'news_room/create_article.html', {'publishers': publishers})
 
 
@@ -210,8 +326,9 @@ def edit_article_view(request, article_id):
         article.needs_revision = False
         article.approved = False
         article.editor_feedback = ''
-        article.save()
-        request.user.published_articles.add(article)
+        with transaction.atomic():
+            article.save()
+            request.user.published_articles.add(article)
         messages.success(request, 'Article resubmitted for review.')
         return redirect('journalist_feedback')
     return render(request, 'news_room/edit_article.html', {'article': article})
@@ -223,15 +340,107 @@ def edit_article_view(request, article_id):
 @user_passes_test(is_editor)
 def review_articles_view(request):
     """
-    Display all articles needing approval or revision.
+    Display the editor's claimed articles and a page of their review queue.
+
+    Only articles of publishers the editor edits are listed, oldest first;
+    articles claimed by other editors are hidden until the claim expires.
 
     Returns:
         HttpResponse: Review articles view.
+
+    Raises:
+        Http404: If the cursor is malformed.
+    """
+    now = timezone.now()
+    fields = ('title', 'description', 'created_at', 'claimed_until', 'author__username', 'publisher__name')
+    claimed = list(held_claims(request.user, now).select_related('author', 'publisher').only(*fields)
+                   .order_by('created_at', 'id')[:settings.MODERATION_MAX_BATCH])
+    queue = review_queue(request.user).select_related('author', 'publisher').only(*fields)
+    try:
+        articles, next_cursor = paginate_keyset(
+            queue.filter(unclaimed(now)), request.GET.get('cursor'),
+            settings.REVIEW_PAGE_SIZE, oldest_first=True,
+        )
+    except InvalidCursor:
+        raise Http404("Invalid cursor")
+    return render(request, 'news_room/review_articles.html', {
+        'claimed': claimed, 'articles': articles, 'next_cursor': next_cursor,
+        'claim_batch': settings.REVIEW_CLAIM_BATCH,
+    })
+
+
+@login_required
+@user_passes_test(is_editor)
+def claim_articles_view(request):
+    """
+    Claim selected queue articles or the next batch, or release claims.
+
+    Returns:
+        HttpResponse: Redirect to review list.
+    """
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        article_ids = [int(pk) for pk in request.POST.getlist('article_ids') if pk.isdigit()]
+        if action == 'claim_next':
+            claimed = claim_articles(request.user)
+            messages.success(request, f'{len(claimed)} articles claimed.')
+        elif action not in CLAIM_ACTIONS or not article_ids:
+            messages.error(request, 'Select at least one article and an action.')
+        elif len(article_ids) > settings.MODERATION_MAX_BATCH:
+            messages.error(request, f'Select at most {settings.MODERATION_MAX_BATCH} articles at a time.')
+        elif action == 'claim':
+            claimed = claim_articles(request.user, article_ids)
+            messages.success(request, f'{len(claimed)} articles claimed.')
+            if len(claimed) < len(set(article_ids)):
+                messages.error(request, f'{len(set(article_ids)) - len(claimed)} articles are claimed by another editor.')
+        else:
+            released = release_claims(request.user, article_ids)
+            messages.success(request, f'{released} articles released.')
+    return redirect('review_articles')
+
+
+@login_required
+@user_passes_test(is_editor)
+def moderate_articles_view(request):
+    """
+    Approve or request revisions on every article selected in the review list.
+
+    All selected articles are transitioned with one UPDATE and their
+    subscribers receive a single digest (see ``news_room.moderation``).
+    Articles claimed by another editor are skipped.
+
+    Returns:
+        HttpResponse: Redirect to review list.
+    """
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        article_ids = [int(pk) for pk in request.POST.getlist('article_ids') if pk.isdigit()]
+        if action not in MODERATION_ACTIONS or not article_ids:
+            messages.error(request, 'Select at least one article and an action.')
+        elif len(article_ids) > settings.MODERATION_MAX_BATCH:
+            messages.error(request, f'Select at most {settings.MODERATION_MAX_BATCH} articles at a time.')
+        else:
+            result = moderate_articles(article_ids, action, request.POST.get('feedback', ''), editor=request.user)
+            verb = 'approved' if action == 'approve' else 'sent back for revision'
+            messages.success(request, f'{len(result.updated)} articles {verb}.')
+    return redirect('review_articles')
+
+
+def _claimed_article(request, article_id):
+    """
+    Fetch one of the editor's articles and claim it for them.
+
+    Returns:
+        Article | None: The article, or None if another editor holds it.
+
+    Raises:
+        Http404: If the article is not at one of the editor's publishers.
     """
-    pending = Article.objects.filter(approved=False)
-    flagged = Article.objects.filter(needs_revision=True)
-    articles = (pending | flagged).distinct()
-    return render(request, 'news_room/review_articles.html', {'articles': articles})
+    article = get_object_or_404(editable_articles(request.user), id=article_id)
+    if not claim_articles(request.user, [article.id]):
+        messages.error(request, f'"{article.title}" is claimed by another editor.')
+        return None
+    return article
 
 
 @login_required
@@ -246,11 +455,14 @@ def approve_article_view(request, article_id):
     Returns:
         HttpResponse: Redirect to review list.
     """
-    article = get_object_or_404(Article, id=article_id)
-    article.approved = True
-    article.needs_revision = False
-    article.editor_feedback = ''
-    article.save()
+    article = _claimed_article(request, article_id)
+    if article is not None:
+        article.approved = True
+        article.needs_revision = False
+        article.editor_feedback = ''
+        with transaction.atomic():
+            article.save()
+            release_claims(request.user, [article.id])
     return redirect('review_articles')
 
 
@@ -260,18 +472,24 @@ def request_revision_view(request, article_id):
     """
     Request revisions for an article with feedback.
 
+    The article stays claimed by the editor while the form is open.
+
     Parameters:
         article_id (int): ID of the article.
 
     Returns:
         HttpResponse: Feedback form or redirect.
     """
-    article = get_object_or_404(Article, id=article_id)
+    article = _claimed_article(request, article_id)
+    if article is None:
+        return redirect('review_articles')
     if request.method == 'POST':
         article.needs_revision = True
         article.approved = False
         article.editor_feedback = request.POST.get('feedback', '')
-        article.save()
+        with transaction.atomic():
+            article.save()
+            release_claims(request.user, [article.id])
         return redirect('review_articles')
     return render(request, 'news_room/request_revision.html', {'article': article})
 
@@ -302,13 +520,25 @@ def create_publisher_view(request):
 @user_passes_test(is_journalist)
 def journalist_feedback_view(request):
     """
-    Display all articles authored by the journalist.
+    Display one page of the journalist's articles, newest first.
 
     Returns:
         HttpResponse: Feedback dashboard.
+
+    Raises:
+        Http404: If the cursor is malformed.
     """
-    articles = Article.objects.filter(author=request.user)
-    return render(request, 'news_room/journalist_feedback.html', {'articles': articles})
+    try:
+        articles, next_cursor = paginate_keyset(
+            Article.objects.filter(author=request.user).select_related('publisher'),
+            request.GET.get('cursor'), settings.ARTICLE_LIST_PAGE_SIZE,
+        )
+    except InvalidCursor:
+        raise Http404("Invalid cursor")
+    return render(request, 'news_room/journalist_feedback.html', {
+        'articles': articles,
+        'next_cursor': next_cursor,
+    })
 
 
 # ---------- Newsletter Views ----------
@@ -316,13 +546,32 @@ def journalist_feedback_view(request):
 @login_required
 def newsletter_list_view(request):
     """
-    Display all published newsletters.
+    Display one page of published newsletters, newest first.
+
+    Each page is cached until a newsletter changes and served with
+    ``ETag``/``Last-Modified``.
 
     Returns:
         HttpResponse: Newsletter list view.
+
+    Raises:
+        Http404: If the cursor is malformed.
     """
-    newsletters = Newsletter.objects.all()
-    return render(request, 'news_room/newsletter_list.html', {'newsletters': newsletters})
+    def build():
+        try:
+            newsletters, next_cursor = paginate_keyset(
+                Newsletter.objects.select_related('author', 'publisher'),
+                request.GET.get('cursor'), settings.NEWSLETTER_LIST_PAGE_SIZE,
+            )
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        response = render(request, 'news_room/newsletter_list.html', {
+            'newsletters': newsletters,
+            'next_cursor': next_cursor,
+        })
+        return response, max((n.created_at for n in newsletters), default=None)
+
+    return cached_page(request, ['newsletters'], build)
 
 
 @login_required
@@ -369,14 +618,24 @@ def create_newsletter_view(request):
 @user_passes_test(is_journalist)
 def my_newsletters_view(request):
     """
-    Display newsletters authored by the current journalist.
+    Display one page of the current journalist's newsletters, newest first.
 
     Returns:
         HttpResponse: List of personal newsletters.
+
+    Raises:
+        Http404: If the cursor is malformed.
     """
-    newsletters = Newsletter.objects.filter(author=request.user)
+    try:
+        newsletters, next_cursor = paginate_keyset(
+            Newsletter.objects.filter(author=request.user),
+            request.GET.get('cursor'), settings.NEWSLETTER_LIST_PAGE_SIZE,
+        )
+    except InvalidCursor:
+        raise Http404("Invalid cursor")
     return render(request, 'news_room/my_newsletters.html', {
         'newsletters': newsletters,
+        'next_cursor': next_cursor,
     })
 
 
@@ -396,7 +655,6 @@ def subscribe_journalist_view(request, journalist_id):
     if request.method == 'POST' and request.user.role == 'reader':
         journalist = get_object_or_404(CustomUser, id=journalist_id, role='journalist')
         request.user.subscribed_journalists.add(journalist)
-        request.user.save()
     return redirect(request.META.get('HTTP_REFERER', 'article_list'))
 
 
@@ -414,7 +672,6 @@ def subscribe_publisher_view(request, publisher_id):
     if request.method == 'POST' and request.user.role == 'reader':
         publisher = get_object_or_404(Publisher, id=publisher_id)
         request.user.subscribed_publishers.add(publisher)
-        request.user.save()
     return redirect(request.META.get('HTTP_REFERER', 'article_list'))
 
 # ---------- Directory ----------
@@ -424,20 +681,231 @@ def directory_view(request):
     """
     Display a directory listing all journalists and publishers.
 
+    Counts are read from the counter columns kept by
+    ``news_room.counters``, both columns are paginated with ``?page=``
+    without counting the profiles, and the rendered listing is cached
+    until a subscription, article or publisher change bumps the
+    ``directory`` cache version.
+
     Returns:
         HttpResponse: Rendered directory page with grouped profiles.
     """
-    journalists = CustomUser.objects.filter(role='journalist')
-    publishers = Publisher.objects.all()
-    return render(request, 'news_room/directory.html', {
-        'journalists': journalists,
-        'publishers': publishers,
+    try:
+        page_number = max(1, int(request.GET.get('page', 1)))
+    except ValueError:
+        page_number = 1
+    key = versioned_key('directory', page_number)
+    listing = cache.get(key)
+    if listing is None:
+        with primary_reads():
+            journalists = CustomUser.objects.filter(role='journalist').only(
+                'id', 'username', 'article_count', 'subscriber_count'
+            ).order_by('username', 'id')
+            publishers = Publisher.objects.only(
+                'id', 'name', 'journalist_count', 'subscriber_count'
+            ).order_by('name', 'id')
+
+            # One extra row per column tells whether another page follows,
+            # without counting every profile.
+            size = settings.DIRECTORY_PAGE_SIZE
+            offset = (page_number - 1) * size
+            columns = [list(qs[offset:offset + size + 1]) for qs in (journalists, publishers)]
+            listing = render_to_string('news_room/directory_listing.html', {
+                'journalists': columns[0][:size],
+                'publishers': columns[1][:size],
+                'page_number': page_number,
+                'has_previous': page_number > 1,
+                'has_next': any(len(column) > size for column in columns),
+            })
+        cache.set(key, listing, settings.DIRECTORY_CACHE_TIMEOUT)
+    return render(request, 'news_room/directory.html', {'listing': listing})
+
+
+# ---------- Syndication Feeds ----------
+
+def feed_view(request, fmt, publisher_id=None, journalist_id=None):
+    """
+    Serve the global, publisher or journalist feed as RSS or Atom.
+
+    Documents are pre-rendered when articles are approved or withdrawn
+    (see ``news_room.feeds``), so a poll costs a cache lookup, and
+    ``If-None-Match``/``If-Modified-Since`` polls get 304 Not Modified.
+
+    Parameters:
+        fmt (str): ``'rss'`` or ``'atom'``.
+        publisher_id (int): Publisher whose feed to serve.
+        journalist_id (int): Journalist whose feed to serve.
+
+    Returns:
+        HttpResponse: Feed document or 304 Not Modified.
+    """
+    if fmt not in FEED_FORMATS:
+        raise Http404("Unknown feed format.")
+    entry = get_feed(feed_key(publisher_id, journalist_id), fmt)
+    if entry is None:
+        raise Http404("No such feed.")
+    response = HttpResponse(entry['content'], content_type=FEED_CONTENT_TYPES[fmt])
+    return conditional(request, response, entry['etag'], entry['last_modified'],
+                       max_age=settings.FEED_MAX_AGE)
+
+
+# ---------- Metrics ----------
+
+def metrics_view(request):
+    """
+    Expose request metrics in the Prometheus text format.
+
+    Readable by staff users, and by scrapers presenting
+    ``Authorization: Bearer <METRICS_TOKEN>`` when a token is configured.
+
+    Returns:
+        HttpResponse: Metrics of the process that served the request.
+    """
+    token = settings.METRICS_TOKEN
+    presented = request.headers.get('Authorization', '')
+    authorized = request.user.is_staff or (
+        token and hmac.compare_digest(presented.encode(), f'Bearer {token}'.encode())
+    )
+    if not authorized:
+        return HttpResponseForbidden("Metrics are restricted.")
+    response = HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+# ---------- Search ----------
+
+@login_required
+def search_view(request):
+    """
+    Search approved articles and newsletters by title, description and body.
+
+    Results come from the full-text index (see ``news_room.search``),
+    ranked by relevance and paginated with ``?page=`` up to
+    ``SEARCH_MAX_PAGE``, so a request cannot force an arbitrarily deep
+    OFFSET.
+
+    Returns:
+        HttpResponse: Search form with the requested page of results.
+    """
+    query = request.GET.get('q', '').strip()
+    kind = request.GET.get('kind')
+    if kind not in ('article', 'newsletter'):
+        kind = ''
+    try:
+        page_number = min(max(1, int(request.GET.get('page', 1))), settings.SEARCH_MAX_PAGE)
+    except ValueError:
+        page_number = 1
+    results, has_next = search(query, kind=kind or None, page=page_number,
+                               page_size=settings.SEARCH_PAGE_SIZE)
+    has_next = has_next and page_number < settings.SEARCH_MAX_PAGE
+    return render(request, 'news_room/search.html', {
+        'query': query,
+        'kind': kind,
+        'results': results,
+        'page_number': page_number,
+        'has_previous': page_number > 1,
+        'has_next': has_next,
     })
 
 
 # ---------- REST API Views ----------
 
-class PublisherArticlesAPIView(generics.ListAPIView):
+class LeanListMixin:
+    """
+    Shared list behaviour for the content API views.
+
+    - Related publisher and author rows are joined in the same query.
+    - ``?compact=true`` switches to the list serializer without ``content``.
+    - ``content`` is not loaded from the database unless it will be returned.
+
+    Attributes:
+        compact_serializer_class (Serializer): Serializer used in compact mode.
+    """
+    compact_serializer_class = None
+
+    def is_compact(self):
+        """
+        Returns:
+            bool: True if the client asked for the compact representation.
+        """
+        return self.request.query_params.get('compact', '').lower() in ('1', 'true', 'yes')
+
+    def get_serializer_class(self):
+        """
+        Returns:
+            Serializer: Compact or full serializer class.
+        """
+        if self.is_compact():
+            return self.compact_serializer_class
+        return self.serializer_class
+
+    def optimize_queryset(self, queryset):
+        """
+        Join related rows and defer ``content`` when it is not returned.
+
+        Parameters:
+            queryset (QuerySet): Article or Newsletter queryset.
+
+        Returns:
+            QuerySet: Queryset with ``select_related`` and ``defer`` applied.
+        """
+        queryset = queryset.select_related('publisher', 'author')
+        fields = requested_fields(self.request)
+        if self.is_compact() or (fields is not None and 'content' not in fields):
+            queryset = queryset.defer('content')
+        return queryset
+
+
+class CachedListMixin:
+    """
+    Cache list responses by content version and answer repeat requests with 304.
+
+    The serialized page is cached under the versions of ``cache_namespaces``
+    (plus the user's subscription version when ``per_subscriber`` is set),
+    keyed by the full path so cursors and field options stay distinct.
+
+    Attributes:
+        cache_namespaces (list): Content namespaces the response depends on.
+        per_subscriber (bool): Whether results depend on the user's subscriptions.
+        last_modified_field (str): Field used for the ``Last-Modified`` header.
+    """
+    cache_namespaces = []
+    per_subscriber = False
+    last_modified_field = 'created_at'
+
+    def paginate_queryset(self, queryset):
+        """
+        Keep the current page so its timestamps can drive ``Last-Modified``.
+        """
+        self._page = super().paginate_queryset(queryset)
+        return self._page
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns:
+            Response: Cached or fresh page, or 304 Not Modified.
+        """
+        namespaces = list(self.cache_namespaces)
+        if self.per_subscriber:
+            namespaces.append(f'subscriptions:{request.user.pk}')
+        key = response_cache_key(request, namespaces, per_user=self.per_subscriber)
+        entry = cache.get(key)
+        if entry is None:
+            with primary_reads():
+                response = super().list(request, *args, **kwargs)
+            latest = max((getattr(item, self.last_modified_field) for item in self._page or []),
+                         default=None)
+            entry = {
+                'data': response.data,
+                'etag': make_etag(json.dumps(response.data, cls=DjangoJSONEncoder).encode()),
+                'last_modified': int(latest.timestamp()) if latest else None,
+            }
+            cache.set(key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+        return conditional(request, Response(entry['data']), entry['etag'], entry['last_modified'])
+
+
+class PublisherArticlesAPIView(CachedListMixin, LeanListMixin, generics.ListAPIView):
     """
     API view returning articles from publishers the reader is subscribed to.
 
@@ -448,7 +916,11 @@ class PublisherArticlesAPIView(generics.ListAPIView):
         permission_classes (list): [IsAuthenticated]
     """
     serializer_class = ArticleSerializer
+    compact_serializer_class = ArticleListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    cache_namespaces = ['articles']
+    per_subscriber = True
+    last_modified_field = 'updated_at'
 
     def get_queryset(self):
         """
@@ -457,13 +929,20 @@ class PublisherArticlesAPIView(generics.ListAPIView):
         Returns:
             QuerySet: Filtered approved Article instances.
         """
-        return Article.objects.filter(
+        return self.optimize_queryset(Article.objects.filter(
             approved=True,
             publisher__in=self.request.user.subscribed_publishers.all()
-        )
+        ))
+
+    def get_keyset_sources(self):
+        """
+        Returns:
+            list[tuple[QuerySet, str]]: Followed publishers, bounding each page.
+        """
+        return [(self.request.user.subscribed_publishers.all(), 'publisher')]
 
 
-class JournalistArticlesAPIView(generics.ListAPIView):
+class JournalistArticlesAPIView(CachedListMixin, LeanListMixin, generics.ListAPIView):
     """
     API view returning articles from journalists the reader is subscribed to.
 
@@ -472,7 +951,11 @@ class JournalistArticlesAPIView(generics.ListAPIView):
         permission_classes (list): [IsAuthenticated]
     """
     serializer_class = ArticleSerializer
+    compact_serializer_class = ArticleListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    cache_namespaces = ['articles']
+    per_subscriber = True
+    last_modified_field = 'updated_at'
 
     def get_queryset(self):
         """
@@ -481,24 +964,280 @@ class JournalistArticlesAPIView(generics.ListAPIView):
         Returns:
             QuerySet: Filtered approved Article instances.
         """
-        return Article.objects.filter(
+        return self.optimize_queryset(Article.objects.filter(
             approved=True,
             author__in=self.request.user.subscribed_journalists.all()
-        )
+        ))
+
+    def get_keyset_sources(self):
+        """
+        Returns:
+            list[tuple[QuerySet, str]]: Followed journalists, bounding each page.
+        """
+        return [(self.request.user.subscribed_journalists.all(), 'author')]
 
 
-class NewsletterListAPIView(generics.ListAPIView):
+class NewsletterListAPIView(CachedListMixin, LeanListMixin, generics.ListAPIView):
     """
     API view returning all newsletters visible to authenticated users.
 
+    Results are paginated newest first with keyset cursors, like the
+    other list endpoints (see ``news_room.pagination``).
+
     Attributes:
         serializer_class (Serializer): NewsletterSerializer
         permission_classes (list): [IsAuthenticated]
-        queryset (QuerySet): All Newsletter objects
     """
     serializer_class = NewsletterSerializer
+    compact_serializer_class = NewsletterListSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    cache_namespaces = ['newsletters']
+
+    def get_queryset(self):
+        """
+        Query all newsletters with their publisher and author.
+
+        Returns:
+            QuerySet: Newsletter instances.
+        """
+        return self.optimize_queryset(Newsletter.objects.all())
+
+
+class FeedAPIView(LeanListMixin, generics.ListAPIView):
+    """
+    API view returning one merged feed of everything the reader follows.
+
+    Reads the reader's precomputed timeline, merging in large sources at
+    read time (see ``news_room.timeline``). Supports the same pagination,
+    ``?compact=`` and ``?fields=`` options as the other article endpoints.
+
+    Attributes:
+        serializer_class (Serializer): ArticleSerializer
+        permission_classes (list): [IsAuthenticated]
+    """
+    serializer_class = ArticleSerializer
+    compact_serializer_class = ArticleListSerializer
     permission_classes = [permissions.IsAuthenticated]
-    queryset = Newsletter.objects.all()
+    keyset_fields = ('created_at', 'id')
+    keyset_sources = None
+
+    def get_queryset(self):
+        """
+        Query the reader's timeline and set the matching keyset fields and sources.
+
+        Returns:
+            QuerySet: TimelineEntry or Article instances.
+        """
+        queryset, self.keyset_fields, self.keyset_sources = reader_feed(self.request.user)
+        if queryset.model is Article:
+            return self.optimize_queryset(queryset)
+        fields = requested_fields(self.request)
+        if self.is_compact() or (fields is not None and 'content' not in fields):
+            queryset = queryset.defer('article__content')
+        return queryset
+
+    def get_keyset_sources(self):
+        """
+        Returns:
+            list[tuple[QuerySet, str]] | None: Timeline and large sources
+            merged into the page, set by ``get_queryset()``.
+        """
+        return self.keyset_sources
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serialize one page of feed articles.
+
+        Returns:
+            Response: Paginated article data.
+        """
+        page = self.paginate_queryset(self.get_queryset())
+        articles = [getattr(item, 'article', item) for item in page]
+        serializer = self.get_serializer(articles, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class ArticleDetailAPIView(generics.RetrieveAPIView):
+    """
+    API view returning one approved article.
+
+    Attributes:
+        serializer_class (Serializer): ArticleSerializer
+        permission_classes (list): [IsAuthenticated]
+    """
+    serializer_class = ArticleSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    queryset = Article.objects.filter(approved=True).select_related('publisher', 'author')
+    lookup_url_kwarg = 'article_id'
+
+
+class ArticleImportAPIView(APIView):
+    """
+    API view bulk-importing articles from an NDJSON request body.
+
+    The body is streamed line by line into ``news_room.ingest``, so large
+    feeds are never held in memory. Journalists import as themselves;
+    editors must name a journalist on every line.
+
+    Attributes:
+        permission_classes (list): [IsAuthenticated]
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Import the posted articles for editor review.
+
+        Returns:
+            Response: ``created`` count, the first ``rejected`` lines and
+            ``rejected_count`` with throughput; 201 if any article was
+            created, otherwise 400.
+        """
+        if request.user.role not in ('journalist', 'editor'):
+            self.permission_denied(request, message="Only journalists and editors can import articles.")
+        author = request.user if request.user.role == 'journalist' else None
+        summary = import_articles(request.stream or [], settings.IMPORT_BATCH_SIZE, author,
+                                  settings.IMPORT_MAX_REJECTIONS)
+        return Response({
+            'created': summary.created,
+            'rejected': summary.rejected,
+            'rejected_count': summary.rejected_count,
+            'seconds': round(summary.seconds, 3),
+            'articles_per_second': round(summary.created / summary.seconds) if summary.seconds else 0,
+        }, status=status.HTTP_201_CREATED if summary.created else status.HTTP_400_BAD_REQUEST)
+
+
+class ArticleExportAPIView(APIView):
+    """
+    API view streaming the approved article archive as NDJSON.
+
+    Meant for syndication partners: ``?since=`` takes an ISO date or
+    datetime and ``?publisher=<id>`` may be repeated. Clients that send
+    ``Accept-Encoding: gzip`` receive a gzip-compressed stream. Rows are
+    encoded as they are read (see ``news_room.export``), so the response
+    starts immediately and memory use does not grow with the archive.
+    When ``ASGI_SERVER`` is set the body is an async iterator, which
+    Django streams block by block instead of collecting it first.
+
+    Attributes:
+        permission_classes (list): [IsAuthenticated]
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns:
+            StreamingHttpResponse: One article per line, oldest first, or
+            a 400 response for malformed filters.
+        """
+        try:
+            since = parse_since(request.query_params['since']) if request.query_params.get('since') else None
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            publisher_ids = [int(pk) for pk in request.query_params.getlist('publisher')]
+        except ValueError:
+            return Response({'detail': "publisher must be an integer id."}, status=status.HTTP_400_BAD_REQUEST)
+
+        compress = bool(re.search(r'\bgzip\b', request.META.get('HTTP_ACCEPT_ENCODING', '')))
+        stream = aiter_export if settings.ASGI_SERVER else iter_export
+        response = StreamingHttpResponse(
+            stream(since, publisher_ids, compress, chunk_size=settings.EXPORT_CHUNK_SIZE),
+            content_type='application/x-ndjson',
+        )
+        response['Content-Disposition'] = 'attachment; filename="articles.ndjson"'
+        if compress:
+            response['Content-Encoding'] = 'gzip'
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
+
+
+class ArticleModerationAPIView(APIView):
+    """
+    API view approving or requesting revision on many articles at once.
+
+    Accepts ``{"article_ids": [...], "action": "approve" | "revise",
+    "feedback": "..."}`` from editors. Articles outside the editor's
+    publishers or claimed by another editor are skipped.
+
+    Attributes:
+        permission_classes (list): [IsAuthenticated]
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Apply the moderation action.
+
+        Returns:
+            Response: Ids of the updated, newly approved and withdrawn articles.
+        """
+        if request.user.role != 'editor':
+            self.permission_denied(request, message="Only editors can moderate articles.")
+        serializer = ModerationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = moderate_articles(**serializer.validated_data, editor=request.user)
+        return Response(result._asdict())
+
+
+class SubscriptionAPIView(APIView):
+    """
+    API view reading and changing a reader's subscriptions in bulk.
+
+    Bodies look like ``{"publishers": [...], "journalists": [...]}``;
+    either list may be omitted to leave that relation alone. ``PUT``
+    replaces the subscriptions, ``POST`` adds to them and ``DELETE``
+    removes the given ids.
+
+    Attributes:
+        permission_classes (list): [IsAuthenticated]
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.user.role != 'reader':
+            self.permission_denied(request, message="Only readers have subscriptions.")
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns:
+            Response: Followed publisher and journalist ids.
+        """
+        current = current_subscriptions(request.user)
+        return Response({relation: sorted(ids) for relation, ids in current.items()})
+
+    def _change(self, request, mode):
+        serializer = SubscriptionSerializer(data=request.data, context={'mode': mode})
+        serializer.is_valid(raise_exception=True)
+        return Response(update_subscriptions(request.user, mode, **serializer.validated_data))
+
+    def put(self, request, *args, **kwargs):
+        """
+        Replace the subscriptions of each given relation.
+
+        Returns:
+            Response: ``added`` and ``removed`` ids per relation.
+        """
+        return self._change(request, 'set')
+
+    def post(self, request, *args, **kwargs):
+        """
+        Follow the given sources.
+
+        Returns:
+            Response: ``added`` and ``removed`` ids per relation.
+        """
+        return self._change(request, 'add')
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Unfollow the given sources.
+
+        Returns:
+            Response: ``added`` and ``removed`` ids per relation.
+        """
+        return self._change(request, 'remove')
 
 
 # ---------- OAuth Callback View ----------
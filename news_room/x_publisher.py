@@ -0,0 +1,262 @@
+"""
+Pooled, rate-limit aware client for publishing posts to X.
+
+One ``XPublisher`` per process keeps a single OAuth1 session whose
+connection pool is shared by every outbox worker thread, so posts reuse
+open connections instead of starting a new session per approval.
+
+The publisher follows X's ``x-rate-limit-*`` response headers: once the
+window is used up, or X answers 429, it stops calling the API until the
+window resets and raises ``XRateLimited`` so the caller can reschedule.
+Server errors and connections that could not be opened are retried with
+jittered exponential backoff; other client errors raise ``XRejected``.
+A request that was sent but never answered is not retried, since X may
+have published it: it raises ``XOutcomeUnknown`` instead of risking a
+duplicate post. So does a 502 or 504, which X's edge can return after
+the post was already created behind it, and a success response whose
+body carries no post id.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from requests_oauthlib import OAuth1Session
+from urllib3.exceptions import NewConnectionError
+
+
+class XRateLimited(Exception):
+    """
+    Raised when the rate limit window is exhausted.
+
+    Attributes:
+        reset_at (float): Unix time at which posting may resume.
+    """
+    def __init__(self, reset_at):
+        resumes = datetime.fromtimestamp(reset_at, timezone.utc)
+        super().__init__(f"X rate limit reached, resuming at {resumes:%Y-%m-%d %H:%M:%S} UTC")
+        self.reset_at = reset_at
+
+
+class XRejected(Exception):
+    """
+    Raised when X refuses a post for a reason retrying cannot fix.
+    """
+
+
+class XOutcomeUnknown(Exception):
+    """
+    Raised when a post was sent but no response arrived, only a gateway
+    error, or a success without a post id, so X may or may not have
+    published it.
+    """
+
+
+# Gateway errors: the request reached X's edge, which gave up waiting on
+# a backend that may still have created the post.
+OUTCOME_UNKNOWN_STATUSES = (502, 504)
+
+
+def _not_sent(error):
+    """
+    Returns:
+        bool: Whether a connection error happened before the request left,
+        so retrying it cannot publish the post twice.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _header_number(headers, name):
+    """
+    Returns:
+        float | None: A numeric header value, or None if absent or malformed.
+    """
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+class XPublisher:
+    """
+    Thread-safe X client sharing one pooled session.
+
+    Parameters:
+        credentials (tuple[str, str, str, str]): API key and secret, access
+            token and access token secret.
+        url (str): Endpoint that creates posts.
+        pool_size (int): Connections kept open to the endpoint.
+        timeout (float): Seconds to wait for a response.
+        max_retries (int): Retries after a server error or failed connect.
+        base_delay (float): Backoff before the first retry, in seconds.
+        max_delay (float): Upper bound for any single backoff.
+        default_window (float): Pause after a 429 without reset headers.
+    """
+    def __init__(self, credentials, url, pool_size=10, timeout=10, max_retries=3,
+                 base_delay=1.0, max_delay=30.0, default_window=900):
+        self.credentials = credentials
+        self.url = url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.default_window = default_window
+
+        self.session = OAuth1Session(*credentials)
+        # Workers block for a free connection rather than opening extras.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def paused_until(self):
+        """
+        Returns:
+            float | None: Unix time the current rate limit pause ends, if any.
+        """
+        with self._lock:
+            paused_until = self._paused_until
+        return paused_until if paused_until > time.time() else None
+
+    def _pause(self, reset_at):
+        with self._lock:
+            self._paused_until = max(self._paused_until, reset_at)
+
+    def _observe_rate_limit(self, response):
+        """
+        Record the rate limit state reported by a response.
+
+        Raises:
+            XRateLimited: If the response is a 429.
+        """
+        reset_at = _header_number(response.headers, 'x-rate-limit-reset')
+        if response.status_code == 429:
+            if reset_at is None:
+                retry_after = _header_number(response.headers, 'retry-after')
+                reset_at = time.time() + (self.default_window if retry_after is None else retry_after)
+            self._pause(reset_at)
+            raise XRateLimited(reset_at)
+        if _header_number(response.headers, 'x-rate-limit-remaining') == 0 and reset_at is not None:
+            self._pause(reset_at)
+
+    def backoff(self, retry):
+        """
+        Compute the pause before a retry.
+
+        Parameters:
+            retry (int): Number of retries already made (0 or more).
+
+        Returns:
+            float: A random delay up to the exponential cap ("full jitter"),
+            so concurrent workers do not retry in lockstep.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    def post(self, text):
+        """
+        Publish a post.
+
+        Parameters:
+            text (str): Post body.
+
+        Returns:
+            str: Id X assigned to the new post.
+
+        Raises:
+            XRateLimited: If posting is paused or X answered 429.
+            XRejected: If X refused the post with another 4xx status.
+            XOutcomeUnknown: If the request was sent but timed out, lost
+                its connection before a response arrived, got a 502/504,
+                or got a success response without a post id.
+            requests.RequestException: If every retry failed.
+        """
+        for retry in range(self.max_retries + 1):
+            paused_until = self.paused_until()
+            if paused_until:
+                raise XRateLimited(paused_until)
+            try:
+                response = self.session.post(self.url, json={'text': text}, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not _not_sent(e):
+                    raise XOutcomeUnknown(f"X did not answer, the post may have been published: {e}") from e
+                error = e
+            else:
+                self._observe_rate_limit(response)
+                if response.status_code < 400:
+                    try:
+                        return str(response.json()['data']['id'])
+                    except (ValueError, KeyError, TypeError) as e:
+                        raise XOutcomeUnknown(
+                            f"X returned {response.status_code} without a post id, "
+                            f"the post may have been published: {response.text[:200]}"
+                        ) from e
+                if response.status_code < 500:
+                    raise XRejected(f"X rejected the post ({response.status_code}): {response.text[:200]}")
+                if response.status_code in OUTCOME_UNKNOWN_STATUSES:
+                    raise XOutcomeUnknown(
+                        f"X returned {response.status_code}, the post may have been published"
+                    )
+                error = requests.HTTPError(f"X returned {response.status_code}", response=response)
+            if retry < self.max_retries:
+                time.sleep(self.backoff(retry))
+        raise error
+
+    def close(self):
+        """
+        Close the pooled connections.
+        """
+        self.session.close()
+
+
+_publisher = None
+_publisher_lock = threading.Lock()
+
+
+def get_publisher():
+    """
+    Return the process-wide publisher, rebuilding it if settings changed.
+
+    Returns:
+        XPublisher: Publisher configured from the ``X_*`` settings.
+    """
+    global _publisher
+    credentials = (
+        settings.X_API_KEY,
+        settings.X_API_SECRET,
+        settings.X_ACCESS_TOKEN,
+        settings.X_ACCESS_TOKEN_SECRET,
+    )
+    with _publisher_lock:
+        if _publisher is None or (_publisher.credentials, _publisher.url) != (credentials, settings.X_API_URL):
+            if _publisher is not None:
+                _publisher.close()
+            _publisher = XPublisher(
+                credentials, settings.X_API_URL,
+                pool_size=settings.X_POOL_SIZE,
+                timeout=settings.X_TIMEOUT,
+                max_retries=settings.X_MAX_RETRIES,
+                base_delay=settings.X_RETRY_BASE_DELAY,
+                max_delay=settings.X_RETRY_MAX_DELAY,
+                default_window=settings.X_RATE_LIMIT_WINDOW,
+            )
+        return _publisher
+
+
+def reset_publisher():
+    """
+    Discard the process-wide publisher and any rate limit pause it holds.
+    """
+    global _publisher
+    with _publisher_lock:
+        if _publisher is not None:
+            _publisher.close()
+        _publisher = None
@@ -2,6 +2,15 @@
 ASGI config for newsroom project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+This is the production entry point; run it with an ASGI server, e.g.::
+
+    uvicorn newsroom.asgi:application --host 0.0.0.0 --port 8000 --workers 4
+
+Async views (``news_room.async_views``, mounted under ``async/``) then
+run on each worker's event loop, while synchronous views run in Django's
+thread pool. ``ASGI_SERVER`` is switched on here, so streaming responses
+are built from async iterators. With ``DEBUG`` on, static files are
+served as ``runserver`` would.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -9,8 +18,15 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'newsroom.settings')
+os.environ.setdefault('ASGI_SERVER', 'True')
 
 application = get_asgi_application()
+
+if settings.DEBUG:
+    from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
+
+    application = ASGIStaticFilesHandler(application)
@@ -45,7 +45,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'news_room.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'news_room.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -58,7 +60,8 @@ ROOT_URLCONF = 'newsroom.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # Django templates, timed per request (see news_room/metrics.py)
+        'BACKEND': 'news_room.metrics.InstrumentedTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -105,6 +108,37 @@ else:
             'NAME': BASE_DIR / 'db.sqlite3',
         }
     }
+
+# Read replicas (see news_room/routers.py)
+# DB_REPLICA_HOSTS lists comma-separated replicas of the primary; reads of
+# GET requests go to them. Tests run them as mirrors of the primary.
+DATABASE_REPLICAS = []
+for number, host in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    DATABASES[f'replica{number}'] = {
+        **DATABASES['default'], 'HOST': host.strip(), 'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{number}')
+DATABASE_ROUTERS = ['news_room.routers.ReplicaRouter']
+REPLICA_STICKY_SECONDS = 10  # reads stay on the primary this long after a write
+REPLICA_STICKY_COOKIE = 'primary_until'
+REPLICA_RETRY_SECONDS = 30  # an unreachable replica is skipped this long
+
+# Cache
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# backend (file, Redis, Memcached) when running several processes.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'newsroom'),
+    }
+}
+
+# Lifetime of cached pages and API responses; entries are also orphaned
+# as soon as the content they show changes (see news_room/cache.py).
+RESPONSE_CACHE_TIMEOUT = 600  # seconds
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -140,22 +174,101 @@ USE_TZ = True
 
 # Email backend
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_BACKEND = os.environ.get(
+    'EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend'
+)
 EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_PORT = 587
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
 EMAIL_USE_TLS = True
 
+# Subscriber notifications (see news_room/delivery.py)
+# 1 sends an individual message per reader; larger values BCC small groups.
+EMAIL_CHUNK_SIZE = int(os.environ.get('EMAIL_CHUNK_SIZE', 1))
+# Maximum messages per second over one SMTP session, 0 for unlimited.
+EMAIL_RATE_LIMIT = float(os.environ.get('EMAIL_RATE_LIMIT', 0))
+# Resolve recipients from the materialized SubscriberIndex table.
+# Run `manage.py rebuild_subscriber_index` after turning this on.
+SUBSCRIBER_INDEX_ENABLED = os.environ.get('SUBSCRIBER_INDEX_ENABLED', 'False') == 'True'
+
 
 # Token validation
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.TokenAuthentication',
-    ]
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'news_room.pagination.KeysetPagination',
+    'PAGE_SIZE': int(os.environ.get('API_PAGE_SIZE', 20)),
 }
 
+# Hard upper bound for ?page_size= on paginated endpoints
+API_MAX_PAGE_SIZE = 100
+
+# Articles per dashboard page (see dashboard_view)
+DASHBOARD_PAGE_SIZE = 20
+
+# Articles per page of the published article list and of a journalist's
+# feedback page (see article_list_view, journalist_feedback_view)
+ARTICLE_LIST_PAGE_SIZE = 20
+
+# Newsletters per page (see newsletter_list_view, my_newsletters_view)
+NEWSLETTER_LIST_PAGE_SIZE = 20
+
+# Most articles one bulk moderation request may change
+MODERATION_MAX_BATCH = 1000
+
+# Editor review queue (see news_room.review): articles per page, articles
+# taken by "claim next" and seconds before an untouched claim expires
+REVIEW_PAGE_SIZE = 20
+REVIEW_CLAIM_BATCH = 10
+REVIEW_CLAIM_SECONDS = 15 * 60
+
+# Most sources one bulk subscription request may name per relation
+SUBSCRIPTION_MAX_BATCH = 1000
+
+# Lines validated and inserted together by the bulk article import API
+IMPORT_BATCH_SIZE = 1000
+
+# Rejected lines an article import reports individually; the rest are counted
+IMPORT_MAX_REJECTIONS = 100
+
+# Rows fetched per round trip by the streaming article export
+EXPORT_CHUNK_SIZE = 2000
+# Set by newsroom/asgi.py. Streaming responses then use async iterators,
+# which ASGI servers send block by block instead of collecting them.
+ASGI_SERVER = os.environ.get('ASGI_SERVER', 'False') == 'True'
+
+# Syndication feeds (see news_room/feeds.py)
+FEED_ITEMS = 50  # newest approved articles per feed
+FEED_MAX_AGE = 60  # seconds clients and proxies may reuse a feed unchecked
+FEED_CACHE_TIMEOUT = 86400  # seconds; entries are replaced on every render
+
+# Request metrics (see news_room/metrics.py)
+# A statement run this often in one request is flagged as a suspected N+1.
+METRICS_REPEATED_QUERY_THRESHOLD = 5
+# Bearer token Prometheus sends to /metrics/; staff users can always read it.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Results per search page and deepest page served (see search_view)
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE = 50
+
+# Directory listing (see directory_view)
+DIRECTORY_PAGE_SIZE = 50
+DIRECTORY_CACHE_TIMEOUT = 300  # seconds
+
+# Lifetime of cached role group ids (see news_room.models.role_group_id)
+ROLE_GROUP_CACHE_TIMEOUT = 300  # seconds
+
+# Reader timelines (see news_room/timeline.py)
+# Sources with more subscribers than this are merged at read time.
+TIMELINE_FANOUT_LIMIT = int(os.environ.get('TIMELINE_FANOUT_LIMIT', 10000))
+# Recent articles copied into a timeline when a reader subscribes.
+TIMELINE_BACKFILL = 50
+TIMELINE_LARGE_SOURCES_TTL = 300  # seconds
+
 X_BEARER_TOKEN = os.environ.get('X_BEARER_TOKEN') 
 X_API_KEY = os.environ.get('X_API_KEY')
 X_API_SECRET = os.environ.get('X_API_SECRET')
@@ -164,6 +277,29 @@ X_API_SECRET = os.environ.get('X_API_SECRET')
 X_ACCESS_TOKEN = os.environ.get('X_ACCESS_TOKEN')
 X_ACCESS_TOKEN_SECRET = os.environ.get('X_ACCESS_TOKEN_SECRET')
 
+# Endpoint used to publish posts; point at a local stub when testing
+X_API_URL = os.environ.get('X_API_URL', 'https://api.twitter.com/2/tweets')
+
+# X publisher (see news_room/x_publisher.py)
+X_POOL_SIZE = 10  # pooled connections, at least the worker concurrency
+X_TIMEOUT = 10  # seconds
+X_MAX_RETRIES = 3  # retries after 5xx responses or failed connects
+X_RETRY_BASE_DELAY = 1  # seconds, doubled on each retry, fully jittered
+X_RETRY_MAX_DELAY = 30  # seconds
+X_RATE_LIMIT_WINDOW = 900  # seconds paused after a 429 without reset headers
+
+# Public base URL used in outgoing links (emails, posts)
+SITE_URL = os.environ.get('SITE_URL', 'http://127.0.0.1:8000')
+
+# Transactional outbox (see news_room/outbox.py)
+# Set OUTBOX_EAGER=True to process each transaction's entries on commit when
+# no worker is running.
+OUTBOX_EAGER = os.environ.get('OUTBOX_EAGER', 'False') == 'True'
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', 5))
+OUTBOX_BASE_BACKOFF = 30  # seconds, doubled on each retry
+OUTBOX_MAX_BACKOFF = 3600  # seconds
+OUTBOX_LEASE_SECONDS = 300
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 